@@ -0,0 +1,169 @@
+"""
+Compare REST and gRPC transports against a docker/remote Qdrant.
+
+Upserts synthetic knowledge chunks (same payload shape as the server writes)
+into a scratch collection, then runs concurrent filtered, grouped searches,
+and reports latency percentiles and throughput for each transport.
+
+Usage (from src/backend, with the server's dependencies installed):
+
+    python ../../scripts/bench_qdrant_transport.py --url http://localhost:6333
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timezone
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark Qdrant REST vs gRPC transport.")
+    parser.add_argument(
+        "--url",
+        default=os.getenv("QDRANT_URL", "http://localhost:6333"),
+        help="Qdrant REST URL",
+    )
+    parser.add_argument("--grpc-port", type=int, default=6334, help="Qdrant gRPC port (default: 6334)")
+    parser.add_argument("--points", type=int, default=20000, help="Chunks to upsert (default: 20000)")
+    parser.add_argument("--dim", type=int, default=1536, help="Vector dimension (default: 1536)")
+    parser.add_argument("--batch-size", type=int, default=256, help="Points per upsert (default: 256)")
+    parser.add_argument("--users", type=int, default=20, help="Distinct owners (default: 20)")
+    parser.add_argument("--queries", type=int, default=1000, help="Searches to run (default: 1000)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent searches (default: 16)")
+    parser.add_argument("--limit", type=int, default=5, help="Results per search (default: 5)")
+    parser.add_argument(
+        "--transport",
+        choices=["rest", "grpc", "both"],
+        default="both",
+        help="Transport(s) to benchmark (default: both)",
+    )
+    return parser.parse_args()
+
+
+args = _parse_args()
+
+# Settings are read at import time, so point them at the target server first.
+os.environ["QDRANT_MODE"] = "docker"
+os.environ["QDRANT_URL"] = args.url
+os.environ["QDRANT_GRPC_PORT"] = str(args.grpc_port)
+
+import numpy as np  # noqa: E402
+
+from hippobox.models.knowledge import KnowledgeModel  # noqa: E402
+from hippobox.rag.chunking import chunk_point_id  # noqa: E402
+from hippobox.rag.qdrant import Qdrant  # noqa: E402
+from hippobox.rag.sparse import encode_document  # noqa: E402
+from hippobox.services.knowledge import KnowledgeService  # noqa: E402
+
+WORDS = "docker compose fastapi qdrant redis postgres vector index embedding cache async grpc rest".split()
+
+
+def _vectors(count: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    vectors = rng.standard_normal((count, dim), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _items(count: int, dim: int, users: int, seed: int = 7) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    vectors = _vectors(count, dim, rng)
+    now = datetime.now(timezone.utc)
+
+    items = []
+    for i in range(count):
+        knowledge_id, chunk_index = i // 4 + 1, i % 4
+        text = " ".join(random.choices(WORDS, k=200))
+        knowledge = KnowledgeModel(
+            id=knowledge_id,
+            user_id=knowledge_id % users + 1,
+            topic_id=knowledge_id % 7 + 1,
+            topic=f"topic-{knowledge_id % 7}",
+            tag_ids=[knowledge_id % 11 + 1, knowledge_id % 13 + 20],
+            tags=[f"tag-{knowledge_id % 11}", f"tag-{knowledge_id % 13}"],
+            title=f"note {knowledge_id}",
+            content=text,
+            created_at=now,
+            updated_at=now,
+        )
+        items.append(
+            {
+                "id": chunk_point_id(knowledge_id, chunk_index),
+                "vector": vectors[i].tolist(),
+                "sparse": encode_document(text),
+                "payload": {
+                    **KnowledgeService._to_payload(knowledge),
+                    "chunk_index": chunk_index,
+                    "text": text,
+                },
+            }
+        )
+    return items
+
+
+def _report(label: str, latencies: list[float], total: float, units: int, unit_name: str):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1]
+    print(
+        f"  {label:<7} p50={statistics.median(latencies) * 1000:8.2f} ms"
+        f"  p95={p95 * 1000:8.2f} ms"
+        f"  throughput={units / total:10.1f} {unit_name}/s"
+    )
+
+
+async def _bench(transport: str, items: list[dict], queries: np.ndarray):
+    qdrant = Qdrant(prefer_grpc=transport == "grpc")
+    name = f"bench_{transport}"
+    if await qdrant.has_collection(name):
+        await qdrant.delete_collection(name)
+    await qdrant.create_collection(name, args.dim)
+
+    try:
+        latencies = []
+        start = time.perf_counter()
+        for offset in range(0, len(items), args.batch_size):
+            batch = items[offset : offset + args.batch_size]
+            t0 = time.perf_counter()
+            await qdrant.upsert(name, batch)
+            latencies.append(time.perf_counter() - t0)
+        total = time.perf_counter() - start
+        print(f"[{transport}]")
+        _report("upsert", latencies, total, len(items), "points")
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies = []
+
+        async def _search(i: int):
+            async with semaphore:
+                t0 = time.perf_counter()
+                await qdrant.search(
+                    name,
+                    queries[i].tolist(),
+                    limit=args.limit,
+                    filters={"tenant": str(i % args.users + 1)},
+                    group_by="knowledge_id",
+                )
+                latencies.append(time.perf_counter() - t0)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[_search(i) for i in range(len(queries))])
+        total = time.perf_counter() - start
+        _report("search", latencies, total, len(queries), "queries")
+    finally:
+        await qdrant.delete_collection(name)
+        await qdrant.close()
+
+
+async def main():
+    items = _items(args.points, args.dim, args.users)
+    queries = _vectors(args.queries, args.dim, np.random.default_rng(11))
+    print(f"{args.points} points, dim={args.dim}, batch={args.batch_size}, concurrency={args.concurrency}")
+
+    transports = ["rest", "grpc"] if args.transport == "both" else [args.transport]
+    for transport in transports:
+        await _bench(transport, items, queries)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""
+Measure how much search quality reduced embedding dimensions cost on your
+own knowledge base before setting EMBEDDING_DIMENSIONS.
+
+Embeds a user's knowledge chunks and a sample of queries once at the
+model's full size, then ranks entries (best chunk per entry, as search
+does) with the full vectors and with each reduced size. Reports recall@k
+of the reduced rankings against the full-size ones, plus the vector
+memory per chunk.
+
+text-embedding-3-* models shorten vectors by truncating and
+renormalizing them, which is what the `dimensions` parameter does
+server-side, so one full-size embedding pass covers every size. Other
+providers do not have this property and are rejected.
+
+Queries are the entry titles unless --queries-file (one query per line)
+is given. Usage (from src/backend, with the server's .env):
+
+    python ../../scripts/eval_embedding_dimensions.py --user-id 1 --dims 256 512 1024
+"""
+
+import argparse
+import asyncio
+import os
+import random
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Recall@k of reduced embedding dimensions vs. full size.")
+    parser.add_argument("--user-id", type=int, required=True, help="Owner of the corpus to evaluate")
+    parser.add_argument(
+        "--dims",
+        type=int,
+        nargs="+",
+        default=[256, 512, 1024],
+        help="Reduced sizes to evaluate (default: 256 512 1024)",
+    )
+    parser.add_argument("--k", type=int, default=5, help="Cut-off for recall@k (default: 5)")
+    parser.add_argument("--queries", type=int, default=200, help="Max sampled title queries (default: 200)")
+    parser.add_argument("--queries-file", default=None, help="File with one query per line instead of titles")
+    parser.add_argument("--seed", type=int, default=7, help="Query sampling seed (default: 7)")
+    return parser.parse_args()
+
+
+args = _parse_args()
+
+# Embed at the model's full size; reduced sizes are derived from it below.
+os.environ["EMBEDDING_DIMENSIONS"] = ""
+
+import numpy as np  # noqa: E402
+
+from hippobox.core.database import dispose_db  # noqa: E402
+from hippobox.models.knowledge import Knowledges  # noqa: E402
+from hippobox.rag.embedding import Embedding  # noqa: E402
+from hippobox.rag.providers.openai import REDUCIBLE_MODELS  # noqa: E402
+from hippobox.services.knowledge import KnowledgeService  # noqa: E402
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _rank(queries: np.ndarray, chunks: np.ndarray, owners: np.ndarray, entries: int, k: int) -> list[set[int]]:
+    """Top-k entry indexes per query, scoring each entry by its best chunk."""
+    scores = queries @ chunks.T
+    best = np.full((len(queries), entries), -np.inf, dtype=np.float32)
+    for column, owner in enumerate(owners):
+        np.maximum(best[:, owner], scores[:, column], out=best[:, owner])
+    top = np.argsort(-best, axis=1)[:, :k]
+    return [set(row.tolist()) for row in top]
+
+
+async def main():
+    embedding = Embedding()
+    provider = embedding.provider
+    if provider.model not in REDUCIBLE_MODELS:
+        raise SystemExit(f"{provider.name}/{provider.model} does not support reduced dimensions")
+
+    knowledges = []
+    async for rows in Knowledges.stream_for_index(user_id=args.user_id):
+        knowledges.extend(rows)
+    if len(knowledges) <= args.k:
+        raise SystemExit(f"User {args.user_id} has {len(knowledges)} entries; need more than k={args.k}")
+
+    texts, owners = [], []
+    for index, knowledge in enumerate(knowledges):
+        for chunk in KnowledgeService.chunk_content(knowledge):
+            texts.append(chunk)
+            owners.append(index)
+
+    if args.queries_file:
+        with open(args.queries_file, encoding="utf-8") as f:
+            queries = [line.strip() for line in f if line.strip()]
+    else:
+        titles = [k.title for k in knowledges]
+        queries = random.Random(args.seed).sample(titles, min(args.queries, len(titles)))
+
+    try:
+        chunk_vectors = np.asarray(await embedding.embed_batch(texts), dtype=np.float32)
+        query_vectors = np.asarray(await embedding.embed_batch(queries), dtype=np.float32)
+    finally:
+        await embedding.close()
+        await dispose_db()
+
+    full = provider.dimension
+    owners = np.asarray(owners)
+    reference = _rank(query_vectors, chunk_vectors, owners, len(knowledges), args.k)
+
+    print(f"{provider.model}: {len(knowledges)} entries, {len(texts)} chunks, {len(queries)} queries, k={args.k}")
+    print(f"  {full:>5} dims  recall@{args.k}=1.000  {full * 4:>6} B/vector  (reference)")
+    for dims in sorted(d for d in args.dims if 0 < d < full):
+        ranked = _rank(
+            _normalize(query_vectors[:, :dims]),
+            _normalize(chunk_vectors[:, :dims]),
+            owners,
+            len(knowledges),
+            args.k,
+        )
+        recall = np.mean([len(r & f) / len(f) for r, f in zip(ranked, reference)])
+        print(f"  {dims:>5} dims  recall@{args.k}={recall:.3f}  {dims * 4:>6} B/vector  ({full / dims:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
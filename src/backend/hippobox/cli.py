@@ -1,9 +1,82 @@
 import argparse
+import asyncio
+import sys
 
 import uvicorn
 
 from hippobox import __version__
+from hippobox.core.database import dispose_db, init_db
+from hippobox.core.logging_config import setup_logger
+from hippobox.core.redis import RedisManager
+from hippobox.core.settings import SETTINGS
+from hippobox.rag.embedding import Embedding
+from hippobox.rag.qdrant import Qdrant
 from hippobox.server import app
+from hippobox.services.export import export_ndjson, gzip_stream
+from hippobox.services.reindex import Reindexer
+
+
+async def _reindex(args: argparse.Namespace):
+    await init_db()
+    qdrant = Qdrant()
+    embedding = Embedding()
+    try:
+        collections = ["knowledge", *(qdrant.collection_for(uid) for uid in sorted(qdrant.dedicated_tenants))]
+        # --recreate fills new collections while the current ones keep serving searches.
+        builds = {}
+        for name in collections:
+            if args.recreate:
+                builds[name] = await qdrant.create_build(name, embedding.dimension)
+            else:
+                await qdrant.ensure_collection(name, embedding.dimension)
+
+        reindexer = Reindexer(
+            embedding,
+            qdrant,
+            user_id=args.user_id,
+            topic=args.topic,
+            batch_tokens=args.batch_tokens,
+            embed_workers=args.embed_workers,
+            upload_workers=args.upload_workers,
+            targets=builds,
+        )
+        try:
+            await reindexer.run(resume=not (args.restart or args.recreate))
+        except BaseException:
+            # A rebuild cannot be resumed; drop its partial collections and checkpoint.
+            for build in builds.values():
+                await qdrant.delete_collection(build)
+            if builds:
+                await reindexer.checkpoint.clear()
+            raise
+
+        for name, build in builds.items():
+            await qdrant.swap_alias(name, build)
+    finally:
+        await embedding.close()
+        await qdrant.close()
+        await dispose_db()
+        await RedisManager.close()
+
+
+async def _export(args: argparse.Namespace):
+    await init_db()
+    qdrant = Qdrant() if args.vectors else None
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        stream = export_ndjson(args.user_id, args.topic, qdrant)
+        if args.gzip:
+            stream = gzip_stream(stream)
+        async for data in stream:
+            out.write(data)
+    finally:
+        if args.output:
+            out.close()
+        else:
+            out.flush()
+        if qdrant is not None:
+            await qdrant.close()
+        await dispose_db()
 
 
 def main():
@@ -38,8 +111,99 @@ def main():
         help="Port to bind (default: 8000)",
     )
 
+    reindex_parser = subparsers.add_parser(
+        "reindex",
+        help="Rebuild the vector index from the SQL knowledge table",
+    )
+
+    reindex_parser.add_argument(
+        "--user-id",
+        type=int,
+        default=None,
+        help="Only reindex this user's knowledge",
+    )
+
+    reindex_parser.add_argument(
+        "--topic",
+        default=None,
+        help="Only reindex knowledge under this topic name",
+    )
+
+    reindex_parser.add_argument(
+        "--batch-tokens",
+        type=int,
+        default=SETTINGS.REINDEX_BATCH_TOKENS,
+        help=f"Approximate tokens per embedding request (default: {SETTINGS.REINDEX_BATCH_TOKENS})",
+    )
+
+    reindex_parser.add_argument(
+        "--embed-workers",
+        type=int,
+        default=SETTINGS.REINDEX_EMBED_WORKERS,
+        help=f"Concurrent embedding requests (default: {SETTINGS.REINDEX_EMBED_WORKERS})",
+    )
+
+    reindex_parser.add_argument(
+        "--upload-workers",
+        type=int,
+        default=SETTINGS.REINDEX_UPLOAD_WORKERS,
+        help=f"Concurrent Qdrant uploads (default: {SETTINGS.REINDEX_UPLOAD_WORKERS})",
+    )
+
+    reindex_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the checkpoint of an interrupted run and start from the first entry",
+    )
+
+    reindex_parser.add_argument(
+        "--recreate",
+        action="store_true",
+        help="Rebuild into new collections and switch search over when done, e.g. after changing the embedding model",
+    )
+
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Export a user's knowledge entries as NDJSON",
+    )
+
+    export_parser.add_argument(
+        "--user-id",
+        type=int,
+        required=True,
+        help="Owner of the entries to export",
+    )
+
+    export_parser.add_argument(
+        "--topic",
+        default=None,
+        help="Only export knowledge under this topic name",
+    )
+
+    export_parser.add_argument(
+        "--vectors",
+        action="store_true",
+        help="Include the stored chunk vectors of each entry",
+    )
+
+    export_parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Compress the output with gzip",
+    )
+
+    export_parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="File to write (default: stdout)",
+    )
+
     args = parser.parse_args()
 
+    if args.command == "reindex" and args.recreate and (args.user_id is not None or args.topic):
+        parser.error("--recreate rebuilds every user's vectors and cannot be combined with --user-id or --topic")
+
     if args.command == "run":
         uvicorn.run(
             app,
@@ -47,3 +211,12 @@ def main():
             port=args.port,
             reload=False,
         )
+    elif args.command == "reindex":
+        if not SETTINGS.VDB_ENABLED:
+            parser.error("reindex needs VDB_ENABLED=true")
+        setup_logger()
+        asyncio.run(_reindex(args))
+    elif args.command == "export":
+        if args.vectors and not SETTINGS.VDB_ENABLED:
+            parser.error("--vectors needs VDB_ENABLED=true")
+        asyncio.run(_export(args))
@@ -0,0 +1,37 @@
+import logging
+from collections import defaultdict
+from typing import Callable
+
+log = logging.getLogger("metrics")
+
+
+class MetricsRegistry:
+    """
+    In-process counters plus named collectors that report component stats
+    (cache hit ratios, batch sizes, ...) on demand.
+    """
+
+    def __init__(self):
+        self._counters: defaultdict[str, int] = defaultdict(int)
+        self._collectors: dict[str, Callable[[], dict]] = {}
+
+    def incr(self, name: str, value: int = 1):
+        self._counters[name] += value
+
+    def get(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def register(self, name: str, collector: Callable[[], dict]):
+        self._collectors[name] = collector
+
+    def snapshot(self) -> dict:
+        snapshot = {"counters": dict(self._counters)}
+        for name, collector in self._collectors.items():
+            try:
+                snapshot[name] = collector()
+            except Exception as e:
+                log.warning(f"Metrics collector {name} failed: {e}")
+        return snapshot
+
+
+METRICS = MetricsRegistry()
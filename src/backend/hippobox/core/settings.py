@@ -38,6 +38,28 @@ class Settings(BaseModel):
 
     EMBEDDING_PROVIDER: str = os.getenv("EMBEDDING_PROVIDER", "openai")
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    EMBEDDING_LOCAL_DIM: int = int(os.getenv("EMBEDDING_LOCAL_DIM", "384"))
+    # Shortened vectors for models that support it (text-embedding-3-*); unset = full size
+    EMBEDDING_DIMENSIONS: int | None = (
+        int(os.getenv("EMBEDDING_DIMENSIONS")) if os.getenv("EMBEDDING_DIMENSIONS") else None
+    )
+    EMBEDDING_TIMEOUT: float = float(os.getenv("EMBEDDING_TIMEOUT", "30"))
+    EMBEDDING_MAX_RETRIES: int = int(os.getenv("EMBEDDING_MAX_RETRIES", "2"))
+    EMBEDDING_MAX_CONNECTIONS: int = int(os.getenv("EMBEDDING_MAX_CONNECTIONS", "20"))
+    EMBEDDING_MAX_KEEPALIVE: int = int(os.getenv("EMBEDDING_MAX_KEEPALIVE", "10"))
+    EMBEDDING_MAX_CONCURRENCY: int = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "8"))
+
+    CHUNK_MAX_TOKENS: int = int(os.getenv("CHUNK_MAX_TOKENS", "512"))
+    CHUNK_OVERLAP_TOKENS: int = int(os.getenv("CHUNK_OVERLAP_TOKENS", "64"))
+
+    EMBEDDING_BATCH_ENABLED: bool = os.getenv("EMBEDDING_BATCH_ENABLED", "true").lower() == "true"
+    EMBEDDING_BATCH_WINDOW_MS: float = float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "10"))
+    EMBEDDING_BATCH_MAX_SIZE: int = int(os.getenv("EMBEDDING_BATCH_MAX_SIZE", "64"))
+
+    EMBEDDING_CACHE_ENABLED: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    EMBEDDING_CACHE_SIZE: int = int(os.getenv("EMBEDDING_CACHE_SIZE", "2048"))
+    EMBEDDING_CACHE_TTL: int = int(os.getenv("EMBEDDING_CACHE_TTL", "86400"))
+    EMBEDDING_CACHE_REDIS: bool = os.getenv("EMBEDDING_CACHE_REDIS", "false").lower() == "true"
 
     # ----------------------------------------
     # Auth
@@ -77,7 +99,51 @@ class Settings(BaseModel):
     QDRANT_MODE: str = os.getenv("QDRANT_MODE", "local")
     QDRANT_PATH: str = os.getenv("QDRANT_PATH", "qdrant_storage")
     QDRANT_URL: str = os.getenv("QDRANT_URL", "http://localhost:6333")
+    QDRANT_PREFER_GRPC: bool = os.getenv("QDRANT_PREFER_GRPC", "false").lower() == "true"
+    QDRANT_GRPC_PORT: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
     QDRANT_LOCAL_PATH: Path | None = None
+    # Vector storage/quantization profile: fast | compact | disk
+    QDRANT_STORAGE_PROFILE: str = os.getenv("QDRANT_STORAGE_PROFILE", "disk")
+    QDRANT_OVERSAMPLING: float = float(os.getenv("QDRANT_OVERSAMPLING", "3.0"))
+    # One HNSW graph per user on the shared collection instead of a global one
+    QDRANT_TENANT_PARTITIONING: bool = os.getenv("QDRANT_TENANT_PARTITIONING", "true").lower() == "true"
+    # Comma-separated user ids whose knowledge lives in a collection of its own
+    QDRANT_DEDICATED_TENANTS: list[int] = [
+        int(uid) for uid in os.getenv("QDRANT_DEDICATED_TENANTS", "").split(",") if uid.strip()
+    ]
+    # Keep each chunk's text in its point payload; search never reads it (hits are loaded from SQL)
+    QDRANT_STORE_TEXT: bool = os.getenv("QDRANT_STORE_TEXT", "true").lower() == "true"
+    # Points per page when walking a collection with scroll
+    QDRANT_SCROLL_PAGE_SIZE: int = int(os.getenv("QDRANT_SCROLL_PAGE_SIZE", "256"))
+    # Points per upsert request when bulk writes (reindex, bulk endpoints) upload vectors
+    QDRANT_UPLOAD_BATCH_SIZE: int = int(os.getenv("QDRANT_UPLOAD_BATCH_SIZE", "64"))
+    # HTTP client for docker/remote mode (timeout and keep-alive expiry in seconds)
+    QDRANT_TIMEOUT: int = int(os.getenv("QDRANT_TIMEOUT", "10"))
+    QDRANT_POOL_SIZE: int = int(os.getenv("QDRANT_POOL_SIZE", "32"))
+    QDRANT_KEEPALIVE: int = int(os.getenv("QDRANT_KEEPALIVE", "16"))
+    QDRANT_KEEPALIVE_EXPIRY: float = float(os.getenv("QDRANT_KEEPALIVE_EXPIRY", "30"))
+    # Candidates fetched per index (x limit) before hybrid fusion and grouping
+    SEARCH_PREFETCH_FACTOR: int = int(os.getenv("SEARCH_PREFETCH_FACTOR", "4"))
+    # Per-user search result cache in Redis (TTL in seconds)
+    SEARCH_CACHE_ENABLED: bool = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_TTL: int = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+    # `hippobox reindex`: embedding request size in tokens and pipeline concurrency
+    REINDEX_BATCH_TOKENS: int = int(os.getenv("REINDEX_BATCH_TOKENS", "8192"))
+    REINDEX_READ_BATCH_SIZE: int = int(os.getenv("REINDEX_READ_BATCH_SIZE", "256"))
+    REINDEX_EMBED_WORKERS: int = int(os.getenv("REINDEX_EMBED_WORKERS", "4"))
+    REINDEX_UPLOAD_WORKERS: int = int(os.getenv("REINDEX_UPLOAD_WORKERS", "2"))
+    REINDEX_QUEUE_SIZE: int = int(os.getenv("REINDEX_QUEUE_SIZE", "8"))
+    # Bulk knowledge endpoints: max entries per request, embedding request
+    # size in tokens and concurrent embedding requests
+    KNOWLEDGE_BULK_MAX_ITEMS: int = int(os.getenv("KNOWLEDGE_BULK_MAX_ITEMS", "1000"))
+    KNOWLEDGE_BULK_BATCH_TOKENS: int = int(os.getenv("KNOWLEDGE_BULK_BATCH_TOKENS", "8192"))
+    KNOWLEDGE_BULK_EMBED_WORKERS: int = int(os.getenv("KNOWLEDGE_BULK_EMBED_WORKERS", "4"))
+    # Background SQL/Qdrant reconciler: seconds between runs (0 disables it),
+    # entries per page, re-embeds per second and pause after each page
+    RECONCILE_INTERVAL: float = float(os.getenv("RECONCILE_INTERVAL", "3600"))
+    RECONCILE_BATCH_SIZE: int = int(os.getenv("RECONCILE_BATCH_SIZE", "256"))
+    RECONCILE_REEMBED_RATE: float = float(os.getenv("RECONCILE_REEMBED_RATE", "2"))
+    RECONCILE_PAGE_DELAY_MS: float = float(os.getenv("RECONCILE_PAGE_DELAY_MS", "50"))
 
     # ----------------------------------------
     # Redis
@@ -48,6 +48,30 @@ class KnowledgeErrorCode(Enum):
         status.HTTP_503_SERVICE_UNAVAILABLE,
     )
 
+    SEARCH_MODE_UNAVAILABLE = ServiceErrorCode(
+        "SEARCH_MODE_UNAVAILABLE",
+        "Sparse search is not available until the vector collection is re-created",
+        status.HTTP_400_BAD_REQUEST,
+    )
+
+    INVALID_CURSOR = ServiceErrorCode(
+        "INVALID_CURSOR",
+        "Invalid pagination cursor",
+        status.HTTP_400_BAD_REQUEST,
+    )
+
+    BULK_TOO_LARGE = ServiceErrorCode(
+        "BULK_TOO_LARGE",
+        "Too many entries in one bulk request",
+        status.HTTP_400_BAD_REQUEST,
+    )
+
+    DUPLICATE_ID = ServiceErrorCode(
+        "DUPLICATE_ID",
+        "The same knowledge id appears more than once in the request",
+        status.HTTP_400_BAD_REQUEST,
+    )
+
     @property
     def code(self) -> ServiceErrorCode:
         return self.value
@@ -0,0 +1,40 @@
+"""knowledge_keyset_index
+
+Revision ID: e1a4c7d9b2f3
+Revises: 6d8a2c4f1b7e
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e1a4c7d9b2f3"
+down_revision: Union[str, Sequence[str], None] = "6d8a2c4f1b7e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_knowledge_user_updated_id"
+
+
+def _has_index(conn, table_name: str, index_name: str) -> bool:
+    inspector = sa.inspect(conn)
+    return any(index["name"] == index_name for index in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    if _has_index(conn, "knowledge", INDEX_NAME):
+        return
+    op.create_index(INDEX_NAME, "knowledge", ["user_id", "updated_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    if not _has_index(conn, "knowledge", INDEX_NAME):
+        return
+    op.drop_index(INDEX_NAME, table_name="knowledge")
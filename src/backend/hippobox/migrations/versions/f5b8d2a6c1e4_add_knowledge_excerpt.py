@@ -0,0 +1,68 @@
+"""add_knowledge_excerpt
+
+Revision ID: f5b8d2a6c1e4
+Revises: e1a4c7d9b2f3
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f5b8d2a6c1e4"
+down_revision: Union[str, Sequence[str], None] = "e1a4c7d9b2f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EXCERPT_LENGTH = 200
+BATCH_SIZE = 500
+
+
+def _has_column(conn, table_name: str, column_name: str) -> bool:
+    inspector = sa.inspect(conn)
+    return any(col["name"] == column_name for col in inspector.get_columns(table_name))
+
+
+def _make_excerpt(content: str) -> str:
+    text = " ".join(content.split())
+    if len(text) <= EXCERPT_LENGTH:
+        return text
+    cut = text[:EXCERPT_LENGTH].rsplit(" ", 1)[0] or text[:EXCERPT_LENGTH]
+    return f"{cut}…"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    if _has_column(conn, "knowledge", "excerpt"):
+        return
+    with op.batch_alter_table("knowledge") as batch_op:
+        batch_op.add_column(sa.Column("excerpt", sa.String(), nullable=False, server_default=""))
+
+    knowledge = sa.table("knowledge", sa.column("id", sa.Integer), sa.column("content"), sa.column("excerpt"))
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(knowledge.c.id, knowledge.c.content)
+            .where(knowledge.c.id > last_id)
+            .order_by(knowledge.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        conn.execute(
+            knowledge.update().where(knowledge.c.id == sa.bindparam("kid")).values(excerpt=sa.bindparam("value")),
+            [{"kid": kid, "value": _make_excerpt(content or "")} for kid, content in rows],
+        )
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    conn = op.get_bind()
+    if not _has_column(conn, "knowledge", "excerpt"):
+        return
+    with op.batch_alter_table("knowledge") as batch_op:
+        batch_op.drop_column("excerpt")
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import base64
+import json
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
+from enum import Enum
 
 from pydantic import BaseModel, Field
-from sqlalchemy import DateTime, ForeignKey, String, Text, UniqueConstraint, select
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload
+from sqlalchemy import DateTime, ForeignKey, Index, Select, String, Text, UniqueConstraint, and_, or_, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Mapped, defer, joinedload, mapped_column, relationship, selectinload
 
 from hippobox.core.database import Base, get_db
 from hippobox.models.topic import Topic
@@ -18,6 +23,18 @@ from hippobox.utils.knowledge_labels import (
     unique_labels,
 )
 
+# Characters of content kept in `Knowledge.excerpt` for list views.
+EXCERPT_LENGTH = 200
+
+
+def make_excerpt(content: str, length: int = EXCERPT_LENGTH) -> str:
+    """Whitespace-collapsed start of `content`, cut at a word boundary when longer than `length`."""
+    text = " ".join(content.split())
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(" ", 1)[0] or text[:length]
+    return f"{cut}…"
+
 
 class Tag(Base):
     __tablename__ = "tag"
@@ -38,7 +55,11 @@ class Tag(Base):
 
 class Knowledge(Base):
     __tablename__ = "knowledge"
-    __table_args__ = (UniqueConstraint("user_id", "title", name="uq_knowledge_user_title"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "title", name="uq_knowledge_user_title"),
+        # Keyset pagination of list views, newest first
+        Index("ix_knowledge_user_updated_id", "user_id", "updated_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
@@ -54,6 +75,8 @@ class Knowledge(Base):
     )
     title: Mapped[str] = mapped_column(nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
+    # make_excerpt(content), written together with content so lists never load it
+    excerpt: Mapped[str] = mapped_column(String, nullable=False, default="", server_default="")
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at: Mapped[datetime] = mapped_column(
@@ -92,11 +115,24 @@ class KnowledgeTag(Base):
     tag: Mapped[Tag] = relationship("Tag", back_populates="knowledge_tags")
 
 
+class ListView(str, Enum):
+    full = "full"
+    summary = "summary"
+
+
+class SearchMode(str, Enum):
+    dense = "dense"
+    sparse = "sparse"
+    hybrid = "hybrid"
+
+
 class KnowledgeModel(BaseModel):
     id: int = Field(..., description="Unique identifier of the knowledge entry")
 
     user_id: int = Field(..., description="Owner's user identifier")
+    topic_id: int = Field(..., description="Identifier of the topic row")
     topic: str = Field(..., description="High-level topic or category of the knowledge")
+    tag_ids: list[int] = Field(default_factory=list, description="Identifiers of the tag rows")
     tags: list[str] = Field(default_factory=list, description="List of keywords describing the knowledge")
     title: str = Field(..., description="Short title summarizing the knowledge")
     content: str = Field(..., description="Full text content of the knowledge entry")
@@ -126,6 +162,46 @@ class KnowledgeResponse(BaseModel):
     updated_at: datetime = Field(..., description="Timestamp when the entry was last updated")
 
 
+class KnowledgeSummary(BaseModel):
+    id: int = Field(..., description="Unique identifier of the knowledge entry")
+    user_id: int = Field(..., description="Owner's user identifier")
+    topic: str = Field(..., description="Topic or category of this knowledge")
+    tags: list[str] = Field(default_factory=list, description="Keywords associated with this knowledge")
+    title: str = Field(..., description="Title summarizing the content")
+    excerpt: str = Field(..., description="Short plain-text start of the content")
+    created_at: datetime = Field(..., description="Timestamp when the entry was created")
+    updated_at: datetime = Field(..., description="Timestamp when the entry was last updated")
+
+
+class KnowledgePage(BaseModel):
+    items: list[KnowledgeResponse] = Field(default_factory=list, description="Entries of this page, newest first")
+    next_cursor: str | None = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page")
+
+
+class KnowledgeSummaryPage(BaseModel):
+    items: list[KnowledgeSummary] = Field(default_factory=list, description="Entries of this page, newest first")
+    next_cursor: str | None = Field(None, description="Pass as `cursor` to fetch the next page; null on the last page")
+
+
+# Position of the last entry of a page in the (updated_at, id) ordering.
+PageKey = tuple[datetime, int]
+
+
+def encode_cursor(key: PageKey) -> str:
+    updated_at, knowledge_id = key
+    raw = json.dumps([updated_at.isoformat(), knowledge_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> PageKey:
+    """Inverse of `encode_cursor`; raises ValueError for anything it did not produce."""
+    try:
+        updated_at, knowledge_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(updated_at), int(knowledge_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
 class KnowledgeUpdate(BaseModel):
     topic: str | None = Field(None, description="Updated topic, if changed")
     tags: list[str] | None = Field(None, description="Updated keyword list, if changed")
@@ -133,119 +209,165 @@ class KnowledgeUpdate(BaseModel):
     content: str | None = Field(None, description="Updated content text, if changed")
 
 
+class KnowledgeBulkCreate(BaseModel):
+    items: list[KnowledgeForm] = Field(..., min_length=1, description="Entries to create")
+
+
+class KnowledgeBulkUpdateItem(KnowledgeUpdate):
+    id: int = Field(..., description="Identifier of the entry to update")
+
+
+class KnowledgeBulkUpdate(BaseModel):
+    items: list[KnowledgeBulkUpdateItem] = Field(..., min_length=1, description="Entries to update")
+
+
+class KnowledgeBulkDelete(BaseModel):
+    ids: list[int] = Field(..., min_length=1, description="Identifiers of the entries to delete")
+
+
+class BulkStatus(str, Enum):
+    created = "created"
+    updated = "updated"
+    unchanged = "unchanged"
+    deleted = "deleted"
+    failed = "failed"
+
+
+class KnowledgeBulkItemResult(BaseModel):
+    index: int = Field(..., description="Position of the item in the request")
+    id: int | None = Field(None, description="Identifier of the affected entry, if any")
+    status: BulkStatus = Field(..., description="Outcome for this item")
+    error: str | None = Field(None, description="Error code when the item failed")
+    message: str | None = Field(None, description="Error message when the item failed")
+    knowledge: KnowledgeResponse | None = Field(None, description="The entry after a create or update")
+
+
+class KnowledgeBulkResponse(BaseModel):
+    results: list[KnowledgeBulkItemResult] = Field(default_factory=list, description="One result per request item")
+    succeeded: int = Field(0, description="Number of items that did not fail")
+    failed: int = Field(0, description="Number of items that failed")
+
+
 class KnowledgeTable:
-    async def _get_or_create_default_topic(self, db, user_id: int) -> Topic:
-        result = await db.execute(
-            select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == DEFAULT_TOPIC_NORMALIZED)
-        )
-        topic = result.scalar_one_or_none()
-        if topic:
-            return topic
+    async def _resolve_labels(
+        self,
+        db,
+        model: type[Topic] | type[Tag],
+        user_id: int,
+        wanted: dict[str, str],
+    ) -> dict[str, Topic | Tag]:
+        """
+        Rows of `model` (Topic or Tag) for `wanted` (normalized name -> name),
+        keyed by normalized name, in at most three statements whatever the
+        count: a SELECT ... IN for the existing ones, one INSERT ... ON
+        CONFLICT DO NOTHING RETURNING for the missing ones, and a SELECT of
+        any that another writer inserted in between. A race therefore never fails
+        the statement or rolls back the caller's transaction.
+        """
+        if not wanted:
+            return {}
 
-        topic = Topic(
-            user_id=user_id,
-            name=DEFAULT_TOPIC_NAME,
-            normalized_name=DEFAULT_TOPIC_NORMALIZED,
-            created_at=datetime.now(timezone.utc),
+        result = await db.execute(
+            select(model).where(model.user_id == user_id, model.normalized_name.in_(list(wanted)))
         )
-        db.add(topic)
-        try:
-            await db.flush()
-        except IntegrityError:
-            await db.rollback()
-            result = await db.execute(
-                select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == DEFAULT_TOPIC_NORMALIZED)
+        rows = {row.normalized_name: row for row in result.scalars().all()}
+
+        missing = {normalized: name for normalized, name in wanted.items() if normalized not in rows}
+        if not missing:
+            return rows
+
+        insert = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+        now = datetime.now(timezone.utc)
+        stmt = (
+            insert(model)
+            .values(
+                [
+                    {"user_id": user_id, "name": name, "normalized_name": normalized, "created_at": now}
+                    for normalized, name in missing.items()
+                ]
             )
-            topic = result.scalar_one()
-        return topic
-
-    async def _get_or_create_topic(self, db, user_id: int, raw_topic: str | None) -> Topic:
+            .on_conflict_do_nothing(index_elements=["user_id", "normalized_name"])
+            .returning(model)
+        )
+        result = await db.execute(stmt)
+        rows.update((row.normalized_name, row) for row in result.scalars().all())
+
+        raced = [normalized for normalized in missing if normalized not in rows]
+        if raced:
+            result = await db.execute(select(model).where(model.user_id == user_id, model.normalized_name.in_(raced)))
+            rows.update((row.normalized_name, row) for row in result.scalars().all())
+        return rows
+
+    @staticmethod
+    def _topic_key(raw_topic: str | None) -> tuple[str, str]:
+        """(name, normalized name) a raw topic resolves to; blank means the default topic."""
         if not raw_topic or not raw_topic.strip():
-            return await self._get_or_create_default_topic(db, user_id)
-
+            return DEFAULT_TOPIC_NAME, DEFAULT_TOPIC_NORMALIZED
         name = clean_label(raw_topic)
-        normalized = normalize_label(name)
-        result = await db.execute(select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == normalized))
-        topic = result.scalar_one_or_none()
-        if topic:
-            return topic
-
-        topic = Topic(user_id=user_id, name=name, normalized_name=normalized)
-        db.add(topic)
-        try:
-            await db.flush()
-        except IntegrityError:
-            await db.rollback()
-            result = await db.execute(
-                select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == normalized)
+        return name, normalize_label(name)
+
+    async def _resolve_topics(self, db, user_id: int, raw_topics: list[str | None]) -> dict[str, Topic]:
+        """Topics for all `raw_topics` keyed by normalized name, created when missing."""
+        wanted: dict[str, str] = {}
+        for raw_topic in raw_topics:
+            name, normalized = self._topic_key(raw_topic)
+            wanted.setdefault(normalized, name)
+        return await self._resolve_labels(db, Topic, user_id, wanted)
+
+    async def _resolve_tags(self, db, user_id: int, raw_tags: list[str]) -> dict[str, Tag]:
+        """Tags for all `raw_tags` keyed by normalized name, created when missing."""
+        wanted: dict[str, str] = {}
+        for name in unique_labels(raw_tags):
+            wanted.setdefault(normalize_tag(name), name)
+        return await self._resolve_labels(db, Tag, user_id, wanted)
+
+    @staticmethod
+    def _tag_ids(tags: dict[str, Tag], raw_tags: list[str]) -> list[int]:
+        return [tags[normalize_tag(name)].id for name in unique_labels(raw_tags)]
+
+    async def _select_many(self, db, user_id: int, knowledge_ids: list[int]) -> list[KnowledgeModel]:
+        result = await db.execute(
+            select(Knowledge)
+            .options(
+                joinedload(Knowledge.topic),
+                joinedload(Knowledge.knowledge_tags).joinedload(KnowledgeTag.tag),
             )
-            topic = result.scalar_one()
-        return topic
-
-    async def _get_or_create_tag(self, db, user_id: int, raw_tag: str) -> Tag:
-        name = clean_label(raw_tag).lstrip("#")
-        normalized = normalize_tag(name)
-        result = await db.execute(select(Tag).where(Tag.user_id == user_id, Tag.normalized_name == normalized))
-        tag = result.scalar_one_or_none()
-        if tag:
-            return tag
-
-        tag = Tag(user_id=user_id, name=name, normalized_name=normalized)
-        db.add(tag)
-        try:
-            await db.flush()
-        except IntegrityError:
-            await db.rollback()
-            result = await db.execute(select(Tag).where(Tag.user_id == user_id, Tag.normalized_name == normalized))
-            tag = result.scalar_one()
-        return tag
+            .where(Knowledge.id.in_(knowledge_ids), Knowledge.user_id == user_id)
+        )
+        knowledges = {k.id: k for k in result.unique().scalars().all()}
+        return [self._to_model(knowledges[kid]) for kid in knowledge_ids if kid in knowledges]
 
     def _to_model(self, knowledge: Knowledge) -> KnowledgeModel:
         topic_name = knowledge.topic.name if knowledge.topic else DEFAULT_TOPIC_NAME
-        tags = [kt.tag.name for kt in knowledge.knowledge_tags if kt.tag]
+        knowledge_tags = [kt for kt in knowledge.knowledge_tags if kt.tag]
         return KnowledgeModel(
             id=knowledge.id,
             user_id=knowledge.user_id,
+            topic_id=knowledge.topic_id,
             topic=topic_name,
-            tags=tags,
+            tag_ids=[kt.tag_id for kt in knowledge_tags],
+            tags=[kt.tag.name for kt in knowledge_tags],
             title=knowledge.title,
             content=knowledge.content,
             created_at=knowledge.created_at,
             updated_at=knowledge.updated_at,
         )
 
-    async def create(self, user_id: int, form: KnowledgeForm) -> KnowledgeModel:
-        async with get_db() as db:
-            topic = await self._get_or_create_topic(db, user_id, form.topic)
-            knowledge = Knowledge(
-                user_id=user_id,
-                topic_id=topic.id,
-                title=form.title.strip(),
-                content=form.content,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
-            )
-            knowledge.topic = topic
-            db.add(knowledge)
-            await db.flush()
-
-            tag_names = unique_labels(form.tags)
-            if tag_names:
-                for raw_tag in tag_names:
-                    tag = await self._get_or_create_tag(db, user_id, raw_tag)
-                    db.add(KnowledgeTag(knowledge_id=knowledge.id, tag_id=tag.id, user_id=user_id))
+    def _to_summary(self, knowledge: Knowledge) -> KnowledgeSummary:
+        knowledge_tags = [kt for kt in knowledge.knowledge_tags if kt.tag]
+        return KnowledgeSummary(
+            id=knowledge.id,
+            user_id=knowledge.user_id,
+            topic=knowledge.topic.name if knowledge.topic else DEFAULT_TOPIC_NAME,
+            tags=[kt.tag.name for kt in knowledge_tags],
+            title=knowledge.title,
+            excerpt=knowledge.excerpt,
+            created_at=knowledge.created_at,
+            updated_at=knowledge.updated_at,
+        )
 
-            await db.commit()
-            result = await db.execute(
-                select(Knowledge)
-                .options(
-                    selectinload(Knowledge.topic),
-                    selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
-                )
-                .where(Knowledge.id == knowledge.id, Knowledge.user_id == user_id)
-            )
-            created = result.scalar_one()
-            return self._to_model(created)
+    async def create(self, user_id: int, form: KnowledgeForm) -> KnowledgeModel:
+        return (await self.create_many(user_id, [form]))[0]
 
     async def get(self, user_id: int, knowledge_id: int) -> KnowledgeModel | None:
         async with get_db() as db:
@@ -260,6 +382,28 @@ class KnowledgeTable:
             knowledge = result.scalar_one_or_none()
             return self._to_model(knowledge) if knowledge else None
 
+    async def get_many(self, user_id: int, knowledge_ids: list[int]) -> list[KnowledgeModel]:
+        """
+        Load several entries in one query, returned in the order of `knowledge_ids`.
+        Ids that do not exist or belong to another user are skipped.
+        """
+        if not knowledge_ids:
+            return []
+
+        async with get_db() as db:
+            return await self._select_many(db, user_id, knowledge_ids)
+
+    async def get_existing_titles(self, user_id: int, titles: list[str]) -> dict[str, int]:
+        """Map each of `titles` already used by one of the user's entries to that entry's id."""
+        if not titles:
+            return {}
+
+        async with get_db() as db:
+            result = await db.execute(
+                select(Knowledge.title, Knowledge.id).where(Knowledge.user_id == user_id, Knowledge.title.in_(titles))
+            )
+            return {title: kid for title, kid in result.all()}
+
     async def get_by_title(self, user_id: int, title: str) -> KnowledgeModel | None:
         async with get_db() as db:
             result = await db.execute(
@@ -273,105 +417,195 @@ class KnowledgeTable:
             knowledge = result.scalar_one_or_none()
             return self._to_model(knowledge) if knowledge else None
 
-    async def get_list(self, user_id: int) -> list[KnowledgeModel]:
-        async with get_db() as db:
-            result = await db.execute(
-                select(Knowledge)
-                .options(
-                    selectinload(Knowledge.topic),
-                    selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
+    async def _get_page(
+        self,
+        stmt: Select,
+        limit: int,
+        after: PageKey | None,
+        view: ListView = ListView.full,
+    ) -> tuple[list[KnowledgeModel] | list[KnowledgeSummary], PageKey | None]:
+        """
+        Run a list query as one keyset page, newest first by (updated_at, id).
+        One extra row is fetched to tell whether another page follows; the
+        returned key is the position to continue after, or None at the end.
+        The summary view never reads the content column.
+        """
+        stmt = (
+            stmt.options(
+                selectinload(Knowledge.topic),
+                selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
+            )
+            .order_by(Knowledge.updated_at.desc(), Knowledge.id.desc())
+            .limit(limit + 1)
+        )
+        if view == ListView.summary:
+            stmt = stmt.options(defer(Knowledge.content, raiseload=True))
+        to_item = self._to_summary if view == ListView.summary else self._to_model
+        if after is not None:
+            updated_at, knowledge_id = after
+            stmt = stmt.where(
+                or_(
+                    Knowledge.updated_at < updated_at,
+                    and_(Knowledge.updated_at == updated_at, Knowledge.id < knowledge_id),
                 )
-                .where(Knowledge.user_id == user_id)
             )
+
+        async with get_db() as db:
+            result = await db.execute(stmt)
             knowledges = result.scalars().all()
-            return [self._to_model(k) for k in knowledges]
 
-    async def get_by_topic(self, user_id: int, topic: str) -> list[KnowledgeModel]:
+            next_key = None
+            if len(knowledges) > limit:
+                knowledges = knowledges[:limit]
+                next_key = (knowledges[-1].updated_at, knowledges[-1].id)
+            return [to_item(k) for k in knowledges], next_key
+
+    async def get_list(
+        self,
+        user_id: int,
+        limit: int = 50,
+        after: PageKey | None = None,
+        view: ListView = ListView.full,
+    ) -> tuple[list[KnowledgeModel] | list[KnowledgeSummary], PageKey | None]:
+        return await self._get_page(select(Knowledge).where(Knowledge.user_id == user_id), limit, after, view)
+
+    async def get_by_topic(
+        self,
+        user_id: int,
+        topic: str,
+        limit: int = 50,
+        after: PageKey | None = None,
+        view: ListView = ListView.full,
+    ) -> tuple[list[KnowledgeModel] | list[KnowledgeSummary], PageKey | None]:
+        stmt = (
+            select(Knowledge)
+            .join(Topic, Knowledge.topic_id == Topic.id)
+            .where(Topic.normalized_name == normalize_label(topic), Knowledge.user_id == user_id)
+        )
+        return await self._get_page(stmt, limit, after, view)
+
+    async def get_by_tag(
+        self,
+        user_id: int,
+        tag: str,
+        limit: int = 50,
+        after: PageKey | None = None,
+        view: ListView = ListView.full,
+    ) -> tuple[list[KnowledgeModel] | list[KnowledgeSummary], PageKey | None]:
+        stmt = (
+            select(Knowledge)
+            .join(KnowledgeTag, Knowledge.id == KnowledgeTag.knowledge_id)
+            .join(Tag, Tag.id == KnowledgeTag.tag_id)
+            .where(Tag.normalized_name == normalize_tag(tag), Knowledge.user_id == user_id)
+        )
+        return await self._get_page(stmt, limit, after, view)
+
+    async def get_tag_id(self, user_id: int, tag: str) -> int | None:
         async with get_db() as db:
-            normalized = normalize_label(topic)
             result = await db.execute(
-                select(Knowledge)
-                .join(Topic, Knowledge.topic_id == Topic.id)
-                .options(
-                    selectinload(Knowledge.topic),
-                    selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
-                )
-                .where(Topic.normalized_name == normalized, Knowledge.user_id == user_id)
+                select(Tag.id).where(Tag.user_id == user_id, Tag.normalized_name == normalize_tag(tag))
             )
-            knowledges = result.scalars().all()
-            return [self._to_model(k) for k in knowledges]
+            return result.scalar_one_or_none()
+
+    async def get_index_fields(self, knowledge_ids: list[int]) -> dict[int, dict]:
+        """
+        Return the vector payload filter fields (user_id, topic_id, tag_ids)
+        for the given knowledge ids, regardless of owner.
+        """
+        if not knowledge_ids:
+            return {}
 
-    async def get_by_tag(self, user_id: int, tag: str) -> list[KnowledgeModel]:
         async with get_db() as db:
-            normalized = normalize_tag(tag)
             result = await db.execute(
-                select(Knowledge)
-                .join(KnowledgeTag, Knowledge.id == KnowledgeTag.knowledge_id)
-                .join(Tag, Tag.id == KnowledgeTag.tag_id)
-                .options(
-                    selectinload(Knowledge.topic),
-                    selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
-                )
-                .where(Tag.normalized_name == normalized, Knowledge.user_id == user_id)
+                select(Knowledge.id, Knowledge.user_id, Knowledge.topic_id).where(Knowledge.id.in_(knowledge_ids))
             )
-            knowledges = result.scalars().all()
-            return [self._to_model(k) for k in knowledges]
+            fields = {
+                kid: {"user_id": user_id, "topic_id": topic_id, "tag_ids": []}
+                for kid, user_id, topic_id in result.all()
+            }
 
-    async def update(
-        self,
-        user_id: int,
-        knowledge_id: int,
-        form: KnowledgeUpdate,
-        override_updated_at: datetime | None = None,
-    ) -> KnowledgeModel | None:
-        async with get_db() as db:
             result = await db.execute(
-                select(Knowledge)
-                .options(
-                    selectinload(Knowledge.topic),
-                    selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
+                select(KnowledgeTag.knowledge_id, KnowledgeTag.tag_id).where(
+                    KnowledgeTag.knowledge_id.in_(list(fields))
                 )
-                .where(Knowledge.id == knowledge_id, Knowledge.user_id == user_id)
             )
-            knowledge = result.scalar_one_or_none()
-
-            if knowledge is None:
-                return None
+            for kid, tag_id in result.all():
+                fields[kid]["tag_ids"].append(tag_id)
 
-            update_data = form.model_dump(exclude_unset=True)
-            if "title" in update_data and update_data["title"] is not None:
-                update_data["title"] = update_data["title"].strip()
+            return fields
 
-            try:
-                if "topic" in update_data:
-                    topic = await self._get_or_create_topic(db, user_id, update_data.pop("topic"))
-                    knowledge.topic_id = topic.id
-                    knowledge.topic = topic
+    async def stream_for_index(
+        self,
+        user_id: int | None = None,
+        topic: str | None = None,
+        after_id: int = 0,
+        batch_size: int = 256,
+    ) -> AsyncIterator[list[KnowledgeModel]]:
+        """
+        Stream entries with an id above `after_id` in id order, `batch_size`
+        rows at a time, through a server-side cursor so the table is never
+        loaded whole. Optionally limited to one user and/or one topic name.
+        """
+        stmt = (
+            select(Knowledge)
+            .options(
+                selectinload(Knowledge.topic),
+                selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
+            )
+            .where(Knowledge.id > after_id)
+            .order_by(Knowledge.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if user_id is not None:
+            stmt = stmt.where(Knowledge.user_id == user_id)
+        if topic:
+            stmt = stmt.join(Topic, Knowledge.topic_id == Topic.id).where(
+                Topic.normalized_name == normalize_label(topic)
+            )
 
-                if "tags" in update_data:
-                    tags = update_data.pop("tags") or []
-                    knowledge.knowledge_tags.clear()
-                    tag_names = unique_labels(tags)
-                    for raw_tag in tag_names:
-                        tag = await self._get_or_create_tag(db, user_id, raw_tag)
-                        knowledge.knowledge_tags.append(
-                            KnowledgeTag(knowledge_id=knowledge.id, tag_id=tag.id, user_id=user_id)
-                        )
+        async with get_db() as db:
+            result = await db.stream(stmt)
+            async for rows in result.scalars().partitions():
+                yield [self._to_model(k) for k in rows]
 
-                for key, value in update_data.items():
-                    setattr(knowledge, key, value)
+    async def get_index_state(
+        self,
+        after_id: int = 0,
+        limit: int = 256,
+        user_id: int | None = None,
+    ) -> list[tuple[int, int, datetime]]:
+        """
+        Return (id, user_id, updated_at) of up to `limit` entries with an id
+        above `after_id`, in id order, without loading content, topics or tags.
+        Each page is a short query of its own, so walking the table holds no
+        long-lived transaction.
+        """
+        stmt = (
+            select(Knowledge.id, Knowledge.user_id, Knowledge.updated_at)
+            .where(Knowledge.id > after_id)
+            .order_by(Knowledge.id)
+            .limit(limit)
+        )
+        if user_id is not None:
+            stmt = stmt.where(Knowledge.user_id == user_id)
 
-                knowledge.updated_at = override_updated_at or datetime.now(timezone.utc)
+        async with get_db() as db:
+            result = await db.execute(stmt)
+            return [tuple(row) for row in result.all()]
 
-                await db.commit()
-            except IntegrityError:
-                await db.rollback()
-                raise
-            except Exception:
-                await db.rollback()
-                raise
-            await db.refresh(knowledge)
-            return self._to_model(knowledge)
+    async def update(
+        self,
+        user_id: int,
+        knowledge_id: int,
+        form: KnowledgeUpdate,
+        override_updated_at: datetime | None = None,
+    ) -> KnowledgeModel | None:
+        updated = await self.update_many(
+            user_id,
+            {knowledge_id: form},
+            {knowledge_id: override_updated_at} if override_updated_at else None,
+        )
+        return updated[0] if updated else None
 
     async def delete(self, user_id: int, knowledge_id: int) -> bool:
         async with get_db() as db:
@@ -389,13 +623,16 @@ class KnowledgeTable:
 
     async def restore(self, knowledge: KnowledgeModel) -> KnowledgeModel:
         async with get_db() as db:
-            topic = await self._get_or_create_topic(db, knowledge.user_id, knowledge.topic)
+            topics = await self._resolve_topics(db, knowledge.user_id, [knowledge.topic])
+            topic = topics[self._topic_key(knowledge.topic)[1]]
+            tags = await self._resolve_tags(db, knowledge.user_id, knowledge.tags)
             restored = Knowledge(
                 id=knowledge.id,
                 user_id=knowledge.user_id,
                 topic_id=topic.id,
                 title=knowledge.title,
                 content=knowledge.content,
+                excerpt=make_excerpt(knowledge.content),
                 created_at=knowledge.created_at,
                 updated_at=knowledge.updated_at,
             )
@@ -403,15 +640,121 @@ class KnowledgeTable:
 
             db.add(restored)
             await db.flush()
-            tag_names = unique_labels(knowledge.tags)
-            for raw_tag in tag_names:
-                tag = await self._get_or_create_tag(db, knowledge.user_id, raw_tag)
+            for tag_id in self._tag_ids(tags, knowledge.tags):
                 restored.knowledge_tags.append(
-                    KnowledgeTag(knowledge_id=restored.id, tag_id=tag.id, user_id=knowledge.user_id)
+                    KnowledgeTag(knowledge_id=restored.id, tag_id=tag_id, user_id=knowledge.user_id)
                 )
             await db.commit()
             await db.refresh(restored)
             return self._to_model(restored)
 
+    async def create_many(self, user_id: int, forms: list[KnowledgeForm]) -> list[KnowledgeModel]:
+        """
+        Create several entries in one transaction, resolving all their topics
+        and tags together. Returned in the order of `forms`.
+        """
+        async with get_db() as db:
+            topics = await self._resolve_topics(db, user_id, [form.topic for form in forms])
+            tags = await self._resolve_tags(db, user_id, [tag for form in forms for tag in form.tags])
+
+            now = datetime.now(timezone.utc)
+            knowledges = [
+                Knowledge(
+                    user_id=user_id,
+                    topic_id=topics[self._topic_key(form.topic)[1]].id,
+                    title=form.title.strip(),
+                    content=form.content,
+                    excerpt=make_excerpt(form.content),
+                    created_at=now,
+                    updated_at=now,
+                )
+                for form in forms
+            ]
+            db.add_all(knowledges)
+            await db.flush()
+
+            db.add_all(
+                [
+                    KnowledgeTag(knowledge_id=knowledge.id, tag_id=tag_id, user_id=user_id)
+                    for knowledge, form in zip(knowledges, forms)
+                    for tag_id in self._tag_ids(tags, form.tags)
+                ]
+            )
+            await db.commit()
+            return await self._select_many(db, user_id, [knowledge.id for knowledge in knowledges])
+
+    async def update_many(
+        self,
+        user_id: int,
+        forms: dict[int, KnowledgeUpdate],
+        override_updated_at: dict[int, datetime] | None = None,
+    ) -> list[KnowledgeModel]:
+        """
+        Apply `forms` (knowledge id -> update) in one transaction, like `update`
+        does for a single entry. Ids that do not exist are skipped.
+        """
+        override_updated_at = override_updated_at or {}
+        async with get_db() as db:
+            result = await db.execute(
+                select(Knowledge)
+                .options(
+                    selectinload(Knowledge.topic),
+                    selectinload(Knowledge.knowledge_tags).selectinload(KnowledgeTag.tag),
+                )
+                .where(Knowledge.id.in_(list(forms)), Knowledge.user_id == user_id)
+            )
+            knowledges = result.scalars().all()
+
+            updates = {kid: form.model_dump(exclude_unset=True) for kid, form in forms.items()}
+            topics = await self._resolve_topics(
+                db, user_id, [data["topic"] for data in updates.values() if "topic" in data]
+            )
+            tags = await self._resolve_tags(
+                db, user_id, [tag for data in updates.values() for tag in data.get("tags") or []]
+            )
+
+            now = datetime.now(timezone.utc)
+            for knowledge in knowledges:
+                update_data = updates[knowledge.id]
+                if "title" in update_data and update_data["title"] is not None:
+                    update_data["title"] = update_data["title"].strip()
+
+                if "topic" in update_data:
+                    topic = topics[self._topic_key(update_data.pop("topic"))[1]]
+                    knowledge.topic_id = topic.id
+                    knowledge.topic = topic
+
+                if "tags" in update_data:
+                    knowledge.knowledge_tags.clear()
+                    for tag_id in self._tag_ids(tags, update_data.pop("tags") or []):
+                        knowledge.knowledge_tags.append(
+                            KnowledgeTag(knowledge_id=knowledge.id, tag_id=tag_id, user_id=user_id)
+                        )
+
+                for key, value in update_data.items():
+                    setattr(knowledge, key, value)
+                if update_data.get("content") is not None:
+                    knowledge.excerpt = make_excerpt(knowledge.content)
+
+                knowledge.updated_at = override_updated_at.get(knowledge.id) or now
+
+            await db.commit()
+            return await self._select_many(db, user_id, [knowledge.id for knowledge in knowledges])
+
+    async def delete_many(self, user_id: int, knowledge_ids: list[int]) -> list[int]:
+        """Delete several entries in one transaction and return the ids that existed."""
+        async with get_db() as db:
+            result = await db.execute(
+                select(Knowledge)
+                .options(selectinload(Knowledge.knowledge_tags))
+                .where(Knowledge.id.in_(knowledge_ids), Knowledge.user_id == user_id)
+            )
+            knowledges = result.scalars().all()
+
+            for knowledge in knowledges:
+                await db.delete(knowledge)
+            await db.commit()
+            return [knowledge.id for knowledge in knowledges]
+
 
 Knowledges = KnowledgeTable()
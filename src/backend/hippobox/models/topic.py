@@ -65,6 +65,14 @@ class TopicTable:
             topic = result.scalar_one_or_none()
             return self._to_model(topic) if topic else None
 
+    async def get_by_name(self, user_id: int, name: str) -> TopicResponse | None:
+        async with get_db() as db:
+            result = await db.execute(
+                select(Topic).where(Topic.user_id == user_id, Topic.normalized_name == normalize_label(name))
+            )
+            topic = result.scalar_one_or_none()
+            return self._to_model(topic) if topic else None
+
     async def list(self, user_id: int) -> list[TopicResponse]:
         async with get_db() as db:
             result = await db.execute(
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+log = logging.getLogger("embedding")
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent single-text embedding requests into batch calls.
+
+    Requests submitted within `window_ms` of the first pending one are sent
+    together as a single `embed_batch` call; a batch is flushed early once it
+    reaches `max_batch_size`. Each caller receives its own vector, or the
+    exception raised by the batch call.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[list[str]], Awaitable[list[list[float]]]],
+        window_ms: float = 10,
+        max_batch_size: int = 64,
+    ):
+        self._embed_batch = embed_batch
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self.requests = 0
+        self.batches = 0
+
+    async def submit(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        self.requests += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future]]):
+        # Identical texts in one window are embedded once.
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        self.batches += 1
+
+        try:
+            vectors = dict(zip(texts, await self._embed_batch(texts)))
+        except Exception as e:
+            log.warning(f"Embedding batch of {len(texts)} failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for text, future in batch:
+            if not future.done():
+                future.set_result(vectors[text])
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": self.requests / self.batches if self.batches else 0.0,
+        }
@@ -0,0 +1,100 @@
+import re
+
+HEADING_PATTERN = re.compile(r"^#{1,6}\s+\S")
+FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+WORD_PATTERN = re.compile(r"\S+\s*")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap, provider-independent token estimate: words and punctuation marks
+    each count as one token. It over-counts slightly compared to BPE
+    tokenizers, which keeps chunks safely under model limits.
+    """
+    return len(TOKEN_PATTERN.findall(text))
+
+
+def _split_sections(text: str) -> list[str]:
+    """Split markdown into sections that each start at a heading (code fences are never split)."""
+    sections: list[list[str]] = [[]]
+    in_fence = False
+
+    for line in text.splitlines(keepends=True):
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        elif not in_fence and HEADING_PATTERN.match(line) and sections[-1]:
+            sections.append([])
+        sections[-1].append(line)
+
+    return ["".join(section) for section in sections if "".join(section).strip()]
+
+
+def _split_window(text: str, max_tokens: int, overlap_tokens: int) -> list[str]:
+    """Split an oversized section into overlapping windows of whole words."""
+    words = WORD_PATTERN.findall(text)
+    counts = [estimate_tokens(word) for word in words]
+
+    windows: list[str] = []
+    start = 0
+    while start < len(words):
+        end, tokens = start, 0
+        while end < len(words) and (tokens + counts[end] <= max_tokens or end == start):
+            tokens += counts[end]
+            end += 1
+        windows.append("".join(words[start:end]))
+        if end >= len(words):
+            break
+
+        # Step back far enough to repeat roughly `overlap_tokens` tokens.
+        back, overlap = end, 0
+        while back > start + 1 and overlap + counts[back - 1] <= overlap_tokens:
+            back -= 1
+            overlap += counts[back]
+        start = back
+
+    return windows
+
+
+def chunk_markdown(text: str, max_tokens: int = 512, overlap_tokens: int = 64) -> list[str]:
+    """
+    Split markdown into chunks of at most about `max_tokens` tokens.
+
+    Consecutive heading sections are packed together while they fit; a
+    section that is larger than `max_tokens` on its own is cut into
+    overlapping token windows. Always returns at least one chunk.
+    """
+    chunks: list[str] = []
+    current, current_tokens = "", 0
+
+    for section in _split_sections(text):
+        tokens = estimate_tokens(section)
+
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(current)
+            current, current_tokens = "", 0
+
+        if tokens > max_tokens:
+            chunks.extend(_split_window(section, max_tokens, overlap_tokens))
+            continue
+
+        current += section
+        current_tokens += tokens
+
+    if current:
+        chunks.append(current)
+
+    return [chunk.strip() for chunk in chunks if chunk.strip()] or [text]
+
+
+# Chunk 0 of a knowledge entry keeps the entry id as its point id (the id used
+# before chunking); later chunks put the chunk index in the high bits.
+CHUNK_ID_SHIFT = 48
+
+
+def chunk_point_id(knowledge_id: int, chunk_index: int) -> int:
+    return (chunk_index << CHUNK_ID_SHIFT) | knowledge_id
+
+
+def knowledge_id_from_point(point_id: int) -> int:
+    return int(point_id) & ((1 << CHUNK_ID_SHIFT) - 1)
@@ -1,37 +1,93 @@
-from openai import OpenAI
-
 from hippobox.core.settings import SETTINGS
+from hippobox.rag.batching import EmbeddingBatcher
+from hippobox.rag.embedding_cache import EmbeddingCache
+from hippobox.rag.providers import local, openai  # noqa: F401 (register built-in providers)
+from hippobox.rag.providers.base import EmbeddingProvider, get_provider_class
 
 
 class Embedding:
-    def __init__(self):
-        self.client = OpenAI(api_key=SETTINGS.OPENAI_API_KEY)
-        self.model = SETTINGS.EMBEDDING_MODEL
+    def __init__(self, provider: EmbeddingProvider | None = None):
+        self.provider = provider or get_provider_class(SETTINGS.EMBEDDING_PROVIDER)()
+
+        self.cache = (
+            EmbeddingCache(
+                self.provider.name,
+                self.provider.model,
+                dimensions=self.provider.dimension,
+                max_size=SETTINGS.EMBEDDING_CACHE_SIZE,
+                ttl=SETTINGS.EMBEDDING_CACHE_TTL,
+                use_redis=SETTINGS.EMBEDDING_CACHE_REDIS,
+            )
+            if SETTINGS.EMBEDDING_CACHE_ENABLED
+            else None
+        )
+        self.batcher = (
+            EmbeddingBatcher(
+                self.provider.embed_batch,
+                window_ms=SETTINGS.EMBEDDING_BATCH_WINDOW_MS,
+                max_batch_size=SETTINGS.EMBEDDING_BATCH_MAX_SIZE,
+            )
+            if SETTINGS.EMBEDDING_BATCH_ENABLED
+            else None
+        )
+
+    @property
+    def dimension(self) -> int:
+        return self.provider.dimension
+
+    async def _create(self, texts: list[str]) -> list[list[float]]:
+        # Keep each provider request within the configured batch size.
+        size = SETTINGS.EMBEDDING_BATCH_MAX_SIZE
+        if len(texts) <= size:
+            return await self.provider.embed_batch(texts)
+
+        vectors = []
+        for start in range(0, len(texts), size):
+            vectors.extend(await self.provider.embed_batch(texts[start : start + size]))
+        return vectors
 
-    def embed(self, text: str) -> list[float]:
+    async def embed(self, text: str) -> list[float]:
         if not text or not isinstance(text, str):
             raise ValueError("Text input must be a non-empty string.")
 
-        try:
-            response = self.client.embeddings.create(
-                model=self.model,
-                input=text,
-            )
-            return response.data[0].embedding
+        if self.cache is not None:
+            cached = await self.cache.get(text)
+            if cached is not None:
+                return cached
+
+        if self.batcher is not None:
+            vector = await self.batcher.submit(text)
+        else:
+            vector = (await self.provider.embed_batch([text]))[0]
 
-        except Exception:
-            raise
+        if self.cache is not None:
+            await self.cache.set(text, vector)
+        return vector
 
-    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         if not texts or not isinstance(texts, list):
             raise ValueError("Input must be a non-empty list of strings.")
 
-        try:
-            response = self.client.embeddings.create(
-                model=self.model,
-                input=texts,
-            )
-            return [item.embedding for item in response.data]
+        if self.cache is None:
+            return await self._create(texts)
+
+        vectors = await self.cache.get_many(texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            created = await self._create([texts[i] for i in missing])
+            for i, vector in zip(missing, created):
+                vectors[i] = vector
+            await self.cache.set_many([texts[i] for i in missing], created)
+
+        return vectors
+
+    def stats(self) -> dict:
+        return {
+            "provider": self.provider.name,
+            "model": self.provider.model,
+            "cache": self.cache.stats() if self.cache is not None else None,
+            "batcher": self.batcher.stats() if self.batcher is not None else None,
+        }
 
-        except Exception:
-            raise
+    async def close(self):
+        await self.provider.close()
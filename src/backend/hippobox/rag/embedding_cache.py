@@ -0,0 +1,134 @@
+import base64
+import hashlib
+import logging
+import time
+from array import array
+from collections import OrderedDict
+
+from hippobox.core.redis import RedisManager
+
+log = logging.getLogger("embedding")
+
+
+class EmbeddingCache:
+    """
+    Content-addressed cache for embedding vectors.
+
+    Entries are keyed by (provider, model, dimensions, sha256(text)) so a change
+    of model or dimensions never serves a stale vector. Lookups go through an
+    in-process LRU first and, when enabled, a shared Redis tier second.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        dimensions: int | None = None,
+        max_size: int = 2048,
+        ttl: int = 86400,
+        use_redis: bool = False,
+    ):
+        self.namespace = f"{provider}:{model}:{dimensions or 'default'}"
+        self.max_size = max_size
+        self.ttl = ttl
+        self.use_redis = use_redis
+
+        self._entries: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _redis_key(self, digest: str) -> str:
+        return f"embedding:{self.namespace}:{digest}"
+
+    @staticmethod
+    def _pack(vector: list[float]) -> str:
+        return base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+
+    @staticmethod
+    def _unpack(raw: str) -> list[float]:
+        values = array("f")
+        values.frombytes(base64.b64decode(raw))
+        return values.tolist()
+
+    def _get_local(self, digest: str) -> list[float] | None:
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+
+        expires_at, vector = entry
+        if expires_at < time.monotonic():
+            del self._entries[digest]
+            return None
+
+        self._entries.move_to_end(digest)
+        return vector
+
+    def _set_local(self, digest: str, vector: list[float]):
+        self._entries[digest] = (time.monotonic() + self.ttl, vector)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get_many(self, texts: list[str]) -> list[list[float] | None]:
+        digests = [self._digest(text) for text in texts]
+        vectors = [self._get_local(digest) for digest in digests]
+
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing and self.use_redis:
+            try:
+                redis = await RedisManager.get_client()
+                raws = await redis.mget([self._redis_key(digests[i]) for i in missing])
+                for i, raw in zip(missing, raws):
+                    if raw is None:
+                        continue
+                    vectors[i] = self._unpack(raw)
+                    self._set_local(digests[i], vectors[i])
+                    self.redis_hits += 1
+            except Exception as e:
+                log.warning(f"Embedding cache Redis lookup failed: {e}")
+
+        found = sum(1 for vector in vectors if vector is not None)
+        self.hits += found
+        self.misses += len(vectors) - found
+        return vectors
+
+    async def get(self, text: str) -> list[float] | None:
+        return (await self.get_many([text]))[0]
+
+    async def set_many(self, texts: list[str], vectors: list[list[float]]):
+        digests = [self._digest(text) for text in texts]
+        for digest, vector in zip(digests, vectors):
+            self._set_local(digest, vector)
+
+        if not self.use_redis:
+            return
+
+        try:
+            redis = await RedisManager.get_client()
+            async with redis.pipeline(transaction=False) as pipe:
+                for digest, vector in zip(digests, vectors):
+                    pipe.set(self._redis_key(digest), self._pack(vector), ex=self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            log.warning(f"Embedding cache Redis write failed: {e}")
+
+    async def set(self, text: str, vector: list[float]):
+        await self.set_many([text], [vector])
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
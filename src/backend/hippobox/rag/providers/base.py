@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+
+
+class EmbeddingProvider(ABC):
+    """
+    Backend that turns texts into vectors.
+
+    Implementations are registered by name with `register_provider` and
+    selected through `SETTINGS.EMBEDDING_PROVIDER`.
+    """
+
+    name: str = ""
+
+    def __init__(self, model: str, dimension: int):
+        self.model = model
+        self.dimension = dimension
+
+    @abstractmethod
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        raise NotImplementedError
+
+    async def close(self):
+        return None
+
+
+PROVIDERS: dict[str, type[EmbeddingProvider]] = {}
+
+
+def register_provider(name: str):
+    def decorator(cls: type[EmbeddingProvider]) -> type[EmbeddingProvider]:
+        cls.name = name
+        PROVIDERS[name] = cls
+        return cls
+
+    return decorator
+
+
+def get_provider_class(name: str) -> type[EmbeddingProvider]:
+    provider = PROVIDERS.get(name.lower())
+    if provider is None:
+        raise ValueError(f"Invalid EMBEDDING_PROVIDER: {name} (available: {', '.join(sorted(PROVIDERS))})")
+    return provider
@@ -0,0 +1,58 @@
+import asyncio
+import hashlib
+import re
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+from hippobox.core.settings import SETTINGS
+from hippobox.rag.providers.base import EmbeddingProvider, register_provider
+
+TOKEN_PATTERN = re.compile(r"[\w\-.]+", re.UNICODE)
+
+
+@lru_cache(maxsize=65536)
+def _bucket(feature: str, dimension: int) -> tuple[int, float]:
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dimension, 1.0 if value >> 63 else -1.0
+
+
+@register_provider("local")
+class LocalHashingEmbeddingProvider(EmbeddingProvider):
+    """
+    CPU-only embedding built from signed feature hashing.
+
+    Words and character trigrams are hashed into a fixed number of buckets,
+    weighted by sublinear term frequency and L2-normalized. It needs no
+    network or model download and is fully deterministic, at the cost of
+    lexical rather than semantic similarity.
+    """
+
+    def __init__(self):
+        super().__init__("hashing-v1", SETTINGS.EMBEDDING_LOCAL_DIM)
+
+    @staticmethod
+    def _features(text: str) -> Counter:
+        features = Counter()
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            features[f"w:{token}"] += 1
+            padded = f"<{token}>"
+            for i in range(len(padded) - 2):
+                features[f"c:{padded[i:i + 3]}"] += 1
+        return features
+
+    def _embed_one(self, text: str) -> list[float]:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        for feature, count in self._features(text).items():
+            index, sign = _bucket(feature, self.dimension)
+            vector[index] += sign * (1.0 + np.log(count))
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector.tolist()
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return await asyncio.to_thread(lambda: [self._embed_one(text) for text in texts])
@@ -0,0 +1,66 @@
+import asyncio
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from hippobox.core.settings import SETTINGS
+from hippobox.rag.providers.base import EmbeddingProvider, register_provider
+
+MODEL_DIMENSIONS = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
+# Models that accept the `dimensions` parameter (shortened, renormalized vectors)
+REDUCIBLE_MODELS = {"text-embedding-3-small", "text-embedding-3-large"}
+
+
+@register_provider("openai")
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    def __init__(self):
+        model = SETTINGS.EMBEDDING_MODEL
+        if model not in MODEL_DIMENSIONS:
+            raise ValueError(f"Unknown OpenAI embedding model: {model}")
+
+        full_dimension = MODEL_DIMENSIONS[model]
+        dimensions = SETTINGS.EMBEDDING_DIMENSIONS
+        if dimensions is not None and dimensions != full_dimension:
+            if model not in REDUCIBLE_MODELS:
+                raise ValueError(f"EMBEDDING_DIMENSIONS is not supported by {model}")
+            if not 1 <= dimensions < full_dimension:
+                raise ValueError(f"EMBEDDING_DIMENSIONS must be between 1 and {full_dimension} for {model}")
+            # Only sent when it differs from the model's full size.
+            self.request_options = {"dimensions": dimensions}
+        else:
+            self.request_options = {}
+        super().__init__(model, dimensions or full_dimension)
+
+        # One pooled HTTP client per process; the semaphore caps in-flight
+        # provider requests so bursts queue here instead of at the provider.
+        self.http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=SETTINGS.EMBEDDING_MAX_CONNECTIONS,
+                max_keepalive_connections=SETTINGS.EMBEDDING_MAX_KEEPALIVE,
+            ),
+            timeout=httpx.Timeout(SETTINGS.EMBEDDING_TIMEOUT),
+        )
+        self.client = AsyncOpenAI(
+            api_key=SETTINGS.OPENAI_API_KEY,
+            http_client=self.http_client,
+            timeout=SETTINGS.EMBEDDING_TIMEOUT,
+            max_retries=SETTINGS.EMBEDDING_MAX_RETRIES,
+        )
+        self._semaphore = asyncio.Semaphore(SETTINGS.EMBEDDING_MAX_CONCURRENCY)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        async with self._semaphore:
+            response = await self.client.embeddings.create(
+                model=self.model,
+                input=texts,
+                **self.request_options,
+            )
+        return [item.embedding for item in response.data]
+
+    async def close(self):
+        await self.client.close()
@@ -1,7 +1,12 @@
 import logging
+import re
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from pathlib import Path
 
-from qdrant_client import QdrantClient as QClient
+import httpx
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.models import PointStruct
 from qdrant_client.models import models
 
@@ -9,120 +14,640 @@ from hippobox.core.settings import SETTINGS
 
 log = logging.getLogger("qdrant")
 
-NO_LIMIT = 999999999
+# Named sparse vector holding BM25 term weights, next to the unnamed dense vector.
+SPARSE_VECTOR_NAME = "bm25"
+
+# Top-level payload fields used to scope vector queries, with their index types.
+FILTER_FIELDS = {
+    "knowledge_id": models.PayloadSchemaType.INTEGER,
+    "chunk_index": models.PayloadSchemaType.INTEGER,
+    "user_id": models.PayloadSchemaType.INTEGER,
+    "topic_id": models.PayloadSchemaType.INTEGER,
+    "tag_ids": models.PayloadSchemaType.INTEGER,
+    # str(user_id); with is_tenant Qdrant co-locates each tenant's points on disk.
+    "tenant": models.KeywordIndexParams(type=models.KeywordIndexType.KEYWORD, is_tenant=True),
+}
+
+# Suffix of per-user collections, e.g. "knowledge_u42" for user 42.
+DEDICATED_SUFFIX = re.compile(r"_u(\d+)$")
+
+
+@dataclass(frozen=True)
+class StorageProfile:
+    """How the dense vectors and HNSW graph are stored, and how they are searched."""
+
+    on_disk: bool
+    hnsw: models.HnswConfigDiff
+    optimizers: models.OptimizersConfigDiff
+    quantization: models.QuantizationConfig | None = None
+    search_params: models.SearchParams | None = None
+
+
+# memmap_threshold is in KB per segment; 0 keeps every segment in RAM.
+STORAGE_PROFILES = {
+    # Full vectors and graph in RAM, int8 copies for the first pass. Lowest latency.
+    "fast": StorageProfile(
+        on_disk=False,
+        hnsw=models.HnswConfigDiff(m=32, ef_construct=256, on_disk=False),
+        optimizers=models.OptimizersConfigDiff(memmap_threshold=0),
+        quantization=models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            ),
+        ),
+    ),
+    # 1-bit vectors in RAM, full vectors on disk and only read to rescore the
+    # oversampled candidates. ~32x less RAM per vector than float32.
+    "compact": StorageProfile(
+        on_disk=True,
+        hnsw=models.HnswConfigDiff(m=16, ef_construct=128, on_disk=False),
+        optimizers=models.OptimizersConfigDiff(memmap_threshold=20000),
+        quantization=models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=True),
+        ),
+        search_params=models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=SETTINGS.QDRANT_OVERSAMPLING,
+            ),
+        ),
+    ),
+    # Full-precision vectors on disk, no quantization.
+    "disk": StorageProfile(
+        on_disk=True,
+        hnsw=models.HnswConfigDiff(m=16, ef_construct=100),
+        optimizers=models.OptimizersConfigDiff(memmap_threshold=20000),
+    ),
+}
 
 
 class Qdrant:
-    def __init__(self):
+    def __init__(self, prefer_grpc: bool | None = None):
         self.prefix = "hp"
         self.mode = SETTINGS.QDRANT_MODE.lower()
 
+        self._sparse_support: dict[str, bool] = {}
+        # Collections created or checked by ensure_collection in this process
+        self._ready: set[str] = set()
+        self.dedicated_tenants = set(SETTINGS.QDRANT_DEDICATED_TENANTS)
+
+        profile_name = SETTINGS.QDRANT_STORAGE_PROFILE.lower()
+        if profile_name not in STORAGE_PROFILES:
+            raise ValueError(f"Invalid QDRANT_STORAGE_PROFILE: {profile_name}")
+        self.profile = STORAGE_PROFILES[profile_name]
+        # Local mode is brute-force only and warns on every query given search params.
+        self.search_params = self.profile.search_params if self.mode == "docker" else None
+        log.info(f"Storage profile: {profile_name}")
+
         if self.mode == "local":
             storage_path: Path = SETTINGS.QDRANT_LOCAL_PATH
             storage_path.mkdir(parents=True, exist_ok=True)
             log.info(f"Using LOCAL storage: {storage_path}")
 
-            self.client = QClient(path=str(storage_path))
+            self.client = AsyncQdrantClient(path=str(storage_path))
 
         elif self.mode == "docker":
             url = SETTINGS.QDRANT_URL
-            log.info(f"Using REMOTE/DOCKER: {url}")
-            self.client = QClient(url=url)
+            prefer_grpc = SETTINGS.QDRANT_PREFER_GRPC if prefer_grpc is None else prefer_grpc
+            if prefer_grpc:
+                log.info(f"Using REMOTE/DOCKER: {url} (gRPC port {SETTINGS.QDRANT_GRPC_PORT})")
+            else:
+                log.info(f"Using REMOTE/DOCKER: {url}")
+            self.client = AsyncQdrantClient(
+                url=url,
+                prefer_grpc=prefer_grpc,
+                grpc_port=SETTINGS.QDRANT_GRPC_PORT,
+                timeout=SETTINGS.QDRANT_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=SETTINGS.QDRANT_POOL_SIZE,
+                    max_keepalive_connections=SETTINGS.QDRANT_KEEPALIVE,
+                    keepalive_expiry=SETTINGS.QDRANT_KEEPALIVE_EXPIRY,
+                ),
+            )
 
         else:
             raise ValueError(f"Invalid QDRANT_MODE: {self.mode}")
 
+    async def close(self):
+        await self.client.close()
+
     def _full_name(self, name: str):
         return f"{self.prefix}_{name}"
 
-    def _create_points(self, items: list[dict]):
+    @staticmethod
+    def dedicated_collection(name: str, user_id: int) -> str:
+        return f"{name}_u{user_id}"
+
+    def collection_for(self, user_id: int, name: str = "knowledge") -> str:
+        """Collection holding `user_id`'s points: a dedicated one for large tenants, else the shared one."""
+        if user_id in self.dedicated_tenants:
+            return self.dedicated_collection(name, user_id)
+        return name
+
+    def _hnsw_config(self, cname: str) -> models.HnswConfigDiff:
+        """
+        Shared collections build one HNSW graph per tenant (payload_m) and no
+        global graph (m=0), so a search filtered by tenant only walks that
+        tenant's graph. Dedicated collections keep the profile's global graph.
+        """
+        hnsw = self.profile.hnsw
+        if not SETTINGS.QDRANT_TENANT_PARTITIONING or DEDICATED_SUFFIX.search(cname):
+            return hnsw
+        return hnsw.model_copy(update={"m": 0, "payload_m": hnsw.m})
+
+    @staticmethod
+    def _sparse_vector(weights: dict[int, float]) -> models.SparseVector:
+        return models.SparseVector(indices=list(weights), values=list(weights.values()))
+
+    def _create_points(self, items: list[dict], sparse: bool = False):
         return [
             PointStruct(
                 id=item["id"],
-                vector=item["vector"],
-                payload={"text": item["text"], "metadata": item["metadata"]},
+                vector=(
+                    {
+                        "": item["vector"],
+                        SPARSE_VECTOR_NAME: self._sparse_vector(item["sparse"]),
+                    }
+                    if sparse and item.get("sparse")
+                    else item["vector"]
+                ),
+                payload=item["payload"],
             )
             for item in items
         ]
 
-    def create_collection(self, name: str, dim: int):
+    @staticmethod
+    def _field_condition(key: str, value) -> models.FieldCondition:
+        if isinstance(value, models.Range):
+            return models.FieldCondition(key=key, range=value)
+        if isinstance(value, list):
+            # Any of the listed values, e.g. several knowledge ids at once
+            return models.FieldCondition(key=key, match=models.MatchAny(any=value))
+        return models.FieldCondition(key=key, match=models.MatchValue(value=value))
+
+    def _build_filter(self, filters: dict | None) -> models.Filter | None:
+        if not filters:
+            return None
+
+        return models.Filter(must=[self._field_condition(k, v) for k, v in filters.items()])
+
+    async def _create_payload_indexes(self, cname: str, existing: set[str] | None = None):
+        existing = existing or set()
+        if "metadata.id" not in existing:
+            await self.client.create_payload_index(
+                collection_name=cname,
+                field_name="metadata.id",
+                field_schema=models.KeywordIndexParams(
+                    type=models.KeywordIndexType.KEYWORD,
+                    on_disk=True,
+                ),
+            )
+
+        for field_name, schema in FILTER_FIELDS.items():
+            if field_name in existing:
+                continue
+            await self.client.create_payload_index(
+                collection_name=cname,
+                field_name=field_name,
+                field_schema=schema,
+            )
+            log.info(f"Payload index created: {cname}.{field_name}")
+
+    def _record_sparse(self, cname: str, config: models.CollectionConfig) -> bool:
+        supported = SPARSE_VECTOR_NAME in (config.params.sparse_vectors or {})
+        if not supported:
+            log.warning(f"Collection {cname} has no sparse vectors; re-create it to enable sparse/hybrid search")
+        self._sparse_support[cname] = supported
+        return supported
+
+    async def create_collection(self, name: str, dim: int):
         cname = self._full_name(name)
 
-        self.client.create_collection(
+        await self.client.create_collection(
             collection_name=cname,
             vectors_config=models.VectorParams(
                 size=dim,
                 distance=models.Distance.COSINE,
-                on_disk=True,
+                on_disk=self.profile.on_disk,
             ),
-            hnsw_config=models.HnswConfigDiff(m=16),
+            sparse_vectors_config={
+                SPARSE_VECTOR_NAME: models.SparseVectorParams(
+                    index=models.SparseIndexParams(on_disk=True),
+                    modifier=models.Modifier.IDF,
+                ),
+            },
+            hnsw_config=self._hnsw_config(cname),
+            optimizers_config=self.profile.optimizers,
+            quantization_config=self.profile.quantization,
         )
+        self._sparse_support[cname] = True
 
-        self.client.create_payload_index(
-            collection_name=cname,
-            field_name="metadata.id",
-            field_schema=models.KeywordIndexParams(
-                type=models.KeywordIndexType.KEYWORD,
-                on_disk=True,
-            ),
-        )
+        await self._create_payload_indexes(cname)
+        self._ready.add(cname)
 
         log.info(f"Collection created: {cname}")
 
-    def has_collection(self, name: str) -> bool:
+    async def ensure_collection(self, name: str, dim: int):
+        """
+        Create the collection, or check an existing one against `dim` and the
+        cosine distance, add missing payload indexes and apply the storage
+        profile. Idempotent. The outcome is kept in process so writes need no
+        existence check; raises ValueError when the vector schema does not match.
+        """
         cname = self._full_name(name)
-        return self.client.collection_exists(cname)
+        if not await self.client.collection_exists(cname):
+            await self.create_collection(name, dim)
+            return
+
+        info = await self.client.get_collection(cname)
+        vectors = info.config.params.vectors
+        if isinstance(vectors, dict):
+            vectors = vectors.get("")
+        if vectors is None or vectors.size != dim or vectors.distance != models.Distance.COSINE:
+            found = f"{vectors.size}-dim {vectors.distance.value}" if vectors else "no default vector"
+            raise ValueError(
+                f"Collection {cname} has {found}, but the embedding model needs {dim}-dim Cosine; "
+                f"rebuild it with `hippobox reindex --recreate` (or delete {cname})"
+            )
+
+        # Payload indexes and storage settings have no effect in local mode.
+        if self.mode == "docker":
+            await self._create_payload_indexes(cname, existing=set(info.payload_schema or {}))
+            await self._apply_storage_profile(cname, info.config)
+
+        self._record_sparse(cname, info.config)
+        self._ready.add(cname)
+        log.info(f"Collection ready: {cname} ({dim}-dim)")
+
+    async def _apply_storage_profile(self, cname: str, config: models.CollectionConfig) -> bool:
+        """
+        Move an existing collection to the configured storage profile. Qdrant
+        rebuilds the affected segments in the background; returns False when the
+        collection already matches.
+        """
+        profile = self.profile
+        hnsw = self._hnsw_config(cname)
+
+        current_quantization = config.quantization_config
+        if profile.quantization is None:
+            same_quantization = current_quantization is None
+        else:
+            same_quantization = type(current_quantization) is type(profile.quantization)
+
+        vectors = config.params.vectors
+        on_disk = vectors.on_disk if isinstance(vectors, models.VectorParams) else None
+        if (
+            same_quantization
+            and bool(on_disk) == profile.on_disk
+            and config.hnsw_config.m == hnsw.m
+            and config.hnsw_config.ef_construct == hnsw.ef_construct
+            and config.hnsw_config.payload_m == hnsw.payload_m
+        ):
+            return False
+
+        await self.client.update_collection(
+            collection_name=cname,
+            vectors_config={"": models.VectorParamsDiff(on_disk=profile.on_disk)},
+            hnsw_config=hnsw,
+            optimizers_config=profile.optimizers,
+            quantization_config=profile.quantization or models.Disabled.DISABLED,
+        )
+        log.info(f"Storage profile applied to {cname}; segments will be re-optimized")
+        return True
+
+    async def has_sparse(self, name: str) -> bool:
+        """Whether the collection was created with the BM25 sparse vector."""
+        cname = self._full_name(name)
+        if cname not in self._sparse_support:
+            info = await self.client.get_collection(cname)
+            return self._record_sparse(cname, info.config)
+        return self._sparse_support[cname]
 
-    def delete_collection(self, name: str):
+    async def has_collection(self, name: str) -> bool:
         cname = self._full_name(name)
-        return self.client.delete_collection(collection_name=cname)
+        return await self.client.collection_exists(cname)
 
-    def insert(self, name: str, items: list[dict]):
-        dim = len(items[0]["vector"])
-        if not self.has_collection(name):
-            self.create_collection(name, dim)
+    async def _aliases(self) -> dict[str, str]:
+        """Alias name -> collection name, both with prefix."""
+        return {a.alias_name: a.collection_name for a in (await self.client.get_aliases()).aliases}
 
-        points = self._create_points(items)
+    async def delete_collection(self, name: str):
+        """Delete the collection, or the collection behind it when `name` is an alias."""
         cname = self._full_name(name)
+        self._sparse_support.pop(cname, None)
+        self._ready.discard(cname)
+        target = (await self._aliases()).get(cname, cname)
+        return await self.client.delete_collection(collection_name=target)
+
+    async def create_build(self, name: str, dim: int) -> str:
+        """
+        Create an empty collection to rebuild `name` into while `name` keeps
+        serving; `swap_alias` puts it live. The build keeps the dedicated-tenant
+        suffix of `name`, e.g. "knowledge_r1700000000000_u42" for "knowledge_u42".
+        """
+        match = DEDICATED_SUFFIX.search(name)
+        base, suffix = (name[: match.start()], match.group(0)) if match else (name, "")
+        build = f"{base}_r{int(time.time() * 1000)}{suffix}"
+        await self.create_collection(build, dim)
+        return build
+
+    async def swap_alias(self, name: str, build: str):
+        """
+        Point the alias `name` at the collection `build` in one alias update,
+        then delete the collection it served before. A collection created
+        before aliases were used holds the name itself and is deleted first.
+        """
+        alias, target = self._full_name(name), self._full_name(build)
+        old = (await self._aliases()).get(alias)
+
+        operations = [
+            models.CreateAliasOperation(create_alias=models.CreateAlias(collection_name=target, alias_name=alias))
+        ]
+        if old is not None:
+            operations.insert(0, models.DeleteAliasOperation(delete_alias=models.DeleteAlias(alias_name=alias)))
+        elif await self.client.collection_exists(alias):
+            await self.client.delete_collection(collection_name=alias)
+        await self.client.update_collection_aliases(change_aliases_operations=operations)
+        if old is not None and old != target:
+            await self.client.delete_collection(collection_name=old)
+
+        self._sparse_support.pop(alias, None)
+        self._ready.discard(alias)
+        log.info(f"Alias {alias} now serves {target}")
+
+    async def insert(self, name: str, items: list[dict], batch_size: int | None = None, wait: bool = False):
+        """Bulk write as a sequence of upserts of at most `batch_size` (QDRANT_UPLOAD_BATCH_SIZE) points each."""
+        if not items:
+            return
+        if self._full_name(name) not in self._ready:
+            # Normally provisioned at startup; this only covers ad-hoc collections.
+            await self.ensure_collection(name, len(items[0]["vector"]))
+
+        sparse = await self.has_sparse(name)
+        cname = self._full_name(name)
+        batch_size = batch_size or SETTINGS.QDRANT_UPLOAD_BATCH_SIZE
 
-        self.client.upload_points(cname, points)
+        # AsyncQdrantClient.upload_points is synchronous, so batches are sent as awaited upserts.
+        for start in range(0, len(items), batch_size):
+            points = self._create_points(items[start : start + batch_size], sparse=sparse)
+            await self.client.upsert(cname, points, wait=wait)
 
-    def upsert(self, name: str, items: list[dict]):
-        dim = len(items[0]["vector"])
-        if not self.has_collection(name):
-            self.create_collection(name, dim)
+    async def upsert(self, name: str, items: list[dict]):
+        if self._full_name(name) not in self._ready:
+            # Normally provisioned at startup; this only covers ad-hoc collections.
+            await self.ensure_collection(name, len(items[0]["vector"]))
 
-        points = self._create_points(items)
+        points = self._create_points(items, sparse=await self.has_sparse(name))
         cname = self._full_name(name)
 
-        return self.client.upsert(cname, points)
+        return await self.client.upsert(cname, points)
 
-    def delete(self, name: str, ids: list[str]):
+    async def delete(self, name: str, ids: list[str]):
         cname = self._full_name(name)
-        return self.client.delete(
+        return await self.client.delete(
             collection_name=cname,
             points_selector=models.PointIdsList(points=ids),
         )
 
-    def search(self, name: str, vector: list[float], limit: int = 5):
+    async def set_payload(
+        self,
+        name: str,
+        payload: dict,
+        filters: dict | None = None,
+        ids: list | None = None,
+    ):
+        cname = self._full_name(name)
+        return await self.client.set_payload(
+            collection_name=cname,
+            payload=payload,
+            points=ids if ids is not None else self._build_filter(filters),
+        )
+
+    async def set_payloads(self, name: str, payloads: dict[int, dict], key: str | None = None):
+        """
+        Set a different payload on each point in a single request. With `key`,
+        each dict key selects the points whose payload field `key` equals it
+        (e.g. every chunk of a knowledge entry) instead of a point id.
+        """
         cname = self._full_name(name)
-        result = self.client.query_points(
+        return await self.client.batch_update_points(
             collection_name=cname,
-            query=vector,
+            update_operations=[
+                models.SetPayloadOperation(
+                    set_payload=(
+                        models.SetPayload(payload=payload, points=[point_id])
+                        if key is None
+                        else models.SetPayload(payload=payload, filter=self._build_filter({key: point_id}))
+                    ),
+                )
+                for point_id, payload in payloads.items()
+            ],
+        )
+
+    async def scroll(
+        self,
+        name: str,
+        filters: dict | models.Filter | None = None,
+        page_size: int | None = None,
+        with_payload: bool | list[str] = True,
+        with_vectors: bool = False,
+    ) -> AsyncIterator[list[models.Record]]:
+        """
+        Stream the points matching `filters` one page at a time, following
+        `next_page_offset`, so only a single page is held in memory.
+        """
+        cname = self._full_name(name)
+        scroll_filter = filters if isinstance(filters, models.Filter) else self._build_filter(filters)
+
+        offset = None
+        while True:
+            points, offset = await self.client.scroll(
+                collection_name=cname,
+                scroll_filter=scroll_filter,
+                limit=page_size or SETTINGS.QDRANT_SCROLL_PAGE_SIZE,
+                offset=offset,
+                with_payload=with_payload,
+                with_vectors=with_vectors,
+            )
+            if points:
+                yield points
+            if offset is None:
+                return
+
+    async def scroll_missing(
+        self,
+        name: str,
+        field_name: str,
+        page_size: int | None = None,
+        with_payload: bool | list[str] = False,
+    ) -> AsyncIterator[list[models.Record]]:
+        """Stream the points that do not have `field_name` in their payload, one page at a time."""
+        missing = models.Filter(
+            must=[models.IsEmptyCondition(is_empty=models.PayloadField(key=field_name))],
+        )
+        async for points in self.scroll(name, missing, page_size=page_size, with_payload=with_payload):
+            yield points
+
+    async def move_points(self, src: str, dst: str, filters: dict | None = None, page_size: int | None = None) -> int:
+        """
+        Move the points matching `filters` from `src` to `dst` (which must
+        exist), page by page. Each page is written before it is deleted, so an
+        interrupted move can simply be run again.
+        """
+        src_name, dst_name = self._full_name(src), self._full_name(dst)
+        dst_sparse = await self.has_sparse(dst)
+
+        moved = 0
+        async for points in self.scroll(src, filters, page_size=page_size, with_vectors=True):
+            await self.client.upsert(
+                dst_name,
+                [
+                    PointStruct(
+                        id=p.id,
+                        vector=p.vector[""] if isinstance(p.vector, dict) and not dst_sparse else p.vector,
+                        payload=p.payload,
+                    )
+                    for p in points
+                ],
+            )
+            await self.client.delete(
+                collection_name=src_name,
+                points_selector=models.PointIdsList(points=[p.id for p in points]),
+            )
+            moved += len(points)
+        return moved
+
+    async def list_collections(self) -> list[str]:
+        """Names (without prefix) of this app's collections; a collection behind an alias is listed by the alias."""
+        prefix = f"{self.prefix}_"
+        aliases = await self._aliases()
+        served = set(aliases.values())
+        names = [c.name for c in (await self.client.get_collections()).collections if c.name not in served]
+        return [name[len(prefix) :] for name in [*names, *aliases] if name.startswith(prefix)]
+
+    async def delete_where(self, name: str, filters: dict):
+        cname = self._full_name(name)
+        return await self.client.delete(
+            collection_name=cname,
+            points_selector=models.FilterSelector(filter=self._build_filter(filters)),
+        )
+
+    async def delete_stale_chunks(self, name: str, chunk_counts: dict[int, int]):
+        """
+        Remove, in a single request, the chunk points of each knowledge entry
+        beyond its current chunk count (`chunk_counts` maps knowledge_id to count).
+        """
+        cname = self._full_name(name)
+        return await self.client.batch_update_points(
+            collection_name=cname,
+            update_operations=[
+                models.DeleteOperation(
+                    delete=models.FilterSelector(
+                        filter=self._build_filter({"knowledge_id": kid, "chunk_index": models.Range(gte=count)}),
+                    ),
+                )
+                for kid, count in chunk_counts.items()
+            ],
+        )
+
+    def _build_query(
+        self,
+        vector: list[float] | None,
+        sparse_vector: dict[int, float] | None,
+        query_filter: models.Filter | None,
+        limit: int,
+    ) -> dict:
+        if vector is not None and sparse_vector is not None:
+            # Hybrid: fetch candidates from both indexes, fuse by reciprocal rank.
+            prefetch_limit = limit * SETTINGS.SEARCH_PREFETCH_FACTOR
+            return {
+                "prefetch": [
+                    models.Prefetch(
+                        query=vector,
+                        filter=query_filter,
+                        limit=prefetch_limit,
+                        params=self.search_params,
+                    ),
+                    models.Prefetch(
+                        query=self._sparse_vector(sparse_vector),
+                        using=SPARSE_VECTOR_NAME,
+                        filter=query_filter,
+                        limit=prefetch_limit,
+                    ),
+                ],
+                "query": models.FusionQuery(fusion=models.Fusion.RRF),
+            }
+
+        if sparse_vector is not None:
+            return {
+                "query": self._sparse_vector(sparse_vector),
+                "using": SPARSE_VECTOR_NAME,
+            }
+
+        return {"query": vector, "search_params": self.search_params}
+
+    async def search(
+        self,
+        name: str,
+        vector: list[float] | None,
+        limit: int = 5,
+        filters: dict | None = None,
+        group_by: str | None = None,
+        sparse_vector: dict[int, float] | None = None,
+        with_payload: bool | list[str] = True,
+    ):
+        """
+        Dense search with `vector`, sparse search with `sparse_vector`, or a
+        fused hybrid search when both are given.
+
+        `with_payload=False` returns ids and scores only (documents and
+        metadatas are None), a list returns just those payload fields; either
+        keeps the chunk text out of the response.
+        """
+        cname = self._full_name(name)
+        query_filter = self._build_filter(filters)
+        query = self._build_query(vector, sparse_vector, query_filter, limit)
+
+        if group_by:
+            # One (best-scoring) point per group, e.g. one chunk per knowledge entry.
+            result = await self.client.query_points_groups(
+                collection_name=cname,
+                query_filter=query_filter,
+                group_by=group_by,
+                limit=limit,
+                group_size=1,
+                with_payload=with_payload,
+                **query,
+            )
+            groups = [g for g in result.groups if g.hits]
+            hits = [g.hits[0] for g in groups]
+            return {
+                "ids": [g.id for g in groups],
+                "documents": [(h.payload or {}).get("text") for h in hits],
+                "metadatas": [(h.payload or {}).get("metadata") for h in hits],
+                "scores": [h.score for h in hits],
+            }
+
+        result = await self.client.query_points(
+            collection_name=cname,
+            query_filter=query_filter,
             limit=limit,
+            with_payload=with_payload,
+            **query,
         )
 
         points = result.points
         return {
             "ids": [p.id for p in points],
-            "documents": [p.payload.get("text") for p in points],
-            "metadatas": [p.payload.get("metadata") for p in points],
+            "documents": [(p.payload or {}).get("text") for p in points],
+            "metadatas": [(p.payload or {}).get("metadata") for p in points],
             "scores": [p.score for p in points],
         }
 
-    def query(self, name: str, filter_dict: dict):
-        cname = self._full_name(name)
-
+    async def query(self, name: str, filter_dict: dict, page_size: int | None = None) -> AsyncIterator[dict]:
+        """Stream points whose metadata matches any of `filter_dict`, one page at a time."""
         conditions = [
             models.FieldCondition(
                 key=f"metadata.{k}",
@@ -131,22 +656,18 @@ class Qdrant:
             for k, v in filter_dict.items()
         ]
 
-        scroll_res = self.client.scroll(
-            collection_name=cname,
-            scroll_filter=models.Filter(should=conditions),
-            limit=NO_LIMIT,
-        )
-
-        points = scroll_res[0]
-        return {
-            "ids": [p.id for p in points],
-            "documents": [p.payload.get("text") for p in points],
-            "metadatas": [p.payload.get("metadata") for p in points],
-        }
+        async for points in self.scroll(name, models.Filter(should=conditions), page_size=page_size):
+            yield {
+                "ids": [p.id for p in points],
+                "documents": [p.payload.get("text") for p in points],
+                "metadatas": [p.payload.get("metadata") for p in points],
+            }
 
-    def reset(self):
-        col_list = self.client.get_collections().collections
+    async def reset(self):
+        col_list = (await self.client.get_collections()).collections
         for col in col_list:
             if col.name.startswith(self.prefix):
-                self.client.delete_collection(col.name)
+                await self.client.delete_collection(col.name)
                 log.info(f"Deleted: {col.name}")
+        self._sparse_support.clear()
+        self._ready.clear()
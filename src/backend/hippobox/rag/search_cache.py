@@ -0,0 +1,115 @@
+import hashlib
+import json
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from hippobox.core.metrics import METRICS
+from hippobox.core.redis import RedisManager
+from hippobox.core.settings import SETTINGS
+
+log = logging.getLogger("knowledge")
+
+
+class SearchCache:
+    """
+    Per-user cache of search results stored in Redis.
+
+    Keys embed a per-user version number. Any write to a user's knowledge
+    bumps the version, which makes every cached result of that user
+    unreachable at once (old keys simply expire), so no key scanning is
+    needed.
+
+    A search reads its key, and so the version, once before it runs and
+    stores its results under that same key. Writers bump the version after
+    their SQL and Qdrant writes are done (see `invalidating`). Results of a
+    search that overlapped a write therefore land under a version that is
+    already outdated and are never served.
+    """
+
+    def __init__(self, ttl: int = 300, enabled: bool = True):
+        self.ttl = ttl
+        self.enabled = enabled
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return f"search_version:{user_id}"
+
+    @staticmethod
+    def _result_key(user_id: int, version: str, params: dict) -> str:
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+        return f"search:{user_id}:{version}:{digest}"
+
+    async def key(self, user_id: int, params: dict) -> str | None:
+        """
+        Key of `params` at the user's current version, to pass to both `get`
+        and `set` of one search. None when caching is off or Redis is down.
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            redis = await RedisManager.get_client()
+            version = await redis.get(self._version_key(user_id)) or "0"
+        except Exception as e:
+            log.warning(f"Search cache lookup failed: {e}")
+            METRICS.incr("search_cache_misses")
+            return None
+        return self._result_key(user_id, version, params)
+
+    async def get(self, key: str | None) -> list[dict] | None:
+        if key is None:
+            return None
+
+        try:
+            redis = await RedisManager.get_client()
+            raw = await redis.get(key)
+        except Exception as e:
+            log.warning(f"Search cache lookup failed: {e}")
+            raw = None
+
+        METRICS.incr("search_cache_hits" if raw is not None else "search_cache_misses")
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str | None, results: list[dict]):
+        if key is None:
+            return
+
+        try:
+            redis = await RedisManager.get_client()
+            await redis.set(key, json.dumps(results), ex=self.ttl)
+        except Exception as e:
+            log.warning(f"Search cache write failed: {e}")
+
+    async def invalidate(self, user_id: int):
+        if not self.enabled:
+            return
+
+        try:
+            redis = await RedisManager.get_client()
+            await redis.incr(self._version_key(user_id))
+        except Exception as e:
+            log.warning(f"Search cache invalidation failed for user {user_id}: {e}")
+
+    @asynccontextmanager
+    async def invalidating(self, user_id: int) -> AsyncIterator[None]:
+        """Wrap a user's SQL/Qdrant writes; the version is bumped once they finish, even if they fail."""
+        try:
+            yield
+        finally:
+            await self.invalidate(user_id)
+
+    def stats(self) -> dict:
+        hits = METRICS.get("search_cache_hits")
+        misses = METRICS.get("search_cache_misses")
+        lookups = hits + misses
+        return {
+            "enabled": self.enabled,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+
+SEARCH_CACHE = SearchCache(ttl=SETTINGS.SEARCH_CACHE_TTL, enabled=SETTINGS.SEARCH_CACHE_ENABLED)
+METRICS.register("search_cache", SEARCH_CACHE.stats)
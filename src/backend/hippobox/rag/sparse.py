@@ -0,0 +1,50 @@
+import hashlib
+import re
+from collections import Counter
+from functools import lru_cache
+
+# Keeps identifiers such as `--dry-run`, `ERR_CONN_RESET`, `v1.2.3` or
+# `app/server.py` intact; their parts are indexed as separate terms too.
+TERM_PATTERN = re.compile(r"-{0,2}\w[\w\-.:/]*\w|\w")
+PART_SPLIT_PATTERN = re.compile(r"[\-_.:/]+")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+@lru_cache(maxsize=65536)
+def term_index(term: str) -> int:
+    """Stable 32-bit index of a term in the sparse vector space."""
+    return int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+def tokenize(text: str) -> list[str]:
+    terms: list[str] = []
+    for match in TERM_PATTERN.findall(text.lower()):
+        terms.append(match)
+        parts = [part for part in PART_SPLIT_PATTERN.split(match) if part]
+        if parts != [match]:
+            terms.extend(parts)
+    return terms
+
+
+def encode_document(text: str, avg_length: float = 256.0) -> dict[int, float]:
+    """
+    BM25 term-frequency weights for a document. The IDF half of BM25 is
+    applied by Qdrant at query time (sparse vector `Modifier.IDF`), so the
+    vectors stay valid as the corpus grows.
+    """
+    terms = tokenize(text)
+    if not terms:
+        return {}
+
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * len(terms) / avg_length)
+    weights: dict[int, float] = {}
+    for term, tf in Counter(terms).items():
+        index = term_index(term)
+        weights[index] = weights.get(index, 0.0) + tf * (BM25_K1 + 1) / (tf + norm)
+    return weights
+
+
+def encode_query(text: str) -> dict[int, float]:
+    return {term_index(term): 1.0 for term in set(tokenize(text))}
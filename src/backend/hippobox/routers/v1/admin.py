@@ -23,6 +23,17 @@ async def list_users(
         raise exceptions_to_http(e)
 
 
+@router.get("/metrics")
+async def get_metrics(
+    _: UserResponse = Depends(require_admin),
+    service: AdminService = Depends(get_admin_service),
+):
+    """
+    Retrieve in-process runtime metrics such as cache hit ratios (admin-only).
+    """
+    return service.get_metrics()
+
+
 @router.delete("/users/{user_id}")
 async def delete_user(
     user_id: int = Path(..., description="ID of the user to delete"),
@@ -1,17 +1,33 @@
 from enum import Enum
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 
 from hippobox.core.settings import SETTINGS
 from hippobox.errors.knowledge import KnowledgeException
 from hippobox.errors.service import exceptions_to_http
-from hippobox.models.knowledge import KnowledgeForm, KnowledgeResponse, KnowledgeUpdate
+from hippobox.models.knowledge import (
+    KnowledgeBulkCreate,
+    KnowledgeBulkDelete,
+    KnowledgeBulkResponse,
+    KnowledgeBulkUpdate,
+    KnowledgeForm,
+    KnowledgePage,
+    KnowledgeResponse,
+    KnowledgeSummaryPage,
+    KnowledgeUpdate,
+    ListView,
+    SearchMode,
+)
 from hippobox.models.user import UserResponse
 from hippobox.services.knowledge import KnowledgeService, get_knowledge_service
 from hippobox.utils.auth import get_current_user
 
 router = APIRouter()
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
 
 class OperationID(str, Enum):
     search_knowledge = "search_knowledge"
@@ -22,6 +38,9 @@ class OperationID(str, Enum):
     get_knowledge_by_tag = "get_knowledge_by_tag"
     update_knowledge = "update_knowledge"
     delete_knowledge = "delete_knowledge"
+    create_knowledge_bulk = "create_knowledge_bulk"
+    update_knowledge_bulk = "update_knowledge_bulk"
+    delete_knowledge_bulk = "delete_knowledge_bulk"
 
 
 # -----------------------------
@@ -38,6 +57,7 @@ async def search_knowledge(
     topic: str | None = None,
     tag: str | None = None,
     limit: int = 1,
+    mode: SearchMode = SearchMode.dense,
     current_user: UserResponse = Depends(get_current_user),
     service: KnowledgeService = Depends(get_knowledge_service),
 ):
@@ -50,13 +70,16 @@ async def search_knowledge(
         topic (str | None = None): Optional topic filter.
         tag (str | None = None): Optional tag filter.
         limit (int = 1): Number of search results to return.
+        mode (SearchMode = dense): "dense" (semantic), "sparse" (keyword/BM25,
+            best for exact identifiers such as error codes or CLI flags) or
+            "hybrid" (both, fused by rank).
 
     ### Returns:
 
         knowledge (KnowledgeResponse): The successfully retrieved knowledge object.
 
     This endpoint performs vector similarity search on Qdrant
-    and returns ranked knowledge entries.
+    and returns ranked knowledge entries, one per entry.
     """
     try:
         return await service.search(
@@ -65,6 +88,7 @@ async def search_knowledge(
             topic=topic,
             tag=tag,
             limit=limit,
+            mode=mode,
         )
     except KnowledgeException as e:
         raise exceptions_to_http(e)
@@ -102,29 +126,162 @@ async def create_knowledge(
         raise exceptions_to_http(e)
 
 
+# -----------------------------
+# Bulk
+# -----------------------------
+@router.post("/bulk", response_model=KnowledgeBulkResponse, operation_id=OperationID.create_knowledge_bulk)
+async def create_knowledge_bulk(
+    form: KnowledgeBulkCreate,
+    current_user: UserResponse = Depends(get_current_user),
+    service: KnowledgeService = Depends(get_knowledge_service),
+):
+    """
+    Create many knowledge entries in one request.
+
+    Each item takes the same fields as a single create (topic, tags,
+    title, content). Prefer this over repeated single creates when
+    importing notes.
+
+    ### Returns:
+
+        One result per item, in request order: "created" with the new
+        entry, or "failed" with an error code (e.g. TITLE_EXISTS when the
+        title is taken or repeated in the request).
+
+    All entries are written in one SQL transaction and embedded and
+    indexed together.
+    """
+    try:
+        return await service.create_knowledge_bulk(current_user.id, form.items)
+    except KnowledgeException as e:
+        raise exceptions_to_http(e)
+
+
+@router.put("/bulk", response_model=KnowledgeBulkResponse, operation_id=OperationID.update_knowledge_bulk)
+async def update_knowledge_bulk(
+    form: KnowledgeBulkUpdate,
+    current_user: UserResponse = Depends(get_current_user),
+    service: KnowledgeService = Depends(get_knowledge_service),
+):
+    """
+    Update many knowledge entries in one request.
+
+    Each item holds the `id` of the entry plus any of the updatable fields
+    (title, content, topic, tags); omitted fields are left as they are.
+
+    ### Returns:
+
+        One result per item, in request order: "updated", "unchanged" or
+        "failed" with an error code (NOT_FOUND, DUPLICATE_ID, TITLE_EXISTS).
+
+    Changes are written in one SQL transaction; only entries whose content
+    changed are re-embedded.
+    """
+    try:
+        return await service.update_knowledge_bulk(current_user.id, form.items)
+    except KnowledgeException as e:
+        raise exceptions_to_http(e)
+
+
+@router.post("/bulk/delete", response_model=KnowledgeBulkResponse, operation_id=OperationID.delete_knowledge_bulk)
+async def delete_knowledge_bulk(
+    form: KnowledgeBulkDelete,
+    current_user: UserResponse = Depends(get_current_user),
+    service: KnowledgeService = Depends(get_knowledge_service),
+):
+    """
+    Delete many knowledge entries in one request.
+
+    ### Returns:
+
+        One result per id, in request order: "deleted" or "failed" with an
+        error code (NOT_FOUND, DUPLICATE_ID).
+
+    Removes the SQL rows in one transaction and their vectors from the
+    Qdrant index in one call.
+    """
+    try:
+        return await service.delete_knowledge_bulk(current_user.id, form.ids)
+    except KnowledgeException as e:
+        raise exceptions_to_http(e)
+
+
 # -----------------------------
 # Get: List All
 # -----------------------------
-@router.get("/list", response_model=list[KnowledgeResponse], operation_id=OperationID.get_knowledge_list)
+@router.get(
+    "/list",
+    response_model=KnowledgePage | KnowledgeSummaryPage,
+    operation_id=OperationID.get_knowledge_list,
+)
 async def get_knowledge_list(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    view: ListView = ListView.full,
     current_user: UserResponse = Depends(get_current_user),
     service: KnowledgeService = Depends(get_knowledge_service),
 ):
     """
-    Retrieve all stored knowledge entries.
+    Retrieve stored knowledge entries, one page at a time.
+
+    ### Args:
+
+        limit (int = 50): Entries per page (at most 200).
+        cursor (str | None = None): `next_cursor` of the previous page.
+        view (ListView = full): "full" returns the whole content, "summary"
+            only id, title, topic, tags, timestamps and a short excerpt
+            (much smaller; prefer it for browsing).
 
     ### Returns:
 
-        List of all knowledge entries sorted by creation date.
+        Page of knowledge entries, most recently updated first, and the
+        cursor of the next page (null on the last page).
 
     Useful for browsing or building UI item lists.
     """
     try:
-        return await service.get_knowledge_list(current_user.id)
+        return await service.get_knowledge_list(current_user.id, limit, cursor, view)
     except KnowledgeException as e:
         raise exceptions_to_http(e)
 
 
+# -----------------------------
+# Export
+# -----------------------------
+@router.get("/export", response_class=StreamingResponse)
+async def export_knowledge(
+    topic: str | None = None,
+    include_vectors: bool = False,
+    gzip: bool = False,
+    current_user: UserResponse = Depends(get_current_user),
+    service: KnowledgeService = Depends(get_knowledge_service),
+):
+    """
+    Download all of the user's knowledge entries as NDJSON, one entry per line.
+
+    ### Args:
+
+        topic (str | None = None): Only export entries under this topic.
+        include_vectors (bool = False): Add the stored chunk vectors of
+            each entry under "chunks".
+        gzip (bool = False): Compress the download with gzip.
+
+    The export is streamed from a database cursor, so it can be used on
+    knowledge bases of any size.
+    """
+    try:
+        stream = service.export_knowledge(current_user.id, topic, include_vectors, gzip)
+    except KnowledgeException as e:
+        raise exceptions_to_http(e)
+
+    filename = "hippobox-export.ndjson.gz" if gzip else "hippobox-export.ndjson"
+    return StreamingResponse(
+        stream,
+        media_type="application/gzip" if gzip else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 # -----------------------------
 # Get: By ID
 # -----------------------------
@@ -177,15 +334,23 @@ async def get_knowledge_by_title(
 # -----------------------------
 # Get: By Topic
 # -----------------------------
-@router.get("/topic/{topic}", response_model=list[KnowledgeResponse], operation_id=OperationID.get_knowledge_by_topic)
+@router.get(
+    "/topic/{topic}",
+    response_model=KnowledgePage | KnowledgeSummaryPage,
+    operation_id=OperationID.get_knowledge_by_topic,
+)
 async def get_by_topic(
     topic: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    view: ListView = ListView.full,
     current_user: UserResponse = Depends(get_current_user),
     service: KnowledgeService = Depends(get_knowledge_service),
 ):
     """
-    Retrieve all knowledge entries under a specific topic.
-    Topics group entries into categories.
+    Retrieve knowledge entries under a specific topic, one page at a time.
+    Topics group entries into categories. Paginated like `/list`, with the
+    same `view` option.
 
     Examples:
     - 'docker'
@@ -193,7 +358,7 @@ async def get_by_topic(
     - 'database'
     """
     try:
-        return await service.get_by_topic(current_user.id, topic)
+        return await service.get_by_topic(current_user.id, topic, limit, cursor, view)
     except KnowledgeException as e:
         raise exceptions_to_http(e)
 
@@ -201,15 +366,23 @@ async def get_by_topic(
 # -----------------------------
 # Get: By Tag
 # -----------------------------
-@router.get("/tag/{tag}", response_model=list[KnowledgeResponse], operation_id=OperationID.get_knowledge_by_tag)
+@router.get(
+    "/tag/{tag}",
+    response_model=KnowledgePage | KnowledgeSummaryPage,
+    operation_id=OperationID.get_knowledge_by_tag,
+)
 async def get_by_tag(
     tag: str,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    view: ListView = ListView.full,
     current_user: UserResponse = Depends(get_current_user),
     service: KnowledgeService = Depends(get_knowledge_service),
 ):
     """
-    Retrieve all knowledge entries associated with a given tag.
-    Tags represent keyword-level grouping, separate from topics.
+    Retrieve knowledge entries associated with a given tag, one page at a time.
+    Tags represent keyword-level grouping, separate from topics. Paginated
+    like `/list`, with the same `view` option.
 
     Examples:
     - 'server'
@@ -217,7 +390,7 @@ async def get_by_tag(
     - 'react'
     """
     try:
-        return await service.get_by_tag(current_user.id, tag)
+        return await service.get_by_tag(current_user.id, tag, limit, cursor, view)
     except KnowledgeException as e:
         raise exceptions_to_http(e)
 
@@ -241,8 +414,9 @@ async def update_knowledge(
     - topic
     - tags
 
-    After updating SQL, the embedding is regenerated
-    and re-indexed into Qdrant.
+    Only fields that actually changed are written. The embedding is
+    regenerated only when the content changes; title, topic and tag
+    changes update the Qdrant payload in place.
     """
     try:
         return await service.update_knowledge(current_user.id, knowledge_id, form)
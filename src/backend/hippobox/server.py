@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -9,12 +10,15 @@ from fastapi_mcp import FastApiMCP
 from hippobox.core.bootstrap_admin import ensure_admin_for_login_disabled, ensure_default_admin_from_settings
 from hippobox.core.database import dispose_db, init_db
 from hippobox.core.logging_config import setup_logger
+from hippobox.core.metrics import METRICS
 from hippobox.core.redis import RedisManager
 from hippobox.core.settings import SETTINGS
 from hippobox.rag.embedding import Embedding
 from hippobox.rag.qdrant import Qdrant
 from hippobox.routers.v1 import admin, api_key, auth, knowledge, topic
 from hippobox.routers.v1.knowledge import OperationID
+from hippobox.services.knowledge import KnowledgeService, backfill_vector_payloads, migrate_tenants
+from hippobox.services.reconcile import Reconciler
 
 log = logging.getLogger("hippobox")
 
@@ -42,6 +46,8 @@ async def lifespan(app: FastAPI):
     await ensure_admin_for_login_disabled()
     await ensure_default_admin_from_settings()
 
+    reconcile_task: asyncio.Task | None = None
+
     if SETTINGS.VDB_ENABLED:
         try:
             qdrant = Qdrant()
@@ -55,11 +61,36 @@ async def lifespan(app: FastAPI):
         try:
             embedding = Embedding()
             app.state.EMBEDDING = embedding
+            METRICS.register("embedding", embedding.stats)
             log.info("Embedding client initialized")
 
         except Exception as e:
             log.error(f"Embedding initialization failed: {e}")
             raise
+
+        try:
+            await qdrant.ensure_collection("knowledge", embedding.dimension)
+            for user_id in sorted(qdrant.dedicated_tenants):
+                await qdrant.ensure_collection(qdrant.collection_for(user_id), embedding.dimension)
+        except Exception as e:
+            log.error(f"Qdrant collection provisioning failed: {e}")
+            raise
+
+        try:
+            await backfill_vector_payloads(qdrant)
+        except Exception as e:
+            log.error(f"Qdrant payload backfill failed: {e}")
+
+        try:
+            await migrate_tenants(qdrant)
+        except Exception as e:
+            log.error(f"Qdrant tenant migration failed: {e}")
+
+        if SETTINGS.RECONCILE_INTERVAL > 0:
+            reconciler = Reconciler(KnowledgeService(embedding, qdrant, vdb_enabled=True))
+            METRICS.register("reconciler", reconciler.stats)
+            reconcile_task = asyncio.create_task(reconciler.run_forever(SETTINGS.RECONCILE_INTERVAL))
+            log.info(f"Reconciler scheduled every {SETTINGS.RECONCILE_INTERVAL:g}s")
     else:
         app.state.QDRANT = None
         app.state.EMBEDDING = None
@@ -69,6 +100,13 @@ async def lifespan(app: FastAPI):
     try:
         yield
     finally:
+        if reconcile_task is not None:
+            reconcile_task.cancel()
+            await asyncio.gather(reconcile_task, return_exceptions=True)
+        if app.state.EMBEDDING is not None:
+            await app.state.EMBEDDING.close()
+        if app.state.QDRANT is not None:
+            await app.state.QDRANT.close()
         await dispose_db()
         await RedisManager.close()
         log.info("HippoBox Server Lifespan Shutdown")
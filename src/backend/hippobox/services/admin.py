@@ -2,6 +2,7 @@ import logging
 
 from fastapi import Request
 
+from hippobox.core.metrics import METRICS
 from hippobox.core.redis import RedisManager
 from hippobox.errors.admin import AdminErrorCode, AdminException
 from hippobox.errors.service import raise_exception_with_log
@@ -26,6 +27,9 @@ class AdminService:
         except Exception as e:
             raise_exception_with_log(AdminErrorCode.LIST_USERS_FAILED, e)
 
+    def get_metrics(self) -> dict:
+        return METRICS.snapshot()
+
     async def delete_user(self, user_id: int) -> bool:
         try:
             deleted = await Users.delete(user_id)
@@ -0,0 +1,81 @@
+import json
+import zlib
+from collections import defaultdict
+from collections.abc import AsyncIterator
+
+from hippobox.models.knowledge import KnowledgeModel, Knowledges
+from hippobox.rag.qdrant import SPARSE_VECTOR_NAME, Qdrant
+
+# Rows fetched from the database cursor per round trip, and entries per line batch.
+EXPORT_BATCH_SIZE = 256
+
+
+def _to_record(knowledge: KnowledgeModel) -> dict:
+    return {
+        "id": knowledge.id,
+        "topic": knowledge.topic,
+        "tags": knowledge.tags,
+        "title": knowledge.title,
+        "content": knowledge.content,
+        "created_at": knowledge.created_at.isoformat(),
+        "updated_at": knowledge.updated_at.isoformat(),
+    }
+
+
+async def _stored_vectors(qdrant: Qdrant, user_id: int, knowledge_ids: list[int]) -> dict[int, list[dict]]:
+    """Stored chunk vectors of the given entries, keyed by knowledge id, in chunk order."""
+    chunks: defaultdict[int, list[dict]] = defaultdict(list)
+    async for points in qdrant.scroll(
+        qdrant.collection_for(user_id),
+        {"knowledge_id": knowledge_ids},
+        with_payload=["knowledge_id", "chunk_index"],
+        with_vectors=True,
+    ):
+        for point in points:
+            chunk = {"chunk_index": point.payload.get("chunk_index", 0)}
+            if isinstance(point.vector, dict):
+                chunk["vector"] = point.vector.get("")
+                sparse = point.vector.get(SPARSE_VECTOR_NAME)
+                if sparse is not None:
+                    chunk["sparse"] = {"indices": sparse.indices, "values": sparse.values}
+            else:
+                chunk["vector"] = point.vector
+            chunks[point.payload["knowledge_id"]].append(chunk)
+
+    for entries in chunks.values():
+        entries.sort(key=lambda chunk: chunk["chunk_index"])
+    return chunks
+
+
+async def export_ndjson(
+    user_id: int,
+    topic: str | None = None,
+    qdrant: Qdrant | None = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Export a user's entries (optionally one topic) as NDJSON, one entry per
+    line in id order. Rows come from a server-side cursor `batch_size` at a
+    time and each batch is encoded and yielded before the next is fetched,
+    so memory use does not grow with the corpus. With `qdrant`, every line
+    also carries the stored vectors of its chunks under "chunks".
+    """
+    async for knowledges in Knowledges.stream_for_index(user_id, topic, batch_size=batch_size):
+        vectors = await _stored_vectors(qdrant, user_id, [k.id for k in knowledges]) if qdrant is not None else None
+
+        lines = []
+        for knowledge in knowledges:
+            record = _to_record(knowledge)
+            if vectors is not None:
+                record["chunks"] = vectors.get(knowledge.id, [])
+            lines.append(json.dumps(record, ensure_ascii=False))
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compress a byte stream into a single gzip member as it is produced."""
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        if data := compressor.compress(chunk):
+            yield data
+    yield compressor.flush()
@@ -1,18 +1,53 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
 
 from fastapi import Request
+from qdrant_client.models import models
 from sqlalchemy.exc import IntegrityError
 
+from hippobox.core.settings import SETTINGS
 from hippobox.errors.knowledge import KnowledgeErrorCode, KnowledgeException
 from hippobox.errors.service import raise_exception_with_log
-from hippobox.models.knowledge import KnowledgeForm, KnowledgeResponse, Knowledges, KnowledgeUpdate
+from hippobox.models.knowledge import (
+    BulkStatus,
+    KnowledgeBulkItemResult,
+    KnowledgeBulkResponse,
+    KnowledgeBulkUpdateItem,
+    KnowledgeForm,
+    KnowledgeModel,
+    KnowledgePage,
+    KnowledgeResponse,
+    Knowledges,
+    KnowledgeSummary,
+    KnowledgeSummaryPage,
+    KnowledgeUpdate,
+    ListView,
+    PageKey,
+    SearchMode,
+    decode_cursor,
+    encode_cursor,
+)
+from hippobox.models.topic import Topics
+from hippobox.rag.chunking import chunk_markdown, chunk_point_id, estimate_tokens
 from hippobox.rag.embedding import Embedding
-from hippobox.rag.qdrant import Qdrant
-from hippobox.utils.preprocess import preprocess_content
+from hippobox.rag.qdrant import DEDICATED_SUFFIX, Qdrant
+from hippobox.rag.search_cache import SEARCH_CACHE
+from hippobox.rag.sparse import encode_document, encode_query
+from hippobox.services.export import export_ndjson, gzip_stream
+from hippobox.utils.knowledge_labels import DEFAULT_TOPIC_NORMALIZED, normalize_label, normalize_tag, unique_labels
 
 log = logging.getLogger("knowledge")
 
 
+def index_stamp(updated_at: datetime) -> str:
+    """`updated_at` as stored in point payloads; naive values (SQLite) are taken as UTC."""
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return updated_at.astimezone(timezone.utc).isoformat()
+
+
 class KnowledgeService:
     def __init__(self, embedding: Embedding | None, qdrant: Qdrant | None, vdb_enabled: bool):
         self.embedding = embedding
@@ -22,77 +57,182 @@ class KnowledgeService:
         if self.vdb_enabled and (self.embedding is None or self.qdrant is None):
             raise RuntimeError("VDB is enabled but embedding or Qdrant is not initialized.")
 
+    @staticmethod
+    def _to_payload(knowledge: KnowledgeModel) -> dict:
+        """Payload shared by every chunk point of a knowledge entry."""
+        return {
+            "knowledge_id": knowledge.id,
+            "metadata": {
+                "topic": knowledge.topic,
+                "tags": knowledge.tags,
+                "title": knowledge.title,
+                "created_at": str(knowledge.created_at),
+            },
+            "user_id": knowledge.user_id,
+            "tenant": str(knowledge.user_id),
+            "topic_id": knowledge.topic_id,
+            "tag_ids": knowledge.tag_ids,
+            "updated_at": index_stamp(knowledge.updated_at),
+        }
+
+    @staticmethod
+    def chunk_content(knowledge: KnowledgeModel) -> list[str]:
+        return chunk_markdown(
+            knowledge.content,
+            max_tokens=SETTINGS.CHUNK_MAX_TOKENS,
+            overlap_tokens=SETTINGS.CHUNK_OVERLAP_TOKENS,
+        )
+
+    @classmethod
+    def to_points(cls, knowledge: KnowledgeModel, chunks: list[str], vectors: list[list[float]]) -> list[dict]:
+        """One point per chunk, in the item format taken by `Qdrant.upsert` and `Qdrant.insert`."""
+        payload = cls._to_payload(knowledge)
+        points = []
+        for i, (chunk, vector) in enumerate(zip(chunks, vectors)):
+            chunk_payload = {**payload, "chunk_index": i}
+            if SETTINGS.QDRANT_STORE_TEXT:
+                chunk_payload["text"] = chunk
+            points.append(
+                {
+                    "id": chunk_point_id(knowledge.id, i),
+                    "vector": vector,
+                    "sparse": encode_document(chunk, avg_length=SETTINGS.CHUNK_MAX_TOKENS / 2),
+                    "payload": chunk_payload,
+                }
+            )
+        return points
+
+    async def index_knowledge(self, knowledge: KnowledgeModel):
+        """
+        Embed a knowledge entry chunk by chunk and replace its points in Qdrant.
+        Points of chunks beyond the new chunk count are removed.
+        """
+        chunks = self.chunk_content(knowledge)
+        vectors = await self.embedding.embed_batch(chunks)
+
+        collection = self.qdrant.collection_for(knowledge.user_id)
+        await self.qdrant.upsert(collection, self.to_points(knowledge, chunks, vectors))
+        await self.qdrant.delete_where(
+            collection,
+            {"knowledge_id": knowledge.id, "chunk_index": models.Range(gte=len(chunks))},
+        )
+
+    @staticmethod
+    def _changed_fields(old: KnowledgeModel, form: KnowledgeUpdate) -> KnowledgeUpdate:
+        """
+        Reduce an update form to the fields that actually differ from `old`,
+        comparing labels the same way they are resolved on write.
+        """
+        update_data = form.model_dump(exclude_unset=True)
+        changed = {}
+
+        if update_data.get("title") is not None and update_data["title"].strip() != old.title:
+            changed["title"] = update_data["title"]
+
+        if update_data.get("content") is not None and update_data["content"] != old.content:
+            changed["content"] = update_data["content"]
+
+        if "topic" in update_data:
+            raw_topic = update_data["topic"]
+            new_topic = normalize_label(raw_topic) if raw_topic and raw_topic.strip() else DEFAULT_TOPIC_NORMALIZED
+            if new_topic != normalize_label(old.topic):
+                changed["topic"] = raw_topic
+
+        if "tags" in update_data:
+            new_tags = {normalize_tag(tag) for tag in unique_labels(update_data["tags"] or [])}
+            if new_tags != {normalize_tag(tag) for tag in old.tags}:
+                changed["tags"] = update_data["tags"]
+
+        return KnowledgeUpdate(**changed)
+
     # -------------------------------------------
     # Search
     # -------------------------------------------
     async def search(
-        self, user_id: int, query: str, topic: str | None = None, tag: str | None = None, limit: int = 1
+        self,
+        user_id: int,
+        query: str,
+        topic: str | None = None,
+        tag: str | None = None,
+        limit: int = 1,
+        mode: SearchMode = SearchMode.dense,
     ) -> list[KnowledgeResponse]:
         if not self.vdb_enabled:
             raise KnowledgeException(KnowledgeErrorCode.VDB_DISABLED)
 
-        vector = self.embedding.embed(query)
-        results = self.qdrant.search("knowledge", vector, limit=limit)
+        cache_params = {"query": query, "topic": topic, "tag": tag, "limit": limit, "mode": SearchMode(mode).value}
+        # Read before searching so a write that overlaps the search outdates its cache entry.
+        cache_key = await SEARCH_CACHE.key(user_id, cache_params)
+        cached = await SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            return [KnowledgeResponse.model_validate(item) for item in cached]
+
+        collection = self.qdrant.collection_for(user_id)
+        filters = {"tenant": str(user_id)}
+        if topic:
+            found_topic = await Topics.get_by_name(user_id, topic)
+            if found_topic is None:
+                return []
+            filters["topic_id"] = found_topic.id
+        if tag:
+            tag_id = await Knowledges.get_tag_id(user_id, tag)
+            if tag_id is None:
+                return []
+            filters["tag_ids"] = tag_id
+
+        if mode != SearchMode.dense and not await self.qdrant.has_sparse(collection):
+            if mode == SearchMode.sparse:
+                raise KnowledgeException(KnowledgeErrorCode.SEARCH_MODE_UNAVAILABLE)
+            mode = SearchMode.dense
+
+        # Sparse-only search is computed locally and skips the embedding call.
+        vector = await self.embedding.embed(query) if mode != SearchMode.sparse else None
+        sparse_vector = encode_query(query) if mode != SearchMode.dense else None
+        results = await self.qdrant.search(
+            collection,
+            vector,
+            limit=limit,
+            filters=filters,
+            group_by="knowledge_id",
+            sparse_vector=sparse_vector,
+            # Hits are hydrated from SQL; only the ids are needed.
+            with_payload=False,
+        )
 
         ids = results.get("ids", [])
         if not ids:
             return []
 
-        knowledges = []
-        for kid in ids:
-            try:
-                k = await Knowledges.get(user_id, kid)
-            except Exception as e:
-                log.exception(f"{KnowledgeErrorCode.GET_FAILED.default_message}: {e}")
-                continue
-
-            if k is None:
-                continue
-            if topic and k.topic != topic:
-                continue
-            if tag and tag not in k.tags:
-                continue
-
-            knowledges.append(KnowledgeResponse.model_validate(k.model_dump()))
+        try:
+            knowledges = await Knowledges.get_many(user_id, [int(kid) for kid in ids])
+        except Exception as e:
+            raise_exception_with_log(KnowledgeErrorCode.GET_FAILED, e)
 
-        return knowledges
+        responses = [KnowledgeResponse.model_validate(k.model_dump()) for k in knowledges]
+        await SEARCH_CACHE.set(cache_key, [r.model_dump(mode="json") for r in responses])
+        return responses
 
     # -------------------------------------------
     # Create
     # -------------------------------------------
     async def create_knowledge(self, user_id: int, form: KnowledgeForm) -> KnowledgeResponse:
-        try:
-            knowledge = await Knowledges.create(user_id, form)
-        except IntegrityError:
-            raise KnowledgeException(KnowledgeErrorCode.TITLE_EXISTS)
-        except Exception as e:
-            raise_exception_with_log(KnowledgeErrorCode.CREATE_FAILED, e)
-
-        log.info(f"SQL knowledge created (id={knowledge.id})")
-
-        if self.vdb_enabled:
+        async with SEARCH_CACHE.invalidating(user_id):
             try:
-                vector = self.embedding.embed(knowledge.content)
-                self.qdrant.upsert(
-                    "knowledge",
-                    [
-                        {
-                            "id": knowledge.id,
-                            "vector": vector,
-                            "text": preprocess_content(knowledge),
-                            "metadata": {
-                                "topic": knowledge.topic,
-                                "tags": knowledge.tags,
-                                "title": knowledge.title,
-                                "created_at": str(knowledge.created_at),
-                            },
-                        }
-                    ],
-                )
+                knowledge = await Knowledges.create(user_id, form)
+            except IntegrityError:
+                raise KnowledgeException(KnowledgeErrorCode.TITLE_EXISTS)
             except Exception as e:
-                await Knowledges.delete(user_id, knowledge.id)
                 raise_exception_with_log(KnowledgeErrorCode.CREATE_FAILED, e)
 
+            log.info(f"SQL knowledge created (id={knowledge.id})")
+
+            if self.vdb_enabled:
+                try:
+                    await self.index_knowledge(knowledge)
+                except Exception as e:
+                    await Knowledges.delete(user_id, knowledge.id)
+                    raise_exception_with_log(KnowledgeErrorCode.CREATE_FAILED, e)
+
         return KnowledgeResponse.model_validate(knowledge.model_dump())
 
     # -------------------------------------------
@@ -106,17 +246,57 @@ class KnowledgeService:
 
         return KnowledgeResponse.model_validate(knowledge.model_dump())
 
-    async def get_knowledge_list(self, user_id: int) -> list[KnowledgeResponse]:
-        knowledges = await Knowledges.get_list(user_id)
-        return [KnowledgeResponse.model_validate(k.model_dump()) for k in knowledges]
-
-    async def get_by_topic(self, user_id: int, topic: str) -> list[KnowledgeResponse]:
-        knowledges = await Knowledges.get_by_topic(user_id, topic)
-        return [KnowledgeResponse.model_validate(k.model_dump()) for k in knowledges]
-
-    async def get_by_tag(self, user_id: int, tag: str) -> list[KnowledgeResponse]:
-        knowledges = await Knowledges.get_by_tag(user_id, tag)
-        return [KnowledgeResponse.model_validate(k.model_dump()) for k in knowledges]
+    @staticmethod
+    def _page_key(cursor: str | None) -> PageKey | None:
+        if cursor is None:
+            return None
+        try:
+            return decode_cursor(cursor)
+        except ValueError:
+            raise KnowledgeException(KnowledgeErrorCode.INVALID_CURSOR)
+
+    @staticmethod
+    def _to_page(
+        view: ListView,
+        items: list[KnowledgeModel] | list[KnowledgeSummary],
+        next_key: PageKey | None,
+    ) -> KnowledgePage | KnowledgeSummaryPage:
+        next_cursor = encode_cursor(next_key) if next_key is not None else None
+        if view == ListView.summary:
+            return KnowledgeSummaryPage(items=items, next_cursor=next_cursor)
+        return KnowledgePage(
+            items=[KnowledgeResponse.model_validate(k.model_dump()) for k in items],
+            next_cursor=next_cursor,
+        )
+
+    async def get_knowledge_list(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: str | None = None,
+        view: ListView = ListView.full,
+    ) -> KnowledgePage | KnowledgeSummaryPage:
+        return self._to_page(view, *await Knowledges.get_list(user_id, limit, self._page_key(cursor), view))
+
+    async def get_by_topic(
+        self,
+        user_id: int,
+        topic: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        view: ListView = ListView.full,
+    ) -> KnowledgePage | KnowledgeSummaryPage:
+        return self._to_page(view, *await Knowledges.get_by_topic(user_id, topic, limit, self._page_key(cursor), view))
+
+    async def get_by_tag(
+        self,
+        user_id: int,
+        tag: str,
+        limit: int = 50,
+        cursor: str | None = None,
+        view: ListView = ListView.full,
+    ) -> KnowledgePage | KnowledgeSummaryPage:
+        return self._to_page(view, *await Knowledges.get_by_tag(user_id, tag, limit, self._page_key(cursor), view))
 
     async def get_by_title(self, user_id: int, title: str) -> KnowledgeResponse:
         knowledge = await Knowledges.get_by_title(user_id, title)
@@ -135,51 +315,48 @@ class KnowledgeService:
         if old is None:
             raise KnowledgeException(KnowledgeErrorCode.UPDATE_FAILED)
 
-        try:
-            updated = await Knowledges.update(user_id, kid, form)
-            if updated is None:
-                raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED)
-        except IntegrityError:
-            raise KnowledgeException(KnowledgeErrorCode.TITLE_EXISTS)
-        except Exception as e:
-            raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED, e)
+        changes = self._changed_fields(old, form)
+        if not changes.model_fields_set:
+            return KnowledgeResponse.model_validate(old.model_dump())
 
-        if self.vdb_enabled:
+        async with SEARCH_CACHE.invalidating(user_id):
             try:
-                vector = self.embedding.embed(updated.content)
-                self.qdrant.upsert(
-                    "knowledge",
-                    [
-                        {
-                            "id": updated.id,
-                            "vector": vector,
-                            "text": preprocess_content(updated),
-                            "metadata": {
-                                "topic": updated.topic,
-                                "tags": updated.tags,
-                                "title": updated.title,
-                                "created_at": str(updated.created_at),
-                            },
-                        }
-                    ],
-                )
+                updated = await Knowledges.update(user_id, kid, changes)
+                if updated is None:
+                    raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED)
+            except IntegrityError:
+                raise KnowledgeException(KnowledgeErrorCode.TITLE_EXISTS)
             except Exception as e:
-                try:
-                    await Knowledges.update(
-                        user_id,
-                        kid,
-                        KnowledgeUpdate(
-                            topic=old.topic,
-                            tags=old.tags,
-                            title=old.title,
-                            content=old.content,
-                        ),
-                        override_updated_at=old.updated_at,
-                    )
-                except Exception as rollback_error:
-                    log.exception(f"Rollback failed for id={kid}: {rollback_error}")
                 raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED, e)
 
+            if self.vdb_enabled:
+                try:
+                    # Only the content is embedded; title, topic and tags live in the payload.
+                    if "content" in changes.model_fields_set:
+                        await self.index_knowledge(updated)
+                    else:
+                        await self.qdrant.set_payload(
+                            self.qdrant.collection_for(user_id),
+                            self._to_payload(updated),
+                            {"knowledge_id": updated.id},
+                        )
+                except Exception as e:
+                    try:
+                        await Knowledges.update(
+                            user_id,
+                            kid,
+                            KnowledgeUpdate(
+                                topic=old.topic,
+                                tags=old.tags,
+                                title=old.title,
+                                content=old.content,
+                            ),
+                            override_updated_at=old.updated_at,
+                        )
+                    except Exception as rollback_error:
+                        log.exception(f"Rollback failed for id={kid}: {rollback_error}")
+                    raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED, e)
+
         return KnowledgeResponse.model_validate(updated.model_dump())
 
     # -------------------------------------------
@@ -190,22 +367,363 @@ class KnowledgeService:
         if old is None:
             raise KnowledgeException(KnowledgeErrorCode.DELETE_FAILED)
 
-        try:
-            deleted = await Knowledges.delete(user_id, kid)
-            if not deleted:
-                raise KnowledgeException(KnowledgeErrorCode.DELETE_FAILED)
+        async with SEARCH_CACHE.invalidating(user_id):
+            try:
+                deleted = await Knowledges.delete(user_id, kid)
+                if not deleted:
+                    raise KnowledgeException(KnowledgeErrorCode.DELETE_FAILED)
 
-            if self.vdb_enabled:
-                self.qdrant.delete("knowledge", [kid])
-        except Exception as e:
-            restored = await Knowledges.restore(old)
-            if restored is None:
-                log.error(f"Rollback failed for id={kid}")
-                raise KnowledgeException(KnowledgeErrorCode.DELETE_FAILED)
-            raise_exception_with_log(KnowledgeErrorCode.DELETE_FAILED, e)
+                if self.vdb_enabled:
+                    await self.qdrant.delete_where(self.qdrant.collection_for(user_id), {"knowledge_id": kid})
+            except Exception as e:
+                restored = await Knowledges.restore(old)
+                if restored is None:
+                    log.error(f"Rollback failed for id={kid}")
+                    raise KnowledgeException(KnowledgeErrorCode.DELETE_FAILED)
+                raise_exception_with_log(KnowledgeErrorCode.DELETE_FAILED, e)
 
         return True
 
+    # -------------------------------------------
+    # Export
+    # -------------------------------------------
+    def export_knowledge(
+        self,
+        user_id: int,
+        topic: str | None = None,
+        include_vectors: bool = False,
+        compress: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """
+        Byte stream of the user's entries as NDJSON (see `export_ndjson`),
+        gzip-compressed if `compress`. Checked up front so errors surface
+        before the response starts.
+        """
+        if include_vectors and not self.vdb_enabled:
+            raise KnowledgeException(KnowledgeErrorCode.VDB_DISABLED)
+
+        stream = export_ndjson(user_id, topic, self.qdrant if include_vectors else None)
+        return gzip_stream(stream) if compress else stream
+
+    # -------------------------------------------
+    # Bulk
+    # -------------------------------------------
+    @staticmethod
+    def _check_bulk_size(count: int):
+        if count > SETTINGS.KNOWLEDGE_BULK_MAX_ITEMS:
+            raise KnowledgeException(
+                KnowledgeErrorCode.BULK_TOO_LARGE,
+                f"At most {SETTINGS.KNOWLEDGE_BULK_MAX_ITEMS} entries per bulk request",
+            )
+
+    @staticmethod
+    def _bulk_failure(index: int, code: KnowledgeErrorCode, kid: int | None = None) -> KnowledgeBulkItemResult:
+        return KnowledgeBulkItemResult(
+            index=index,
+            id=kid,
+            status=BulkStatus.failed,
+            error=code.code.code,
+            message=code.code.default_message,
+        )
+
+    @staticmethod
+    def _bulk_success(
+        index: int,
+        status: BulkStatus,
+        knowledge: KnowledgeModel | None = None,
+        kid: int | None = None,
+    ) -> KnowledgeBulkItemResult:
+        return KnowledgeBulkItemResult(
+            index=index,
+            id=knowledge.id if knowledge is not None else kid,
+            status=status,
+            knowledge=KnowledgeResponse.model_validate(knowledge.model_dump()) if knowledge is not None else None,
+        )
+
+    @staticmethod
+    def _bulk_response(results: list[KnowledgeBulkItemResult]) -> KnowledgeBulkResponse:
+        failed = sum(1 for r in results if r.status == BulkStatus.failed)
+        return KnowledgeBulkResponse(results=results, succeeded=len(results) - failed, failed=failed)
+
+    async def _embed_chunks(self, chunk_lists: list[list[str]]) -> list[list[list[float]]]:
+        """
+        Embed the chunks of many entries in `embed_batch` requests of about
+        KNOWLEDGE_BULK_BATCH_TOKENS tokens, KNOWLEDGE_BULK_EMBED_WORKERS at a
+        time. Vectors are returned grouped like `chunk_lists`.
+        """
+        groups: list[list[str]] = []
+        group: list[str] = []
+        tokens = 0
+        for chunk in (chunk for chunks in chunk_lists for chunk in chunks):
+            size = estimate_tokens(chunk)
+            if group and tokens + size > SETTINGS.KNOWLEDGE_BULK_BATCH_TOKENS:
+                groups.append(group)
+                group, tokens = [], 0
+            group.append(chunk)
+            tokens += size
+        if group:
+            groups.append(group)
+
+        semaphore = asyncio.Semaphore(max(SETTINGS.KNOWLEDGE_BULK_EMBED_WORKERS, 1))
+
+        async def embed(texts: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await self.embedding.embed_batch(texts)
+
+        vectors = iter([vector for batch in await asyncio.gather(*map(embed, groups)) for vector in batch])
+        return [[next(vectors) for _ in chunks] for chunks in chunk_lists]
+
+    async def _index_many(self, user_id: int, knowledges: list[KnowledgeModel]):
+        """Bulk counterpart of `index_knowledge`: one embedding pass and one point upload for all entries."""
+        chunk_lists = [self.chunk_content(knowledge) for knowledge in knowledges]
+        vector_lists = await self._embed_chunks(chunk_lists)
+
+        points = [
+            point
+            for knowledge, chunks, vectors in zip(knowledges, chunk_lists, vector_lists)
+            for point in self.to_points(knowledge, chunks, vectors)
+        ]
+        collection = self.qdrant.collection_for(user_id)
+        await self.qdrant.insert(collection, points, wait=True)
+        await self.qdrant.delete_stale_chunks(
+            collection,
+            {knowledge.id: len(chunks) for knowledge, chunks in zip(knowledges, chunk_lists)},
+        )
+
+    async def create_knowledge_bulk(self, user_id: int, forms: list[KnowledgeForm]) -> KnowledgeBulkResponse:
+        """
+        Create many entries in one SQL transaction and index them together.
+        Items whose title is taken (or repeated in the request) fail on their
+        own; a storage or indexing error fails the whole request, as for a
+        single create.
+        """
+        self._check_bulk_size(len(forms))
+
+        results: list[KnowledgeBulkItemResult | None] = [None] * len(forms)
+        titles = [form.title.strip() for form in forms]
+        taken = await Knowledges.get_existing_titles(user_id, titles)
+
+        accepted: list[int] = []
+        seen: set[str] = set()
+        for i, title in enumerate(titles):
+            if title in taken or title in seen:
+                results[i] = self._bulk_failure(i, KnowledgeErrorCode.TITLE_EXISTS)
+            else:
+                seen.add(title)
+                accepted.append(i)
+
+        if accepted:
+            async with SEARCH_CACHE.invalidating(user_id):
+                try:
+                    created = await Knowledges.create_many(user_id, [forms[i] for i in accepted])
+                except IntegrityError:
+                    raise KnowledgeException(KnowledgeErrorCode.TITLE_EXISTS)
+                except Exception as e:
+                    raise_exception_with_log(KnowledgeErrorCode.CREATE_FAILED, e)
+
+                log.info(f"SQL knowledge bulk created ({len(created)} entries)")
+
+                if self.vdb_enabled:
+                    try:
+                        await self._index_many(user_id, created)
+                    except Exception as e:
+                        await Knowledges.delete_many(user_id, [knowledge.id for knowledge in created])
+                        raise_exception_with_log(KnowledgeErrorCode.CREATE_FAILED, e)
+
+            for i, knowledge in zip(accepted, created):
+                results[i] = self._bulk_success(i, BulkStatus.created, knowledge)
+
+        return self._bulk_response(results)
+
+    async def update_knowledge_bulk(self, user_id: int, items: list[KnowledgeBulkUpdateItem]) -> KnowledgeBulkResponse:
+        """
+        Update many entries in one SQL transaction. Like `update_knowledge`,
+        only changed fields are written, changed content is re-embedded (in
+        one pass for all entries) and other changes only touch the payload.
+        """
+        self._check_bulk_size(len(items))
+
+        results: list[KnowledgeBulkItemResult | None] = [None] * len(items)
+        olds = {k.id: k for k in await Knowledges.get_many(user_id, list(dict.fromkeys(item.id for item in items)))}
+
+        changes: dict[int, KnowledgeUpdate] = {}
+        positions: dict[int, int] = {}
+        seen: set[int] = set()
+        for i, item in enumerate(items):
+            old = olds.get(item.id)
+            if old is None:
+                results[i] = self._bulk_failure(i, KnowledgeErrorCode.NOT_FOUND, item.id)
+                continue
+            if item.id in seen:
+                results[i] = self._bulk_failure(i, KnowledgeErrorCode.DUPLICATE_ID, item.id)
+                continue
+            seen.add(item.id)
+
+            changed = self._changed_fields(old, KnowledgeUpdate(**item.model_dump(exclude_unset=True, exclude={"id"})))
+            if changed.model_fields_set:
+                changes[item.id] = changed
+                positions[item.id] = i
+            else:
+                results[i] = self._bulk_success(i, BulkStatus.unchanged, old)
+
+        new_titles = {kid: form.title.strip() for kid, form in changes.items() if "title" in form.model_fields_set}
+        taken = await Knowledges.get_existing_titles(user_id, list(set(new_titles.values())))
+        claimed: set[str] = set()
+        for kid, title in new_titles.items():
+            if taken.get(title, kid) != kid or title in claimed:
+                i = positions.pop(kid)
+                results[i] = self._bulk_failure(i, KnowledgeErrorCode.TITLE_EXISTS, kid)
+                del changes[kid]
+            else:
+                claimed.add(title)
+
+        if changes:
+            async with SEARCH_CACHE.invalidating(user_id):
+                try:
+                    updated = await Knowledges.update_many(user_id, changes)
+                except IntegrityError:
+                    raise KnowledgeException(KnowledgeErrorCode.TITLE_EXISTS)
+                except Exception as e:
+                    raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED, e)
+
+                if self.vdb_enabled:
+                    try:
+                        content_changed = {kid for kid, form in changes.items() if "content" in form.model_fields_set}
+                        reembed = [k for k in updated if k.id in content_changed]
+                        relabel = {k.id: self._to_payload(k) for k in updated if k.id not in content_changed}
+                        if reembed:
+                            await self._index_many(user_id, reembed)
+                        if relabel:
+                            await self.qdrant.set_payloads(
+                                self.qdrant.collection_for(user_id), relabel, key="knowledge_id"
+                            )
+                    except Exception as e:
+                        try:
+                            await Knowledges.update_many(
+                                user_id,
+                                {
+                                    kid: KnowledgeUpdate(
+                                        topic=olds[kid].topic,
+                                        tags=olds[kid].tags,
+                                        title=olds[kid].title,
+                                        content=olds[kid].content,
+                                    )
+                                    for kid in changes
+                                },
+                                override_updated_at={kid: olds[kid].updated_at for kid in changes},
+                            )
+                        except Exception as rollback_error:
+                            log.exception(f"Bulk update rollback failed: {rollback_error}")
+                        raise_exception_with_log(KnowledgeErrorCode.UPDATE_FAILED, e)
+
+            for knowledge in updated:
+                results[positions[knowledge.id]] = self._bulk_success(
+                    positions[knowledge.id], BulkStatus.updated, knowledge
+                )
+
+        return self._bulk_response(results)
+
+    async def delete_knowledge_bulk(self, user_id: int, ids: list[int]) -> KnowledgeBulkResponse:
+        """Delete many entries in one SQL transaction and drop all their points in one request."""
+        self._check_bulk_size(len(ids))
+
+        results: list[KnowledgeBulkItemResult | None] = [None] * len(ids)
+        olds = {k.id: k for k in await Knowledges.get_many(user_id, list(dict.fromkeys(ids)))}
+
+        positions: dict[int, int] = {}
+        for i, kid in enumerate(ids):
+            if kid not in olds:
+                results[i] = self._bulk_failure(i, KnowledgeErrorCode.NOT_FOUND, kid)
+            elif kid in positions:
+                results[i] = self._bulk_failure(i, KnowledgeErrorCode.DUPLICATE_ID, kid)
+            else:
+                positions[kid] = i
+
+        if positions:
+            async with SEARCH_CACHE.invalidating(user_id):
+                try:
+                    deleted = set(await Knowledges.delete_many(user_id, list(positions)))
+                    if self.vdb_enabled:
+                        await self.qdrant.delete_where(
+                            self.qdrant.collection_for(user_id), {"knowledge_id": list(deleted)}
+                        )
+                except Exception as e:
+                    for kid in positions:
+                        try:
+                            if await Knowledges.get(user_id, kid) is None:
+                                await Knowledges.restore(olds[kid])
+                        except Exception as rollback_error:
+                            log.error(f"Rollback failed for id={kid}: {rollback_error}")
+                    raise_exception_with_log(KnowledgeErrorCode.DELETE_FAILED, e)
+
+            for kid in positions:
+                if kid in deleted:
+                    results[positions[kid]] = self._bulk_success(positions[kid], BulkStatus.deleted, kid=kid)
+                else:
+                    results[positions[kid]] = self._bulk_failure(positions[kid], KnowledgeErrorCode.NOT_FOUND, kid)
+
+        return self._bulk_response(results)
+
+
+async def backfill_vector_payloads(qdrant: Qdrant, batch_size: int | None = None) -> int:
+    """
+    Attach the filter fields (knowledge_id, chunk_index, user_id, topic_id,
+    tag_ids) to points indexed before they were part of the payload, so
+    scoped and grouped searches can see them. Such points hold a whole
+    entry under the entry's own id, i.e. they are chunk 0. Expects the
+    collection to have been provisioned with `Qdrant.ensure_collection`.
+    """
+    updated = 0
+    async for points in qdrant.scroll_missing("knowledge", "knowledge_id", page_size=batch_size):
+        fields = await Knowledges.get_index_fields([int(p.id) for p in points])
+        for kid, payload in fields.items():
+            payload.update(knowledge_id=kid, chunk_index=0, tenant=str(payload["user_id"]))
+        if fields:
+            await qdrant.set_payloads("knowledge", fields)
+            updated += len(fields)
+
+    if updated:
+        log.info(f"Backfilled filter payload for {updated} knowledge points")
+    return updated
+
+
+async def migrate_tenants(qdrant: Qdrant, batch_size: int | None = None) -> int:
+    """
+    Bring stored points in line with the tenant layout: tag points that
+    predate the `tenant` field, move dedicated tenants' points out of the
+    shared collection, and fold collections of tenants no longer dedicated
+    back into it. Expects every target collection to be provisioned.
+    Returns the number of points touched.
+    """
+    touched = 0
+    async for points in qdrant.scroll_missing("knowledge", "tenant", page_size=batch_size, with_payload=["user_id"]):
+        payloads = {p.id: {"tenant": str(p.payload["user_id"])} for p in points if "user_id" in p.payload}
+        if payloads:
+            await qdrant.set_payloads("knowledge", payloads)
+            touched += len(payloads)
+
+    for user_id in sorted(qdrant.dedicated_tenants):
+        moved = await qdrant.move_points(
+            "knowledge",
+            qdrant.collection_for(user_id),
+            {"tenant": str(user_id)},
+            page_size=batch_size,
+        )
+        if moved:
+            log.info(f"Moved {moved} points of user {user_id} to a dedicated collection")
+            touched += moved
+
+    for name in await qdrant.list_collections():
+        match = DEDICATED_SUFFIX.search(name)
+        if not match or not name.startswith("knowledge_") or int(match.group(1)) in qdrant.dedicated_tenants:
+            continue
+        moved = await qdrant.move_points(name, "knowledge", page_size=batch_size)
+        await qdrant.delete_collection(name)
+        log.info(f"Moved {moved} points of user {match.group(1)} back to the shared collection")
+        touched += moved
+
+    return touched
+
 
 def get_knowledge_service(request: Request) -> KnowledgeService:
     return KnowledgeService(
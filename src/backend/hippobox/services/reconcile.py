@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+from hippobox.core.metrics import METRICS
+from hippobox.core.redis import RedisManager
+from hippobox.core.settings import SETTINGS
+from hippobox.models.knowledge import Knowledges
+from hippobox.rag.search_cache import SEARCH_CACHE
+from hippobox.services.knowledge import KnowledgeService, index_stamp
+
+log = logging.getLogger("knowledge")
+
+# Held by the process currently reconciling, so only one worker runs at a time.
+LOCK_KEY = "reconcile:lock"
+
+
+@dataclass
+class ReconcileReport:
+    checked: int = 0
+    missing: int = 0
+    stale: int = 0
+    orphans: int = 0
+    stamped: int = 0
+    failed: int = 0
+    duration: float = 0.0
+
+
+@dataclass
+class _Pending:
+    # (user_id, knowledge_id) of entries to re-embed
+    reindex: list[tuple[int, int]] = field(default_factory=list)
+    orphans: list[int] = field(default_factory=list)
+    # point id -> payload for points indexed before `updated_at` was stored
+    stamps: dict[int, dict] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.reindex) + len(self.orphans) + len(self.stamps)
+
+
+class RateLimiter:
+    """Space calls to `wait` at least 1 / `rate` seconds apart; `rate` <= 0 disables it."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        if self._next > now:
+            await asyncio.sleep(self._next - now)
+        self._next = max(now, self._next) + self.interval
+
+
+class Reconciler:
+    """
+    Bring Qdrant back in line with SQL after a crash or a failed compensating
+    action between the two writes of a knowledge change.
+
+    Each collection is walked in id order on both sides: SQL (id, user_id,
+    updated_at) pages and a Qdrant scroll of chunk-0 points carrying only the
+    `updated_at` payload field, no vectors. Chunk 0 keeps the entry id as its
+    point id, so the two sorted streams merge like a join. Entries missing in
+    Qdrant or with a different `updated_at` are re-embedded; points without
+    an SQL row are deleted.
+
+    Re-embeds are limited to `reembed_rate` per second and every Qdrant page
+    is followed by `page_delay_ms` of sleep, keeping the job in the background
+    of interactive traffic.
+    """
+
+    def __init__(
+        self,
+        service: KnowledgeService,
+        batch_size: int = SETTINGS.RECONCILE_BATCH_SIZE,
+        reembed_rate: float = SETTINGS.RECONCILE_REEMBED_RATE,
+        page_delay_ms: float = SETTINGS.RECONCILE_PAGE_DELAY_MS,
+    ):
+        self.service = service
+        self.qdrant = service.qdrant
+        self.batch_size = batch_size
+        self.page_delay = page_delay_ms / 1000
+        self.limiter = RateLimiter(reembed_rate)
+
+        self.last_report: ReconcileReport | None = None
+        self.last_run_at: datetime | None = None
+
+    async def run_forever(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if await self._acquire(interval):
+                    await self.run_once()
+            except Exception as e:
+                log.error(f"Reconcile run failed: {e}")
+
+    async def _acquire(self, interval: float) -> bool:
+        try:
+            redis = await RedisManager.get_client()
+            return bool(await redis.set(LOCK_KEY, "1", nx=True, ex=max(int(interval), 1)))
+        except Exception as e:
+            log.warning(f"Reconcile lock unavailable, running without it: {e}")
+            return True
+
+    async def run_once(self) -> ReconcileReport:
+        report = ReconcileReport()
+        started = time.monotonic()
+
+        await self._reconcile("knowledge", None, report)
+        for user_id in sorted(self.qdrant.dedicated_tenants):
+            await self._reconcile(self.qdrant.collection_for(user_id), user_id, report)
+
+        report.duration = time.monotonic() - started
+        for name in ("missing", "stale", "orphans", "stamped", "failed"):
+            METRICS.incr(f"reconcile_{name}", getattr(report, name))
+        METRICS.incr("reconcile_runs")
+        self.last_report = report
+        self.last_run_at = datetime.now()
+
+        log.info(
+            f"Reconciled {report.checked} entries in {report.duration:.1f}s: {report.missing} missing, "
+            f"{report.stale} stale, {report.orphans} orphan points, {report.failed} failed"
+        )
+        return report
+
+    async def _rows(self, user_id: int | None) -> AsyncIterator[tuple[int, int, datetime]]:
+        after_id = 0
+        while rows := await Knowledges.get_index_state(after_id, self.batch_size, user_id=user_id):
+            for row in rows:
+                yield row
+            after_id = rows[-1][0]
+
+    async def _points(self, collection: str) -> AsyncIterator[tuple[int, str | None]]:
+        async for points in self.qdrant.scroll(
+            collection,
+            {"chunk_index": 0},
+            page_size=self.batch_size,
+            with_payload=["updated_at"],
+        ):
+            for point in points:
+                yield int(point.id), (point.payload or {}).get("updated_at")
+            await asyncio.sleep(self.page_delay)
+
+    async def _reconcile(self, collection: str, user_id: int | None, report: ReconcileReport):
+        """
+        Merge the SQL rows (all users for the shared collection, else `user_id`'s)
+        with the points of `collection`. Rows of users routed to another
+        collection are left alone; moving those is `migrate_tenants`' job.
+        """
+        rows, points = self._rows(user_id), self._points(collection)
+        row, point = await anext(rows, None), await anext(points, None)
+        pending = _Pending()
+
+        while row is not None or point is not None:
+            if point is None or (row is not None and row[0] < point[0]):
+                kid, owner, _ = row
+                if self.qdrant.collection_for(owner) == collection:
+                    pending.reindex.append((owner, kid))
+                    report.missing += 1
+                row = await anext(rows, None)
+
+            elif row is None or point[0] < row[0]:
+                pending.orphans.append(point[0])
+                point = await anext(points, None)
+
+            else:
+                kid, owner, updated_at = row
+                if self.qdrant.collection_for(owner) == collection:
+                    report.checked += 1
+                    stamp = index_stamp(updated_at)
+                    if point[1] is None:
+                        # Indexed before `updated_at` was stored; assume in sync and record it.
+                        pending.stamps[kid] = {"updated_at": stamp}
+                    elif point[1] != stamp:
+                        pending.reindex.append((owner, kid))
+                        report.stale += 1
+                row, point = await anext(rows, None), await anext(points, None)
+
+            if len(pending) >= self.batch_size:
+                await self._apply(collection, pending, report)
+                pending = _Pending()
+
+        if pending:
+            await self._apply(collection, pending, report)
+
+    async def _apply(self, collection: str, pending: _Pending, report: ReconcileReport):
+        # Entries created since their SQL page was read are not orphans.
+        existing = await Knowledges.get_index_fields(pending.orphans)
+        orphans = [kid for kid in pending.orphans if kid not in existing]
+        if orphans:
+            # By point id too, for legacy points that predate the knowledge_id field.
+            await self.qdrant.delete(collection, orphans)
+            await self.qdrant.delete_where(collection, {"knowledge_id": orphans})
+            report.orphans += len(orphans)
+
+        if pending.stamps:
+            await self.qdrant.set_payloads(collection, pending.stamps)
+            report.stamped += len(pending.stamps)
+
+        by_user: defaultdict[int, list[int]] = defaultdict(list)
+        for user_id, kid in pending.reindex:
+            by_user[user_id].append(kid)
+
+        for user_id, ids in by_user.items():
+            for knowledge in await Knowledges.get_many(user_id, ids):
+                await self.limiter.wait()
+                try:
+                    await self.service.index_knowledge(knowledge)
+                except Exception as e:
+                    report.failed += 1
+                    log.warning(f"Reconcile re-embed failed for id={knowledge.id}: {e}")
+            await SEARCH_CACHE.invalidate(user_id)
+
+    def stats(self) -> dict:
+        return {
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_report": asdict(self.last_report) if self.last_report else None,
+        }
@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from hippobox.core.redis import RedisManager
+from hippobox.core.settings import SETTINGS
+from hippobox.models.knowledge import KnowledgeModel, Knowledges
+from hippobox.rag.chunking import estimate_tokens
+from hippobox.rag.embedding import Embedding
+from hippobox.rag.qdrant import Qdrant
+from hippobox.rag.search_cache import SEARCH_CACHE
+from hippobox.services.knowledge import KnowledgeService
+
+log = logging.getLogger("knowledge")
+
+
+@dataclass
+class _Batch:
+    seq: int
+    knowledges: list[KnowledgeModel] = field(default_factory=list)
+    chunks: list[list[str]] = field(default_factory=list)
+    tokens: int = 0
+    vectors: list[list[float]] | None = None
+
+
+@dataclass
+class ReindexStats:
+    rows: int = 0
+    chunks: int = 0
+    tokens: int = 0
+    last_id: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return max(time.monotonic() - self.started_at, 1e-9)
+
+    def summary(self) -> str:
+        return (
+            f"{self.rows} rows, {self.chunks} chunks in {self.elapsed:.1f}s "
+            f"({self.rows / self.elapsed:.1f} rows/s, {self.tokens / self.elapsed:.0f} tokens/s)"
+        )
+
+
+class ReindexCheckpoint:
+    """
+    Id of the last knowledge entry whose points are fully written, kept in
+    Redis per (provider, model, dimensions, user, topic) scope. Entries are
+    streamed in id order, so a resumed run starts right after it.
+    """
+
+    def __init__(self, embedding: Embedding, user_id: int | None, topic: str | None):
+        provider = embedding.provider
+        self.key = f"reindex:{provider.name}:{provider.model}:{provider.dimension}:{user_id or '*'}:{topic or '*'}"
+
+    async def load(self) -> int:
+        try:
+            redis = await RedisManager.get_client()
+            return int(await redis.get(self.key) or 0)
+        except Exception as e:
+            log.warning(f"Reindex checkpoint lookup failed, starting from the beginning: {e}")
+            return 0
+
+    async def save(self, last_id: int):
+        try:
+            redis = await RedisManager.get_client()
+            await redis.set(self.key, last_id)
+        except Exception as e:
+            log.warning(f"Reindex checkpoint write failed: {e}")
+
+    async def clear(self):
+        try:
+            redis = await RedisManager.get_client()
+            await redis.delete(self.key)
+        except Exception as e:
+            log.warning(f"Reindex checkpoint cleanup failed: {e}")
+
+
+class Reindexer:
+    """
+    Rebuild the vector index from SQL in three concurrent stages joined by
+    bounded queues: a reader streaming `Knowledge` rows and packing their
+    chunks into batches of about `batch_tokens` tokens, embedding workers, and
+    upload workers writing points with `Qdrant.insert`. `targets` redirects
+    the points of a collection elsewhere, e.g. into a `Qdrant.create_build`.
+
+    Batches finish out of order, so the checkpoint only advances past a batch
+    once every batch before it is uploaded too.
+    """
+
+    def __init__(
+        self,
+        embedding: Embedding,
+        qdrant: Qdrant,
+        user_id: int | None = None,
+        topic: str | None = None,
+        batch_tokens: int = SETTINGS.REINDEX_BATCH_TOKENS,
+        read_batch_size: int = SETTINGS.REINDEX_READ_BATCH_SIZE,
+        embed_workers: int = SETTINGS.REINDEX_EMBED_WORKERS,
+        upload_workers: int = SETTINGS.REINDEX_UPLOAD_WORKERS,
+        queue_size: int = SETTINGS.REINDEX_QUEUE_SIZE,
+        progress_interval: float = 5.0,
+        targets: dict[str, str] | None = None,
+    ):
+        self.embedding = embedding
+        self.qdrant = qdrant
+        self.user_id = user_id
+        self.topic = topic
+        self.batch_tokens = batch_tokens
+        self.read_batch_size = read_batch_size
+        self.embed_workers = max(embed_workers, 1)
+        self.upload_workers = max(upload_workers, 1)
+        self.queue_size = max(queue_size, 1)
+        self.progress_interval = progress_interval
+        self.targets = targets or {}
+
+        self.checkpoint = ReindexCheckpoint(embedding, user_id, topic)
+        self.stats = ReindexStats()
+
+        # seq -> last knowledge id of every uploaded batch not yet checkpointed
+        self._done: dict[int, int] = {}
+        self._next_seq = 0
+        self._users: set[int] = set()
+        self._last_report = 0.0
+
+    async def run(self, resume: bool = True) -> ReindexStats:
+        after_id = await self.checkpoint.load() if resume else 0
+        if after_id:
+            log.info(f"Resuming reindex after knowledge id {after_id}")
+        self.stats = ReindexStats(last_id=after_id)
+        self._last_report = time.monotonic()
+
+        embed_queue: asyncio.Queue[_Batch | None] = asyncio.Queue(maxsize=self.queue_size)
+        upload_queue: asyncio.Queue[_Batch | None] = asyncio.Queue(maxsize=self.queue_size)
+
+        async def embed_stage():
+            async with asyncio.TaskGroup() as workers:
+                for _ in range(self.embed_workers):
+                    workers.create_task(self._embed(embed_queue, upload_queue))
+            for _ in range(self.upload_workers):
+                await upload_queue.put(None)
+
+        async with asyncio.TaskGroup() as stages:
+            stages.create_task(self._read(after_id, embed_queue))
+            stages.create_task(embed_stage())
+            for _ in range(self.upload_workers):
+                stages.create_task(self._upload(upload_queue))
+
+        for user_id in self._users:
+            await SEARCH_CACHE.invalidate(user_id)
+        await self.checkpoint.clear()
+
+        log.info(f"Reindex finished: {self.stats.summary()}")
+        return self.stats
+
+    async def _read(self, after_id: int, embed_queue: asyncio.Queue):
+        batch = _Batch(seq=0)
+        async for rows in Knowledges.stream_for_index(
+            self.user_id,
+            self.topic,
+            after_id=after_id,
+            batch_size=self.read_batch_size,
+        ):
+            for knowledge in rows:
+                chunks = KnowledgeService.chunk_content(knowledge)
+                tokens = sum(estimate_tokens(chunk) for chunk in chunks)
+
+                if batch.knowledges and batch.tokens + tokens > self.batch_tokens:
+                    await embed_queue.put(batch)
+                    batch = _Batch(seq=batch.seq + 1)
+
+                batch.knowledges.append(knowledge)
+                batch.chunks.append(chunks)
+                batch.tokens += tokens
+
+        if batch.knowledges:
+            await embed_queue.put(batch)
+        for _ in range(self.embed_workers):
+            await embed_queue.put(None)
+
+    async def _embed(self, embed_queue: asyncio.Queue, upload_queue: asyncio.Queue):
+        while (batch := await embed_queue.get()) is not None:
+            batch.vectors = await self.embedding.embed_batch([chunk for chunks in batch.chunks for chunk in chunks])
+            await upload_queue.put(batch)
+
+    async def _upload(self, upload_queue: asyncio.Queue):
+        while (batch := await upload_queue.get()) is not None:
+            items: defaultdict[str, list[dict]] = defaultdict(list)
+            chunk_counts: defaultdict[str, dict[int, int]] = defaultdict(dict)
+
+            offset = 0
+            for knowledge, chunks in zip(batch.knowledges, batch.chunks):
+                vectors = batch.vectors[offset : offset + len(chunks)]
+                offset += len(chunks)
+
+                collection = self.qdrant.collection_for(knowledge.user_id)
+                collection = self.targets.get(collection, collection)
+                items[collection].extend(KnowledgeService.to_points(knowledge, chunks, vectors))
+                chunk_counts[collection][knowledge.id] = len(chunks)
+
+            for collection, points in items.items():
+                await self.qdrant.insert(collection, points, wait=True)
+                await self.qdrant.delete_stale_chunks(collection, chunk_counts[collection])
+
+            await self._complete(batch)
+
+    async def _complete(self, batch: _Batch):
+        self._done[batch.seq] = batch.knowledges[-1].id
+        self._users.update(k.user_id for k in batch.knowledges)
+        self.stats.rows += len(batch.knowledges)
+        self.stats.chunks += len(batch.vectors)
+        self.stats.tokens += batch.tokens
+
+        advanced = False
+        while self._next_seq in self._done:
+            self.stats.last_id = self._done.pop(self._next_seq)
+            self._next_seq += 1
+            advanced = True
+        if advanced:
+            await self.checkpoint.save(self.stats.last_id)
+
+        if time.monotonic() - self._last_report >= self.progress_interval:
+            self._last_report = time.monotonic()
+            log.info(f"Reindex progress: {self.stats.summary()}, checkpoint at id {self.stats.last_id}")
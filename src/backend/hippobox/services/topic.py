@@ -6,6 +6,9 @@ from sqlalchemy.exc import IntegrityError
 from hippobox.errors.service import raise_exception_with_log
 from hippobox.errors.topic import TopicErrorCode, TopicException
 from hippobox.models.topic import TopicResponse, Topics, TopicUpdate
+from hippobox.rag.qdrant import Qdrant
+from hippobox.rag.search_cache import SEARCH_CACHE
+from hippobox.utils.knowledge_labels import DEFAULT_TOPIC_NAME
 
 log = logging.getLogger("topic")
 
@@ -15,6 +18,9 @@ def _normalize(value: str) -> str:
 
 
 class TopicService:
+    def __init__(self, qdrant: Qdrant | None = None):
+        self.qdrant = qdrant
+
     async def list_topics(self, user_id: int) -> list[TopicResponse]:
         try:
             return await Topics.list(user_id)
@@ -48,6 +54,9 @@ class TopicService:
 
         if updated is None:
             raise TopicException(TopicErrorCode.NOT_FOUND)
+
+        # Cached search results embed topic names.
+        await SEARCH_CACHE.invalidate(user_id)
         return updated
 
     async def delete_topic(self, user_id: int, topic_id: int) -> None:
@@ -66,6 +75,19 @@ class TopicService:
         if not success:
             raise TopicException(TopicErrorCode.DELETE_FAILED)
 
+        async with SEARCH_CACHE.invalidating(user_id):
+            if self.qdrant is not None:
+                try:
+                    default_topic = await Topics.get_by_name(user_id, DEFAULT_TOPIC_NAME)
+                    if default_topic is not None:
+                        await self.qdrant.set_payload(
+                            self.qdrant.collection_for(user_id),
+                            {"topic_id": default_topic.id},
+                            {"user_id": user_id, "topic_id": topic_id},
+                        )
+                except Exception as e:
+                    log.error(f"Failed to reassign vector topic for topic {topic_id}: {e}")
+
 
 def get_topic_service(request: Request) -> TopicService:
-    return TopicService()
+    return TopicService(request.app.state.QDRANT)
@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+
+# Settings are read at import time, so the test environment is set up before hippobox is imported:
+# a throwaway SQLite file, embedded (local mode) Qdrant, in-memory Redis and the offline hashing embedder.
+_TMP_DIR = tempfile.mkdtemp(prefix="hippobox-tests-")
+os.environ.update(
+    DB_DRIVER="sqlite+aiosqlite",
+    DB_NAME=os.path.join(_TMP_DIR, "hippobox.db"),
+    QDRANT_MODE="local",
+    QDRANT_PATH=os.path.join(_TMP_DIR, "qdrant"),
+    QDRANT_DEDICATED_TENANTS="",
+    REDIS_IN_MEMORY="true",
+    VDB_ENABLED="true",
+    EMBEDDING_PROVIDER="local",
+    EMBEDDING_LOCAL_DIM="64",
+    EMBEDDING_DIMENSIONS="",
+    EMBEDDING_CACHE_ENABLED="false",
+    EMBEDDING_BATCH_ENABLED="false",
+    SEARCH_CACHE_ENABLED="true",
+    RECONCILE_INTERVAL="0",
+)
+
+import pytest  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from hippobox.core.database import Base, dispose_db, get_engine, init_db  # noqa: E402
+from hippobox.core.redis import RedisManager  # noqa: E402
+from hippobox.models.user import User  # noqa: E402
+from hippobox.rag.embedding import Embedding  # noqa: E402
+from hippobox.rag.qdrant import Qdrant  # noqa: E402
+from hippobox.services.knowledge import KnowledgeService  # noqa: E402
+
+USER_ID = 1
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+async def db():
+    await init_db()
+    async with get_engine().begin() as conn:
+        await conn.execute(insert(User).values(id=USER_ID, email="user@example.com", name="user"))
+    yield
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await dispose_db()
+
+
+@pytest.fixture
+async def redis():
+    client = await RedisManager.get_client()
+    await client.flushall()
+    yield client
+    await client.flushall()
+    await RedisManager.close()
+
+
+@pytest.fixture
+async def qdrant():
+    client = Qdrant()
+    yield client
+    for collection in (await client.client.get_collections()).collections:
+        await client.client.delete_collection(collection.name)
+    await client.close()
+
+
+@pytest.fixture
+async def embedding():
+    client = Embedding()
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+async def service(db, redis, qdrant, embedding):
+    await qdrant.ensure_collection("knowledge", embedding.dimension)
+    return KnowledgeService(embedding, qdrant, vdb_enabled=True)
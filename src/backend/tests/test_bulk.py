@@ -0,0 +1,75 @@
+from hippobox.models.knowledge import BulkStatus, KnowledgeBulkUpdateItem, KnowledgeForm, Knowledges
+
+from .conftest import USER_ID
+
+
+async def _points(qdrant, knowledge_id: int) -> list:
+    return [p async for page in qdrant.scroll("knowledge", {"knowledge_id": knowledge_id}) for p in page]
+
+
+def _form(i: int, **fields) -> KnowledgeForm:
+    return KnowledgeForm(
+        **{"topic": "imports", "tags": ["bulk", f"tag{i % 3}"], "title": f"note {i}", "content": f"body {i}", **fields}
+    )
+
+
+async def test_bulk_create_indexes_every_entry(service):
+    response = await service.create_knowledge_bulk(USER_ID, [_form(i) for i in range(20)])
+
+    assert response.failed == 0
+    assert [r.status for r in response.results] == [BulkStatus.created] * 20
+    for result in response.results:
+        assert len(await _points(service.qdrant, result.id)) == 1
+
+    hits = await service.search(USER_ID, "body 7", limit=1)
+    assert hits[0].title == "note 7"
+
+
+async def test_bulk_create_reports_title_conflicts_per_item(service):
+    await service.create_knowledge(USER_ID, _form(0))
+
+    response = await service.create_knowledge_bulk(USER_ID, [_form(0), _form(1), _form(1)])
+
+    assert [r.status for r in response.results] == [BulkStatus.failed, BulkStatus.created, BulkStatus.failed]
+    assert response.results[0].error == "TITLE_EXISTS"
+    assert response.results[2].error == "TITLE_EXISTS"
+    assert (response.succeeded, response.failed) == (1, 2)
+
+
+async def test_bulk_update_reembeds_content_and_relabels_payloads(service):
+    created = (await service.create_knowledge_bulk(USER_ID, [_form(i) for i in range(3)])).results
+    ids = [r.id for r in created]
+
+    response = await service.update_knowledge_bulk(
+        USER_ID,
+        [
+            KnowledgeBulkUpdateItem(id=ids[0], content="completely different words"),
+            KnowledgeBulkUpdateItem(id=ids[1], title="renamed", tags=["fresh"]),
+            KnowledgeBulkUpdateItem(id=ids[2], title="note 2"),
+            KnowledgeBulkUpdateItem(id=999999, title="missing"),
+        ],
+    )
+
+    statuses = [r.status for r in response.results]
+    assert statuses == [BulkStatus.updated, BulkStatus.updated, BulkStatus.unchanged, BulkStatus.failed]
+    assert response.results[3].error == "NOT_FOUND"
+
+    hits = await service.search(USER_ID, "completely different words", limit=1)
+    assert hits[0].id == ids[0]
+
+    [point] = await _points(service.qdrant, ids[1])
+    assert point.payload["metadata"]["title"] == "renamed"
+    assert point.payload["metadata"]["tags"] == ["fresh"]
+
+
+async def test_bulk_delete_removes_rows_and_points(service):
+    created = (await service.create_knowledge_bulk(USER_ID, [_form(i) for i in range(3)])).results
+    ids = [r.id for r in created]
+
+    response = await service.delete_knowledge_bulk(USER_ID, [ids[0], ids[1], ids[0]])
+
+    assert [r.status for r in response.results] == [BulkStatus.deleted, BulkStatus.deleted, BulkStatus.failed]
+    assert response.results[2].error == "DUPLICATE_ID"
+    assert [k.id for k in await Knowledges.get_many(USER_ID, ids)] == [ids[2]]
+    assert await _points(service.qdrant, ids[0]) == []
+    assert len(await _points(service.qdrant, ids[2])) == 1
@@ -0,0 +1,45 @@
+from hippobox.rag.chunking import chunk_point_id
+
+
+async def _count(qdrant, name: str) -> int:
+    return (await qdrant.client.count(qdrant._full_name(name))).count
+
+
+def _items(count: int, dimension: int) -> list[dict]:
+    return [
+        {
+            "id": chunk_point_id(kid, 0),
+            "vector": [float(kid + 1)] + [0.0] * (dimension - 1),
+            "sparse": {kid: 1.0},
+            "payload": {"knowledge_id": kid, "chunk_index": 0, "tenant": "1"},
+        }
+        for kid in range(1, count + 1)
+    ]
+
+
+async def test_insert_writes_every_batch(qdrant):
+    await qdrant.ensure_collection("knowledge", 8)
+
+    await qdrant.insert("knowledge", _items(10, 8), batch_size=3, wait=True)
+
+    assert await _count(qdrant, "knowledge") == 10
+    written = [p.id async for page in qdrant.scroll("knowledge", page_size=4) for p in page]
+    assert sorted(written) == [chunk_point_id(kid, 0) for kid in range(1, 11)]
+
+
+async def test_insert_overwrites_existing_points(qdrant):
+    await qdrant.ensure_collection("knowledge", 8)
+    await qdrant.insert("knowledge", _items(4, 8), wait=True)
+
+    items = _items(4, 8)
+    for item in items:
+        item["payload"]["title"] = "updated"
+    await qdrant.insert("knowledge", items, batch_size=2, wait=True)
+
+    assert await _count(qdrant, "knowledge") == 4
+    async for page in qdrant.scroll("knowledge"):
+        assert all(p.payload["title"] == "updated" for p in page)
+
+
+async def test_insert_without_items_is_a_no_op(qdrant):
+    await qdrant.insert("knowledge", [])
@@ -0,0 +1,98 @@
+import pytest
+
+from hippobox.models.knowledge import KnowledgeForm, Knowledges
+from hippobox.services.reindex import ReindexCheckpoint, Reindexer
+
+from .conftest import USER_ID
+
+ENTRIES = 12
+
+
+async def _count(qdrant, knowledge_ids: list[int] | None = None) -> int:
+    query_filter = qdrant._build_filter({"knowledge_id": knowledge_ids} if knowledge_ids else None)
+    return (await qdrant.client.count(qdrant._full_name("knowledge"), count_filter=query_filter)).count
+
+
+@pytest.fixture
+async def entries(service) -> list[int]:
+    forms = [
+        KnowledgeForm(topic="notes", tags=["t"], title=f"note {i}", content=f"entry number {i} about reindexing")
+        for i in range(ENTRIES)
+    ]
+    return [k.id for k in await Knowledges.create_many(USER_ID, forms)]
+
+
+def _reindexer(service, **kwargs) -> Reindexer:
+    # One entry per batch, so the checkpoint can stop between any two entries.
+    options = {"batch_tokens": 1, "read_batch_size": 5, "embed_workers": 1, "upload_workers": 1}
+    return Reindexer(service.embedding, service.qdrant, **{**options, **kwargs})
+
+
+async def test_reindex_writes_a_point_per_chunk(service, entries):
+    stats = await _reindexer(service).run()
+
+    assert stats.rows == ENTRIES
+    assert stats.chunks == ENTRIES
+    assert await _count(service.qdrant) == ENTRIES
+    assert await ReindexCheckpoint(service.embedding, None, None).load() == 0
+
+
+async def test_reindex_resumes_after_the_checkpoint(service, entries):
+    checkpoint = ReindexCheckpoint(service.embedding, None, None)
+    await checkpoint.save(entries[4])
+
+    stats = await _reindexer(service).run(resume=True)
+
+    assert stats.rows == ENTRIES - 5
+    assert await _count(service.qdrant, entries[:5]) == 0
+    assert await _count(service.qdrant, entries[5:]) == ENTRIES - 5
+
+
+async def test_interrupted_reindex_continues_where_it_stopped(service, entries, monkeypatch):
+    insert = service.qdrant.insert
+    calls = 0
+
+    async def failing_insert(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls > 3:
+            raise RuntimeError("qdrant went away")
+        await insert(*args, **kwargs)
+
+    monkeypatch.setattr(service.qdrant, "insert", failing_insert)
+    with pytest.raises(ExceptionGroup):
+        await _reindexer(service).run()
+
+    checkpoint = ReindexCheckpoint(service.embedding, None, None)
+    assert await checkpoint.load() == entries[2]
+    assert await _count(service.qdrant) == 3
+
+    monkeypatch.setattr(service.qdrant, "insert", insert)
+    stats = await _reindexer(service).run(resume=True)
+
+    assert stats.rows == ENTRIES - 3
+    assert await _count(service.qdrant) == ENTRIES
+    assert await checkpoint.load() == 0
+
+
+async def test_recreate_builds_aside_and_swaps_the_alias(service, entries):
+    qdrant = service.qdrant
+    # Only part of the entries are live before the rebuild.
+    await ReindexCheckpoint(service.embedding, None, None).save(entries[4])
+    await _reindexer(service).run(resume=True)
+    live = ENTRIES - 5
+
+    for _ in range(2):
+        build = await qdrant.create_build("knowledge", service.embedding.dimension)
+        await _reindexer(service, targets={"knowledge": build}).run(resume=False)
+
+        # The current collection keeps serving until the swap.
+        assert await _count(qdrant) == live
+        assert await service.search(USER_ID, "entry number 7 about reindexing")
+        assert (await qdrant.client.count(qdrant._full_name(build))).count == ENTRIES
+
+        await qdrant.swap_alias("knowledge", build)
+        assert await _count(qdrant) == ENTRIES
+        assert await qdrant.list_collections() == ["knowledge"]
+        assert [c.name for c in (await qdrant.client.get_collections()).collections] == [qdrant._full_name(build)]
+        live = ENTRIES
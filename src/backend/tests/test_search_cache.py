@@ -0,0 +1,47 @@
+from hippobox.models.knowledge import KnowledgeForm, Knowledges, KnowledgeUpdate
+
+from .conftest import USER_ID
+
+
+async def test_search_overlapping_an_update_is_not_served_from_cache(service, monkeypatch):
+    created = await service.create_knowledge(
+        USER_ID, KnowledgeForm(topic="notes", tags=["cache"], title="before", content="cached search body")
+    )
+    get_many = Knowledges.get_many
+
+    async def get_many_then_update(user_id, ids):
+        # The search has hydrated the old row; the update lands before it stores its results.
+        stale = await get_many(user_id, ids)
+        monkeypatch.setattr(Knowledges, "get_many", get_many)
+        await service.update_knowledge(USER_ID, created.id, KnowledgeUpdate(title="after"))
+        return stale
+
+    monkeypatch.setattr(Knowledges, "get_many", get_many_then_update)
+    [hit] = await service.search(USER_ID, "cached search body")
+    assert hit.title == "before"
+
+    [hit] = await service.search(USER_ID, "cached search body")
+    assert hit.title == "after"
+
+
+async def test_search_results_are_cached_until_a_write(service, monkeypatch):
+    created = await service.create_knowledge(
+        USER_ID, KnowledgeForm(topic="notes", tags=["cache"], title="first", content="repeated search body")
+    )
+    await service.search(USER_ID, "repeated search body")
+
+    calls = 0
+    search = service.qdrant.search
+
+    async def counting_search(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        return await search(*args, **kwargs)
+
+    monkeypatch.setattr(service.qdrant, "search", counting_search)
+    await service.search(USER_ID, "repeated search body")
+    assert calls == 0
+
+    await service.update_knowledge(USER_ID, created.id, KnowledgeUpdate(title="second"))
+    [hit] = await service.search(USER_ID, "repeated search body")
+    assert (calls, hit.title) == (1, "second")
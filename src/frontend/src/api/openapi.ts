@@ -226,6 +226,57 @@ export interface paths {
          */
         post: operations['create_knowledge'];
     };
+    '/api/v1/knowledge/bulk': {
+        /**
+         * Update Knowledge Bulk
+         * @description Update many knowledge entries in one request.
+         *
+         * Each item holds the `id` of the entry plus any of the updatable fields
+         * (title, content, topic, tags); omitted fields are left as they are.
+         *
+         * ### Returns:
+         *
+         *     One result per item, in request order: "updated", "unchanged" or
+         *     "failed" with an error code (NOT_FOUND, DUPLICATE_ID, TITLE_EXISTS).
+         *
+         * Changes are written in one SQL transaction; only entries whose content
+         * changed are re-embedded.
+         */
+        put: operations['update_knowledge_bulk'];
+        /**
+         * Create Knowledge Bulk
+         * @description Create many knowledge entries in one request.
+         *
+         * Each item takes the same fields as a single create (topic, tags,
+         * title, content). Prefer this over repeated single creates when
+         * importing notes.
+         *
+         * ### Returns:
+         *
+         *     One result per item, in request order: "created" with the new
+         *     entry, or "failed" with an error code (e.g. TITLE_EXISTS when the
+         *     title is taken or repeated in the request).
+         *
+         * All entries are written in one SQL transaction and embedded and
+         * indexed together.
+         */
+        post: operations['create_knowledge_bulk'];
+    };
+    '/api/v1/knowledge/bulk/delete': {
+        /**
+         * Delete Knowledge Bulk
+         * @description Delete many knowledge entries in one request.
+         *
+         * ### Returns:
+         *
+         *     One result per id, in request order: "deleted" or "failed" with an
+         *     error code (NOT_FOUND, DUPLICATE_ID).
+         *
+         * Removes the SQL rows in one transaction and their vectors from the
+         * Qdrant index in one call.
+         */
+        post: operations['delete_knowledge_bulk'];
+    };
     '/api/v1/knowledge/list': {
         /**
          * Get Knowledge List
@@ -239,6 +290,23 @@ export interface paths {
          */
         get: operations['get_knowledge_list'];
     };
+    '/api/v1/knowledge/export': {
+        /**
+         * Export Knowledge
+         * @description Download all of the user's knowledge entries as NDJSON, one entry per line.
+         *
+         * ### Args:
+         *
+         *     topic (str | None = None): Only export entries under this topic.
+         *     include_vectors (bool = False): Add the stored chunk vectors of
+         *         each entry under "chunks".
+         *     gzip (bool = False): Compress the download with gzip.
+         *
+         * The export is streamed from a database cursor, so it can be used on
+         * knowledge bases of any size.
+         */
+        get: operations['export_knowledge_api_v1_knowledge_export_get'];
+    };
     '/api/v1/knowledge/{knowledge_id}': {
         /**
          * Get Knowledge
@@ -469,6 +537,115 @@ export interface components {
             /** Detail */
             detail?: components['schemas']['ValidationError'][];
         };
+        /**
+         * BulkStatus
+         * @enum {string}
+         */
+        BulkStatus: 'created' | 'updated' | 'unchanged' | 'deleted' | 'failed';
+        /** KnowledgeBulkCreate */
+        KnowledgeBulkCreate: {
+            /**
+             * Items
+             * @description Entries to create
+             */
+            items: components['schemas']['KnowledgeForm'][];
+        };
+        /** KnowledgeBulkDelete */
+        KnowledgeBulkDelete: {
+            /**
+             * Ids
+             * @description Identifiers of the entries to delete
+             */
+            ids: number[];
+        };
+        /** KnowledgeBulkItemResult */
+        KnowledgeBulkItemResult: {
+            /**
+             * Index
+             * @description Position of the item in the request
+             */
+            index: number;
+            /**
+             * Id
+             * @description Identifier of the affected entry, if any
+             */
+            id?: number | null;
+            /** @description Outcome for this item */
+            status: components['schemas']['BulkStatus'];
+            /**
+             * Error
+             * @description Error code when the item failed
+             */
+            error?: string | null;
+            /**
+             * Message
+             * @description Error message when the item failed
+             */
+            message?: string | null;
+            /** @description The entry after a create or update */
+            knowledge?: components['schemas']['KnowledgeResponse'] | null;
+        };
+        /** KnowledgeBulkResponse */
+        KnowledgeBulkResponse: {
+            /**
+             * Results
+             * @description One result per request item
+             */
+            results?: components['schemas']['KnowledgeBulkItemResult'][];
+            /**
+             * Succeeded
+             * @description Number of items that did not fail
+             * @default 0
+             */
+            succeeded?: number;
+            /**
+             * Failed
+             * @description Number of items that failed
+             * @default 0
+             */
+            failed?: number;
+        };
+        /** KnowledgeBulkUpdate */
+        KnowledgeBulkUpdate: {
+            /**
+             * Items
+             * @description Entries to update
+             */
+            items: components['schemas']['KnowledgeBulkUpdateItem'][];
+        };
+        /** KnowledgeBulkUpdateItem */
+        KnowledgeBulkUpdateItem: {
+            /**
+             * Topic
+             * @description Updated topic, if changed
+             */
+            topic?: string | null;
+            /**
+             * Tags
+             * @description Updated keyword list, if changed
+             */
+            tags?: string[] | null;
+            /**
+             * Title
+             * @description Updated title, if changed
+             */
+            title?: string | null;
+            /**
+             * Content
+             * @description Updated content text, if changed
+             */
+            content?: string | null;
+            /**
+             * Id
+             * @description Identifier of the entry to update
+             */
+            id: number;
+        };
+        /**
+         * ListView
+         * @enum {string}
+         */
+        ListView: 'full' | 'summary';
         /** KnowledgeForm */
         KnowledgeForm: {
             /**
@@ -537,6 +714,77 @@ export interface components {
              */
             updated_at: string;
         };
+        /** KnowledgePage */
+        KnowledgePage: {
+            /**
+             * Items
+             * @description Entries of this page, newest first
+             */
+            items?: components['schemas']['KnowledgeResponse'][];
+            /**
+             * Next Cursor
+             * @description Pass as `cursor` to fetch the next page; null on the last page
+             */
+            next_cursor?: string | null;
+        };
+        /** KnowledgeSummary */
+        KnowledgeSummary: {
+            /**
+             * Id
+             * @description Unique identifier of the knowledge entry
+             */
+            id: number;
+            /**
+             * User Id
+             * @description Owner's user identifier
+             */
+            user_id: number;
+            /**
+             * Topic
+             * @description Topic or category of this knowledge
+             */
+            topic: string;
+            /**
+             * Tags
+             * @description Keywords associated with this knowledge
+             */
+            tags?: string[];
+            /**
+             * Title
+             * @description Title summarizing the content
+             */
+            title: string;
+            /**
+             * Excerpt
+             * @description Short plain-text start of the content
+             */
+            excerpt: string;
+            /**
+             * Created At
+             * Format: date-time
+             * @description Timestamp when the entry was created
+             */
+            created_at: string;
+            /**
+             * Updated At
+             * Format: date-time
+             * @description Timestamp when the entry was last updated
+             */
+            updated_at: string;
+        };
+        /** KnowledgeSummaryPage */
+        KnowledgeSummaryPage: {
+            /**
+             * Items
+             * @description Entries of this page, newest first
+             */
+            items?: components['schemas']['KnowledgeSummary'][];
+            /**
+             * Next Cursor
+             * @description Pass as `cursor` to fetch the next page; null on the last page
+             */
+            next_cursor?: string | null;
+        };
         /** KnowledgeUpdate */
         KnowledgeUpdate: {
             /**
@@ -1333,22 +1581,190 @@ export interface operations {
             };
         };
     };
+    /**
+     * Create Knowledge Bulk
+     * @description Create many knowledge entries in one request.
+     *
+     * Each item takes the same fields as a single create (topic, tags,
+     * title, content). Prefer this over repeated single creates when
+     * importing notes.
+     *
+     * ### Returns:
+     *
+     *     One result per item, in request order: "created" with the new
+     *     entry, or "failed" with an error code (e.g. TITLE_EXISTS when the
+     *     title is taken or repeated in the request).
+     *
+     * All entries are written in one SQL transaction and embedded and
+     * indexed together.
+     */
+    create_knowledge_bulk: {
+        requestBody: {
+            content: {
+                'application/json': components['schemas']['KnowledgeBulkCreate'];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                content: {
+                    'application/json': components['schemas']['KnowledgeBulkResponse'];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                content: {
+                    'application/json': components['schemas']['HTTPValidationError'];
+                };
+            };
+        };
+    };
+    /**
+     * Update Knowledge Bulk
+     * @description Update many knowledge entries in one request.
+     *
+     * Each item holds the `id` of the entry plus any of the updatable fields
+     * (title, content, topic, tags); omitted fields are left as they are.
+     *
+     * ### Returns:
+     *
+     *     One result per item, in request order: "updated", "unchanged" or
+     *     "failed" with an error code (NOT_FOUND, DUPLICATE_ID, TITLE_EXISTS).
+     *
+     * Changes are written in one SQL transaction; only entries whose content
+     * changed are re-embedded.
+     */
+    update_knowledge_bulk: {
+        requestBody: {
+            content: {
+                'application/json': components['schemas']['KnowledgeBulkUpdate'];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                content: {
+                    'application/json': components['schemas']['KnowledgeBulkResponse'];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                content: {
+                    'application/json': components['schemas']['HTTPValidationError'];
+                };
+            };
+        };
+    };
+    /**
+     * Delete Knowledge Bulk
+     * @description Delete many knowledge entries in one request.
+     *
+     * ### Returns:
+     *
+     *     One result per id, in request order: "deleted" or "failed" with an
+     *     error code (NOT_FOUND, DUPLICATE_ID).
+     *
+     * Removes the SQL rows in one transaction and their vectors from the
+     * Qdrant index in one call.
+     */
+    delete_knowledge_bulk: {
+        requestBody: {
+            content: {
+                'application/json': components['schemas']['KnowledgeBulkDelete'];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                content: {
+                    'application/json': components['schemas']['KnowledgeBulkResponse'];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                content: {
+                    'application/json': components['schemas']['HTTPValidationError'];
+                };
+            };
+        };
+    };
     /**
      * Get Knowledge List
-     * @description Retrieve all stored knowledge entries.
+     * @description Retrieve stored knowledge entries, one page at a time.
+     *
+     * ### Args:
+     *
+     *     limit (int = 50): Entries per page (at most 200).
+     *     cursor (str | None = None): `next_cursor` of the previous page.
+     *     view (ListView = full): "full" returns the whole content, "summary"
+     *         only id, title, topic, tags, timestamps and a short excerpt
+     *         (much smaller; prefer it for browsing).
      *
      * ### Returns:
      *
-     *     List of all knowledge entries sorted by creation date.
+     *     Page of knowledge entries, most recently updated first, and the
+     *     cursor of the next page (null on the last page).
      *
      * Useful for browsing or building UI item lists.
      */
     get_knowledge_list: {
+        parameters: {
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+                view?: components['schemas']['ListView'];
+            };
+        };
         responses: {
             /** @description Successful Response */
             200: {
                 content: {
-                    'application/json': components['schemas']['KnowledgeResponse'][];
+                    'application/json':
+                        | components['schemas']['KnowledgePage']
+                        | components['schemas']['KnowledgeSummaryPage'];
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                content: {
+                    'application/json': components['schemas']['HTTPValidationError'];
+                };
+            };
+        };
+    };
+    /**
+     * Export Knowledge
+     * @description Download all of the user's knowledge entries as NDJSON, one entry per line.
+     *
+     * ### Args:
+     *
+     *     topic (str | None = None): Only export entries under this topic.
+     *     include_vectors (bool = False): Add the stored chunk vectors of
+     *         each entry under "chunks".
+     *     gzip (bool = False): Compress the download with gzip.
+     *
+     * The export is streamed from a database cursor, so it can be used on
+     * knowledge bases of any size.
+     */
+    export_knowledge_api_v1_knowledge_export_get: {
+        parameters: {
+            query?: {
+                topic?: string | null;
+                include_vectors?: boolean;
+                gzip?: boolean;
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                content: {
+                    'application/json': unknown;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                content: {
+                    'application/json': components['schemas']['HTTPValidationError'];
                 };
             };
         };
@@ -1486,8 +1902,9 @@ export interface operations {
     };
     /**
      * Get By Topic
-     * @description Retrieve all knowledge entries under a specific topic.
-     * Topics group entries into categories.
+     * @description Retrieve knowledge entries under a specific topic, one page at a time.
+     * Topics group entries into categories. Paginated like `/list`, with the
+     * same `view` option.
      *
      * Examples:
      * - 'docker'
@@ -1496,6 +1913,11 @@ export interface operations {
      */
     get_knowledge_by_topic: {
         parameters: {
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+                view?: components['schemas']['ListView'];
+            };
             path: {
                 topic: string;
             };
@@ -1504,7 +1926,9 @@ export interface operations {
             /** @description Successful Response */
             200: {
                 content: {
-                    'application/json': components['schemas']['KnowledgeResponse'][];
+                    'application/json':
+                        | components['schemas']['KnowledgePage']
+                        | components['schemas']['KnowledgeSummaryPage'];
                 };
             };
             /** @description Validation Error */
@@ -1517,8 +1941,9 @@ export interface operations {
     };
     /**
      * Get By Tag
-     * @description Retrieve all knowledge entries associated with a given tag.
-     * Tags represent keyword-level grouping, separate from topics.
+     * @description Retrieve knowledge entries associated with a given tag, one page at a time.
+     * Tags represent keyword-level grouping, separate from topics. Paginated
+     * like `/list`, with the same `view` option.
      *
      * Examples:
      * - 'server'
@@ -1527,6 +1952,11 @@ export interface operations {
      */
     get_knowledge_by_tag: {
         parameters: {
+            query?: {
+                limit?: number;
+                cursor?: string | null;
+                view?: components['schemas']['ListView'];
+            };
             path: {
                 tag: string;
             };
@@ -1535,7 +1965,9 @@ export interface operations {
             /** @description Successful Response */
             200: {
                 content: {
-                    'application/json': components['schemas']['KnowledgeResponse'][];
+                    'application/json':
+                        | components['schemas']['KnowledgePage']
+                        | components['schemas']['KnowledgeSummaryPage'];
                 };
             };
             /** @description Validation Error */
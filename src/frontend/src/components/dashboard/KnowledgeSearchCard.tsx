@@ -7,7 +7,7 @@ import { marked } from 'marked';
 import { useKnowledgeList } from '../../context/KnowledgeListContext';
 import { useTheme } from '../../context/ThemeContext';
 import { apiClient } from '../../api/client';
-import type { KnowledgeResponse } from '../../hooks/useKnowledge';
+import type { KnowledgeResponse, KnowledgeSummary } from '../../hooks/useKnowledge';
 import { useVdbEnabled } from '../../hooks/useFeatures';
 import { Button } from '../Button';
 import { Dropdown } from '../Dropdown';
@@ -64,6 +64,12 @@ const truncateText = (value: string, maxLength: number) => {
 };
 
 const normalizeTagValue = (value: string) => value.replace(/^#+/, '').trim();
+
+// Search hits carry the full content; list entries only their excerpt.
+type ResultItem = KnowledgeResponse | KnowledgeSummary;
+
+const bodyText = (item: ResultItem) => ('content' in item ? item.content : item.excerpt);
+
 type TopicRow = {
     key: string;
     label: string;
@@ -142,7 +148,7 @@ export function KnowledgeSearchCard({ inputId }: KnowledgeSearchCardProps) {
         });
     }, [knowledgeList]);
 
-    const filterByActiveTopic = (items: KnowledgeResponse[]) => {
+    const filterByActiveTopic = (items: ResultItem[]) => {
         if (!activeTopic) return items;
         return items.filter((item) => {
             const raw = item.topic?.trim() ?? '';
@@ -154,7 +160,7 @@ export function KnowledgeSearchCard({ inputId }: KnowledgeSearchCardProps) {
         });
     };
 
-    const baseResults = useMemo(() => {
+    const baseResults = useMemo<ResultItem[]>(() => {
         return isHyperActive ? hyperResults : defaultResults;
     }, [defaultResults, hyperResults, isHyperActive]);
 
@@ -229,7 +235,7 @@ export function KnowledgeSearchCard({ inputId }: KnowledgeSearchCardProps) {
                     const fields: string[] = [];
                     if (activeFilters.has('title')) fields.push(item.title);
                     if (activeFilters.has('topic')) fields.push(item.topic);
-                    if (activeFilters.has('content')) fields.push(item.content);
+                    if (activeFilters.has('content')) fields.push(bodyText(item));
                     if (activeFilters.has('tags')) fields.push(...(item.tags ?? []));
                     if (activeFilters.has('created_at')) fields.push(item.created_at ?? '');
                     if (activeFilters.has('updated_at')) fields.push(item.updated_at ?? '');
@@ -245,7 +251,7 @@ export function KnowledgeSearchCard({ inputId }: KnowledgeSearchCardProps) {
     const previewById = useMemo(() => {
         const map = new Map<number, string>();
         displayResults.forEach((item) => {
-            const plain = toPlainText(item.content ?? '');
+            const plain = toPlainText(bodyText(item));
             map.set(item.id, truncateText(plain, PREVIEW_LIMIT));
         });
         return map;
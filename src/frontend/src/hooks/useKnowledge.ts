@@ -12,7 +12,9 @@ import type { components } from '../api/openapi';
 type KnowledgeForm = components['schemas']['KnowledgeForm'];
 type KnowledgeUpdate = components['schemas']['KnowledgeUpdate'];
 export type KnowledgeResponse = components['schemas']['KnowledgeResponse'];
-type KnowledgeListOptions = Omit<UseQueryOptions<KnowledgeResponse[]>, 'queryKey' | 'queryFn'>;
+export type KnowledgeSummary = components['schemas']['KnowledgeSummary'];
+type KnowledgeSummaryPage = components['schemas']['KnowledgeSummaryPage'];
+type KnowledgeListOptions = Omit<UseQueryOptions<KnowledgeSummary[]>, 'queryKey' | 'queryFn'>;
 type KnowledgeDetailOptions = Omit<UseQueryOptions<KnowledgeResponse>, 'queryKey' | 'queryFn'>;
 
 const unwrap = async <T>(promise: Promise<{ data?: T; error?: unknown }>) => {
@@ -21,6 +23,18 @@ const unwrap = async <T>(promise: Promise<{ data?: T; error?: unknown }>) => {
     return data as T;
 };
 
+// Mirrors `make_excerpt` on the server, so list entries can be patched from a full entry.
+const EXCERPT_LENGTH = 200;
+
+const toSummary = ({ content, ...entry }: KnowledgeResponse): KnowledgeSummary => {
+    const text = content.split(/\s+/).filter(Boolean).join(' ');
+    if (text.length <= EXCERPT_LENGTH) return { ...entry, excerpt: text };
+    const head = text.slice(0, EXCERPT_LENGTH);
+    const space = head.lastIndexOf(' ');
+    const cut = space > 0 ? head.slice(0, space) : head;
+    return { ...entry, excerpt: `${cut}…` };
+};
+
 export const useCreateKnowledgeMutation = (
     options?: UseMutationOptions<KnowledgeResponse, unknown, KnowledgeForm>,
 ) => {
@@ -28,10 +42,10 @@ export const useCreateKnowledgeMutation = (
     return useMutation({
         mutationFn: (body) => unwrap(apiClient.POST('/api/v1/knowledge/', { body })),
         onSuccess: (data, variables, onMutateResult, context) => {
-            queryClient.setQueryData<KnowledgeResponse[]>(['knowledge', 'list'], (prev) => {
-                if (!prev) return [data];
+            queryClient.setQueryData<KnowledgeSummary[]>(['knowledge', 'list'], (prev) => {
+                if (!prev) return [toSummary(data)];
                 const next = prev.filter((item) => item.id !== data.id);
-                return [data, ...next];
+                return [toSummary(data), ...next];
             });
             queryClient.setQueryData<KnowledgeResponse>(['knowledge', 'detail', data.id], data);
             queryClient.invalidateQueries({ queryKey: ['knowledge', 'list'] });
@@ -42,10 +56,30 @@ export const useCreateKnowledgeMutation = (
     });
 };
 
+// Largest page the list endpoint serves.
+const LIST_PAGE_SIZE = 200;
+
+// The list only needs titles, labels, dates and an excerpt; pages open the full entry by id.
+const fetchKnowledgeList = async () => {
+    const items: KnowledgeSummary[] = [];
+    let cursor: string | null | undefined;
+    do {
+        // The summary view always returns a KnowledgeSummaryPage.
+        const page = (await unwrap(
+            apiClient.GET('/api/v1/knowledge/list', {
+                params: { query: { limit: LIST_PAGE_SIZE, cursor, view: 'summary' } },
+            }),
+        )) as KnowledgeSummaryPage;
+        items.push(...(page.items ?? []));
+        cursor = page.next_cursor;
+    } while (cursor);
+    return items;
+};
+
 export const useKnowledgeListQuery = (options?: KnowledgeListOptions) =>
     useQuery({
         queryKey: ['knowledge', 'list'],
-        queryFn: () => unwrap(apiClient.GET('/api/v1/knowledge/list')),
+        queryFn: fetchKnowledgeList,
         staleTime: 1000 * 30,
         ...options,
     });
@@ -87,9 +121,9 @@ export const useUpdateKnowledgeMutation = (
                 }),
             ),
         onSuccess: (data, variables, onMutateResult, context) => {
-            queryClient.setQueryData<KnowledgeResponse[]>(['knowledge', 'list'], (prev) => {
+            queryClient.setQueryData<KnowledgeSummary[]>(['knowledge', 'list'], (prev) => {
                 if (!prev) return prev;
-                return prev.map((item) => (item.id === data.id ? data : item));
+                return prev.map((item) => (item.id === data.id ? toSummary(data) : item));
             });
             queryClient.setQueryData<KnowledgeResponse>(['knowledge', 'detail', data.id], data);
             queryClient.invalidateQueries({ queryKey: ['knowledge', 'list'] });
@@ -117,7 +151,7 @@ export const useDeleteKnowledgeMutation = (
             );
         },
         onSuccess: (_data, variables, onMutateResult, context) => {
-            queryClient.setQueryData<KnowledgeResponse[]>(['knowledge', 'list'], (prev) => {
+            queryClient.setQueryData<KnowledgeSummary[]>(['knowledge', 'list'], (prev) => {
                 if (!prev) return prev;
                 return prev.filter((item) => item.id !== variables.knowledgeId);
             });
@@ -8,7 +8,6 @@ import { Card } from '../components/Card';
 import { ConfirmDialog } from '../components/ConfirmDialog';
 import { ErrorMessage } from '../components/ErrorMessage';
 import { MarkdownContent } from '../components/MarkdownContent';
-import { useKnowledgeList } from '../context/KnowledgeListContext';
 import { useDeleteKnowledgeMutation, useKnowledgeQuery } from '../hooks/useKnowledge';
 import { LoadingPage } from './LoadingPage';
 import { extractHeadings } from '../utils/markdown';
@@ -43,14 +42,9 @@ export function KnowledgeContentPage() {
     const { t } = useTranslation();
     const { knowledgeId } = useParams();
     const navigate = useNavigate();
-    const { knowledge = [], isPending, isError } = useKnowledgeList();
     const [deleteError, setDeleteError] = useState('');
     const [showDeleteDialog, setShowDeleteDialog] = useState(false);
 
-    const listEntry = useMemo(() => {
-        if (!knowledgeId) return undefined;
-        return knowledge.find((item) => String(item.id) === knowledgeId);
-    }, [knowledge, knowledgeId]);
     const numericKnowledgeId = knowledgeId ? Number(knowledgeId) : undefined;
     const {
         data: directEntry,
@@ -61,9 +55,10 @@ export function KnowledgeContentPage() {
         refetchOnMount: 'always',
         staleTime: 0,
     });
-    const entry = directEntry ?? listEntry;
-    const isLoading = (isPending || isDirectPending) && !entry;
-    const hasError = (isError || isDirectError) && !entry;
+    // List entries are summaries without content, so the page always shows the fetched entry.
+    const entry = directEntry;
+    const isLoading = isDirectPending && !entry;
+    const hasError = isDirectError && !entry;
     const headings = useMemo(() => extractHeadings(entry?.content ?? ''), [entry?.content]);
     const showToc = headings.length > 0;
     const { mutate: deleteKnowledge, isPending: isDeletePending } = useDeleteKnowledgeMutation({
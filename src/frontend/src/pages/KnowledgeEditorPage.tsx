@@ -69,16 +69,12 @@ export function KnowledgeEditorPage() {
     const { knowledgeId } = useParams();
     const navigate = useNavigate();
     const isEditMode = Boolean(knowledgeId);
-    const { knowledge = [], isPending, isError } = useKnowledgeList();
+    const { knowledge = [] } = useKnowledgeList();
     const initializedRef = useRef(false);
     const loadedIdRef = useRef<string | null>(null);
     const loadedRevisionRef = useRef<string | null>(null);
     const isDirtyRef = useRef(false);
 
-    const listEntry = useMemo(() => {
-        if (!knowledgeId) return undefined;
-        return knowledge.find((item) => String(item.id) === knowledgeId);
-    }, [knowledge, knowledgeId]);
     const numericKnowledgeId = knowledgeId ? Number(knowledgeId) : undefined;
     const {
         data: directEntry,
@@ -89,7 +85,8 @@ export function KnowledgeEditorPage() {
         refetchOnMount: 'always',
         staleTime: 0,
     });
-    const entry = directEntry ?? listEntry;
+    // List entries are summaries without content, so the form is filled from the fetched entry.
+    const entry = directEntry;
     const entryRevision = useMemo(() => {
         if (!entry) return null;
         const stamp = entry.updated_at ?? entry.created_at ?? '';
@@ -353,8 +350,8 @@ export function KnowledgeEditorPage() {
         }
     };
 
-    const isLoadingEntry = isEditMode && (isDirectPending || (isPending && !entry));
-    const isLoadError = isEditMode && (isDirectError || (isError && !entry));
+    const isLoadingEntry = isEditMode && isDirectPending;
+    const isLoadError = isEditMode && isDirectError;
 
     if (isLoadingEntry) {
         return <LoadingPage variant="content" />;